@@ -0,0 +1,74 @@
+"""
+Compares accumulating and parsing a multi-packet principal response using the bytearray backed ``Buffer`` against
+the previous implementation, which appended to immutable ``bytes``.
+
+Usage (with the package installed, e.g. via ``pip install -e .``):
+    python benchmarks/buffer_benchmark.py [entries ...]
+"""
+import struct
+import sys
+import timeit
+from typing import List
+
+from pyq3serverlist import PrincipalServer
+from pyq3serverlist.buffer import Buffer
+
+
+class BytesBuffer(Buffer):
+    """
+    Previous ``Buffer`` behaviour: copy all data on every write and every read.
+    """
+    def __init__(self, data: bytes = b''):
+        super().__init__(bytes(data))
+
+    def read(self, length: int = 1) -> bytes:
+        return bytes(super().read(length))
+
+    def write(self, v: bytes) -> None:
+        self.data = self.data + bytes(v)
+        self.view = memoryview(self.data)
+        self.length += len(v)
+
+
+def build_packets(entries: int, per_packet: int = 200) -> List[bytes]:
+    # 1400 byte packets hold 200 entries of 7 bytes each (delimiter, ip and port)
+    packets = []
+    for start in range(0, entries, per_packet):
+        body = b''.join(
+            b'\\' + struct.pack('>IH', 0x0a000000 + i, 27960 + i % 100)
+            for i in range(start, min(entries, start + per_packet))
+        )
+        packets.append(body)
+    return packets
+
+
+def accumulate(cls: type, packets: List[bytes]) -> Buffer:
+    response = cls()
+    for packet in packets:
+        response.write(memoryview(packet))
+    return response
+
+
+def accumulate_and_parse(cls: type, packets: List[bytes]) -> int:
+    return len(PrincipalServer.parse_response(accumulate(cls, packets), b'\\'))
+
+
+def measure(func, repeat: int = 5) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+
+def main(sizes: List[int]) -> None:
+    for entries in sizes:
+        packets = build_packets(entries)
+        for cls in (BytesBuffer, Buffer):
+            assert accumulate_and_parse(cls, packets) == entries
+            write = measure(lambda: accumulate(cls, packets))
+            total = measure(lambda: accumulate_and_parse(cls, packets))
+            print(
+                f'{cls.__name__:<12} {entries:>7} entries {len(packets):>5} packets: '
+                f'write {write:8.2f} ms, write + parse {total:8.2f} ms'
+            )
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [1000, 10000, 50000])
@@ -0,0 +1,44 @@
+"""
+Measures the per-packet overhead of payload logging in ``Connection`` with debug logging disabled, comparing the
+previous eagerly formatted f-string against the guarded packet log.
+
+Usage (with the package installed, e.g. via ``pip install -e .``):
+    python benchmarks/logging_benchmark.py [packet sizes ...]
+"""
+import logging
+import sys
+import timeit
+from typing import List
+
+from pyq3serverlist.logger import logger, packet_logger, format_packet
+
+
+def eager(data: bytes) -> None:
+    logger.debug(f'Received data: {data.hex(" ")}')
+
+
+def guarded(data: bytes) -> None:
+    if packet_logger.isEnabledFor(logging.DEBUG):
+        packet_logger.debug('Received data from %s:%d: %s', '127.0.0.1', 27960, format_packet(data))
+
+
+def baseline(data: bytes) -> None:
+    pass
+
+
+def measure(func, data: bytes, number: int) -> float:
+    # Nanoseconds per call
+    return min(timeit.repeat(lambda: func(data), number=number, repeat=5)) / number * 1e9
+
+
+def main(sizes: List[int]) -> None:
+    logging.basicConfig(level=logging.WARNING)
+    for size in sizes:
+        data = bytes(range(256)) * (size // 256) + bytes(size % 256)
+        number = max(100, 2_000_000 // max(1, size))
+        results = {func.__name__: measure(func, data, number) for func in (baseline, eager, guarded)}
+        print(f'{size:>6} byte packets: ' + ', '.join(f'{name} {ns:10.0f} ns' for name, ns in results.items()))
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or [64, 1400, 65507])
@@ -0,0 +1,93 @@
+"""
+Compares the single-pass status response parser against the previous implementation, which read every key, value
+and player field with ``Buffer.read_string``.
+
+Usage (with the package installed, e.g. via ``pip install -e .``):
+    python benchmarks/status_benchmark.py
+"""
+import random
+import timeit
+from typing import Callable, List, Tuple
+
+from pyq3serverlist import Server
+from pyq3serverlist.buffer import Buffer
+
+
+class LegacyServer(Server):
+    """
+    Previous status response parsing based on ``Buffer.read_string``.
+    """
+    __slots__ = ()
+
+    def parse_response(self, buffer: Buffer, strip_colors: bool) -> dict:
+        self.has_valid_response_header(buffer)
+        self.has_valid_response_body(buffer)
+
+        i = 0
+        keys = []
+        values = []
+        while buffer.peek(1) == b'\\':
+            buffer.skip(1)
+            element = buffer.read_string([b'\\', b'\n'], strip_colors=strip_colors)
+            if i % 2 == 0:
+                keys.append(element)
+            else:
+                values.append(element)
+
+            i += 1
+
+        players = []
+        while buffer.peek(1) == b'\n' and buffer.has(8):
+            frags = int(buffer.read_string(b' ', consume_sep=True, strip_colors=strip_colors))
+            ping = int(buffer.read_string(b' ', consume_sep=True, strip_colors=strip_colors))
+            buffer.skip(1)
+            name = buffer.read_string(b'"', consume_sep=True, strip_colors=strip_colors)
+            players.append({'frags': frags, 'ping': ping, 'name': name})
+
+        return {
+            'ip': self.ip,
+            'port': self.port,
+            **dict(zip(keys, values)),
+            'players': players
+        }
+
+
+SUMMARY_FIELDS = ['sv_hostname', 'mapname', 'sv_maxclients', 'g_gametype']
+
+
+def build_response(variables: int, players: int, seed: int = 1) -> bytes:
+    rng = random.Random(seed)
+    data = b'\xff\xff\xff\xffstatusResponse\n'
+    for i in range(variables):
+        key = SUMMARY_FIELDS[i].encode() if i < len(SUMMARY_FIELDS) else b'cvar_%d' % i
+        data += b'\\%s\\^%d%s' % (key, rng.randrange(10), b'v' * rng.randrange(4, 24))
+    data += b'\n'
+    for i in range(players):
+        data += b'%d %d "^%dplayer%d"\n' % (rng.randrange(50), rng.randrange(300), rng.randrange(10), i)
+    return data
+
+
+def measure(parse: Callable[[Buffer], dict], data: bytes, number: int = 200) -> float:
+    elapsed = min(timeit.repeat(lambda: parse(Buffer(data)), number=number, repeat=5))
+    return elapsed / number * 1000 * 1000
+
+
+def main(sizes: List[Tuple[int, int]]) -> None:
+    current, legacy = Server('127.0.0.1', 27960), LegacyServer('127.0.0.1', 27960)
+    for variables, players in sizes:
+        data = build_response(variables, players)
+        assert current.parse_response(Buffer(data), True) == legacy.parse_response(Buffer(data), True)
+        before = measure(lambda buffer: legacy.parse_response(buffer, True), data)
+        after = measure(lambda buffer: current.parse_response(buffer, True), data)
+        summary = measure(
+            lambda buffer: current.parse_response(buffer, True, fields=SUMMARY_FIELDS, players='count'), data
+        )
+        print(
+            f'{variables:>3} variables {players:>3} players ({len(data):>5} bytes): '
+            f'read_string {before:8.1f} us, single-pass {after:8.1f} us ({before / after:4.1f}x), '
+            f'summary {summary:8.1f} us ({before / summary:4.1f}x)'
+        )
+
+
+if __name__ == '__main__':
+    main([(10, 0), (30, 8), (60, 32), (120, 64)])
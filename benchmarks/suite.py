@@ -0,0 +1,246 @@
+"""
+Benchmark suite covering response parsing, principal response framing and end-to-end scan throughput against a local
+emulator. All inputs are generated synthetically from fixed seeds, so results are comparable between runs and versions.
+
+Results are written as JSON (to stdout or the given output file), a human-readable summary is written to stderr.
+Passing a previous result file via --compare adds the relative change of every benchmark to the summary.
+
+Usage (with the package installed, e.g. via ``pip install -e .``):
+    python benchmarks/suite.py [--output results.json] [--compare baseline.json] [--quick] [--filter name]
+"""
+import argparse
+import asyncio
+import json
+import platform
+import struct
+import sys
+import threading
+import time
+import timeit
+from typing import Callable, Dict, List, Optional
+
+import pyq3serverlist
+from pyq3serverlist import Emulator, PrincipalServer, Reader, Server, StatusScanner
+from pyq3serverlist.buffer import Buffer
+from status_benchmark import SUMMARY_FIELDS, build_response
+
+PRINCIPAL_HEADER = b'\xff\xff\xff\xffgetserversResponse'
+
+
+class Benchmark:
+    name: str
+    params: Dict[str, object]
+    func: Callable[[], object]
+    number: int
+
+    def __init__(self, name: str, params: Dict[str, object], func: Callable[[], object], number: int = 1):
+        self.name = name
+        self.params = params
+        self.func = func
+        self.number = number
+
+    def run(self, repeat: int) -> dict:
+        # Use the best of all repetitions, which is the least affected by other load on the machine
+        elapsed = min(timeit.repeat(self.func, number=self.number, repeat=repeat)) / self.number
+        return {
+            'name': self.name,
+            'params': self.params,
+            'seconds_per_op': elapsed,
+            'ops_per_second': 1 / elapsed if elapsed > 0 else None,
+        }
+
+
+class BackgroundEmulator:
+    """
+    Runs an ``Emulator`` on an event loop in a separate thread, so blocking clients can query it.
+    """
+    emulator: Emulator
+    loop: asyncio.AbstractEventLoop
+    thread: threading.Thread
+
+    def __init__(self, emulator: Emulator):
+        self.emulator = emulator
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+
+    def __enter__(self) -> Emulator:
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(self.emulator.start(), self.loop).result()
+        return self.emulator
+
+    def __exit__(self, *args) -> None:
+        asyncio.run_coroutine_threadsafe(self.emulator.stop(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+
+def build_principal_packets(entries: int, per_packet: int = 200) -> List[bytes]:
+    # 1400 byte packets hold 200 entries of 7 bytes each (delimiter, ip and port)
+    packets = []
+    for start in range(0, entries, per_packet):
+        body = b''.join(
+            b'\\' + struct.pack('>IH', 0x0a000000 + i, 27960 + i % 100)
+            for i in range(start, min(entries, start + per_packet))
+        )
+        packets.append(PRINCIPAL_HEADER + body)
+    packets[-1] += b'\\EOT\x00\x00\x00'
+    return packets
+
+
+def read_strings(data: bytes) -> int:
+    buffer = Buffer(data)
+    buffer.skip(19)
+    n = 0
+    while buffer.peek(1) == b'\\':
+        buffer.skip(1)
+        buffer.read_string([b'\\', b'\n'])
+        n += 1
+    return n
+
+
+def parse_benchmarks(quick: bool) -> List[Benchmark]:
+    benchmarks = []
+
+    for variables in [10, 60]:
+        data = build_response(variables, 0)
+        benchmarks.append(Benchmark(
+            'buffer.read_string', {'variables': variables}, lambda data=data: read_strings(data), 200
+        ))
+
+    for entries in [200, 10000]:
+        data = b''.join(build_principal_packets(entries, entries))
+        benchmarks.append(Benchmark(
+            'reader.split_buffer',
+            {'entries': entries},
+            lambda data=data: Reader.split_buffer(Buffer(data), True, b'\\'),
+            200
+        ))
+
+    for entries in [1000, 10000] if quick else [1000, 10000, 100000]:
+        # Response as accumulated by the readers (bodies of all packets)
+        data = b''.join(
+            bytes(Reader.split_buffer(Buffer(packet), True, b'\\')[1]) for packet in build_principal_packets(entries)
+        )
+        for compact in [False, True]:
+            benchmarks.append(Benchmark(
+                'principal.parse_response',
+                {'entries': entries, 'compact': compact},
+                lambda data=data, compact=compact: PrincipalServer.parse_response(Buffer(data), b'\\', None, compact),
+                max(1, 100000 // entries)
+            ))
+
+    server = Server('127.0.0.1', 27960)
+    for variables, players in [(10, 0), (30, 8), (60, 32), (120, 64)]:
+        data = build_response(variables, players)
+        benchmarks.append(Benchmark(
+            'server.parse_response',
+            {'variables': variables, 'players': players, 'mode': 'full'},
+            lambda data=data: server.parse_response(Buffer(data), True),
+            200
+        ))
+        benchmarks.append(Benchmark(
+            'server.parse_response',
+            {'variables': variables, 'players': players, 'mode': 'summary'},
+            lambda data=data: server.parse_response(Buffer(data), True, fields=SUMMARY_FIELDS, players='count'),
+            200
+        ))
+
+    return benchmarks
+
+
+def run_end_to_end(servers: int, repeat: int, name_filter: str) -> List[dict]:
+    names = ['end_to_end.get_servers', 'end_to_end.scanner', 'end_to_end.get_status_async']
+    if not any(name_filter in name for name in names):
+        return []
+
+    results = []
+    with BackgroundEmulator(Emulator(servers=servers, entries_per_packet=200)) as emulator:
+        principal = PrincipalServer(emulator.host, emulator.principal_port)
+        targets = emulator.get_servers()
+
+        def scan() -> None:
+            scanner = StatusScanner(timeout=2.0)
+            failed = sum(1 for _, result in scanner.scan(targets) if isinstance(result, Exception))
+            if failed > 0:
+                print(f'{failed} of {servers} emulated servers did not respond', file=sys.stderr)
+
+        async def gather() -> None:
+            await asyncio.gather(*[server.get_status_async(timeout=2.0) for server in targets])
+
+        benchmarks = [
+            Benchmark('end_to_end.get_servers', {'servers': servers}, lambda: principal.get_servers(68), 10),
+            Benchmark('end_to_end.scanner', {'servers': servers}, scan),
+            Benchmark('end_to_end.get_status_async', {'servers': servers}, lambda: asyncio.run(gather())),
+        ]
+        for benchmark in benchmarks:
+            if name_filter not in benchmark.name:
+                continue
+            result = benchmark.run(repeat)
+            # Report throughput in servers per second for scans
+            if benchmark.name != 'end_to_end.get_servers':
+                result['servers_per_second'] = servers / result['seconds_per_op']
+            results.append(result)
+
+    return results
+
+
+def result_key(result: dict) -> str:
+    return f'{result["name"]} {json.dumps(result["params"], sort_keys=True)}'
+
+
+def format_result(result: dict, baseline: Optional[dict]) -> str:
+    params = ', '.join(f'{key}={value}' for key, value in result['params'].items())
+    line = f'{result["name"]:<30} {params:<45} {result["seconds_per_op"] * 1e6:14.1f} us'
+    if 'servers_per_second' in result:
+        line += f' {result["servers_per_second"]:10.0f} servers/s'
+    if baseline is not None:
+        change = result['seconds_per_op'] / baseline['seconds_per_op'] - 1
+        line += f' ({change:+.1%} vs. baseline)'
+    return line
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Run the pyq3serverlist benchmark suite')
+    parser.add_argument('--output', help='write JSON results to this file instead of stdout')
+    parser.add_argument('--compare', help='JSON results of a previous run to compare against')
+    parser.add_argument('--quick', action='store_true', help='use fewer repetitions and smaller inputs')
+    parser.add_argument('--filter', default='', help='only run benchmarks whose name contains this string')
+    parser.add_argument('--servers', type=int, default=1000, help='number of emulated servers for end-to-end scans')
+    args = parser.parse_args()
+
+    repeat = 3 if args.quick else 5
+    baselines = {}
+    if args.compare:
+        with open(args.compare) as file:
+            baselines = {result_key(result): result for result in json.load(file)['results']}
+
+    results = []
+    for benchmark in parse_benchmarks(args.quick):
+        if args.filter in benchmark.name:
+            results.append(benchmark.run(repeat))
+            print(format_result(results[-1], baselines.get(result_key(results[-1]))), file=sys.stderr)
+
+    servers = min(args.servers, 200) if args.quick else args.servers
+    for result in run_end_to_end(servers, repeat, args.filter):
+        results.append(result)
+        print(format_result(result, baselines.get(result_key(result))), file=sys.stderr)
+
+    report = {
+        'version': pyq3serverlist.__version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == '__main__':
+    main()
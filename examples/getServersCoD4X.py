@@ -1,6 +1,6 @@
 import socket
 
-from pyq3serverlist import PrincipalServer, PyQ3SLError, PyQ3SLTimeoutError
+from pyq3serverlist import PrincipalServer, PyQ3SLError, PyQ3SLTimeoutError, query_all
 
 principal = PrincipalServer('cod4master.cod4x.ovh', 20810, network_protocol=socket.SOCK_STREAM, timeout=2.0)
 
@@ -13,9 +13,6 @@ try:
 except (PyQ3SLError, PyQ3SLTimeoutError) as e:
     print(e)
 
-for server in servers:
-    try:
-        info = server.get_status()
-        print(info)
-    except (PyQ3SLError, PyQ3SLTimeoutError) as e:
-        print(e)
+# Query servers concurrently, so dead servers do not hold up the rest of the list
+for server, result in query_all(servers, max_workers=64):
+    print(server, result)
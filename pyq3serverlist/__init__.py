@@ -1,8 +1,22 @@
-from .connection import Connection
+from .batch import query_all
+from .cache import StatusCache
+from .connection import Connection, AsyncConnection
+from .deadservers import DeadServerCache
+from .emulator import Emulator
 from .exceptions import PyQ3SLError, PyQ3SLTimeoutError
+from .poller import PrincipalPoller, ServerListDelta
+from .instrumentation import Instrumentation, MetricsCollector, get_instrumentation, set_instrumentation
+from .principalgroup import PrincipalGroup
 from .principalserver import PrincipalServer
 from .reader import Reader, EOFReader, TimeoutReader
+from .replay import PacketRecorder, ReplayConnection, read_records
+from .rtt import RTOEstimator
+from .scanner import StatusScanner
+from .scheduler import StatusScheduler
 from .server import Server, MedalOfHonorServer
+from .serverlist import ServerList
+from .status import Status
+from .timings import Timings
 
 """
 pyq3serverlist.
@@ -15,9 +29,30 @@ __author__ = 'cetteup'
 __credits__ = 'https://github.com/jacklul'
 __all__ = [
     'PrincipalServer',
+    'PrincipalGroup',
+    'PrincipalPoller',
+    'ServerListDelta',
     'Server',
     'MedalOfHonorServer',
+    'ServerList',
+    'Status',
+    'StatusScanner',
+    'StatusCache',
+    'StatusScheduler',
+    'DeadServerCache',
+    'RTOEstimator',
+    'Timings',
+    'Instrumentation',
+    'MetricsCollector',
+    'get_instrumentation',
+    'set_instrumentation',
+    'query_all',
+    'Emulator',
     'Connection',
+    'AsyncConnection',
+    'PacketRecorder',
+    'ReplayConnection',
+    'read_records',
     'Reader',
     'EOFReader',
     'TimeoutReader',
@@ -0,0 +1,40 @@
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Dict, Iterable, Iterator, Tuple, Union
+
+from .exceptions import PyQ3SLError
+from .server import Server
+
+
+def query_all(
+        servers: Iterable[Server],
+        max_workers: int = 32,
+        strip_colors: bool = True,
+        timeout: float = 1.0
+) -> Iterator[Tuple[Server, Union[dict, PyQ3SLError]]]:
+    """
+    Query the status of all given servers concurrently on a bounded thread pool. Yields ``(server, result)`` tuples in
+    order of completion, where result is either the parsed status or the error that occurred while querying the server.
+    """
+    servers = iter(servers)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures: Dict[Future, Server] = {}
+        exhausted = False
+        while not exhausted or futures:
+            # Only submit a limited number of queries ahead, so large server lists are not all queued up front
+            while not exhausted and len(futures) < max_workers * 2:
+                server = next(servers, None)
+                if server is None:
+                    exhausted = True
+                    break
+                futures[executor.submit(server.get_status, strip_colors, timeout)] = server
+
+            if not futures:
+                continue
+
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                server = futures.pop(future)
+                try:
+                    yield server, future.result()
+                except PyQ3SLError as e:
+                    yield server, e
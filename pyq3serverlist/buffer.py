@@ -8,29 +8,48 @@ COLOR_REGEX = re.compile(r'\^(X.{6}|.)')
 
 
 class Buffer:
-    data: bytes
+    """
+    Byte buffer with a read index. Reads return ``memoryview`` slices of the underlying data rather than copies.
+    Data is only converted into a growable ``bytearray`` once something is written to the buffer, so appending
+    packets is amortized O(1) and wrapping received data does not copy it. A ``bytearray`` or ``memoryview`` passed in
+    is copied, so writing to the buffer never modifies the caller's data.
+    """
+    data: Union[bytes, bytearray]
+    view: memoryview
     length: int
     index: int
 
-    def __init__(self, data: bytes = b''):
-        self.data = data
-        self.length = len(data)
+    def __init__(self, data: Union[bytes, bytearray, memoryview] = b''):
+        self.data = data if isinstance(data, bytes) else bytes(data)
+        self.view = memoryview(self.data)
+        self.length = len(self.data)
         self.index = 0
 
-    def get_buffer(self) -> bytes:
-        return self.data[self.index:]
+    def get_buffer(self) -> memoryview:
+        return self.view[self.index:]
 
-    def read(self, length: int = 1) -> bytes:
+    def read(self, length: int = 1) -> memoryview:
         if self.index + length > self.length:
             raise PyQ3SLError('Attempt to read beyond buffer length')
 
-        data = self.data[self.index:self.index + length]
+        data = self.view[self.index:self.index + length]
         self.index += length
 
         return data
 
-    def peek(self, length: int = 1) -> bytes:
-        return self.data[self.index:self.index + length]
+    def peek(self, length: int = 1) -> memoryview:
+        return self.view[self.index:self.index + length]
+
+    def find(self, sub: bytes, offset: int = 0) -> int:
+        """
+        Find the first occurrence of sub at or after the given offset from the current index, without copying the
+        remaining data. Returns the position relative to the current index (or -1 if sub was not found).
+        """
+        index = self.data.find(sub, self.index + offset)
+        return index - self.index if index != -1 else -1
+
+    def count(self, sub: bytes) -> int:
+        return self.data.count(sub, self.index)
 
     def skip(self, length: int = 1) -> None:
         self.index += length
@@ -48,7 +67,6 @@ class Buffer:
             encoding: str = 'latin1',
             strip_colors: bool = True
     ) -> str:
-        b = self.get_buffer()
         """
         ioquake3 server may contain an "fs_manifest", which contains "\n " as a delimiter. Since "\n" would usually
         terminate the sever info like, this breaks the format. So, "greedily" try to use the first given delimiter,
@@ -56,7 +74,7 @@ class Buffer:
         it is not the last value.
         """
         sep_list = [sep] if type(sep) == bytes else sep
-        index = next((i for sep in sep_list if (i := b.find(sep)) != -1), -1)
+        index = next((i for sep in sep_list if (i := self.find(sep)) != -1), -1)
         if index == -1:
             raise PyQ3SLError('Expected string delimiters were not found')
         v = self.read(index)
@@ -64,7 +82,7 @@ class Buffer:
         if consume_sep:
             self.skip(1)
 
-        raw = v.decode(encoding, errors='replace')
+        raw = str(v, encoding, errors='replace')
         if strip_colors:
             return COLOR_REGEX.sub('', raw)
 
@@ -78,8 +96,19 @@ class Buffer:
         v = self.read(4)
         return "%d.%d.%d.%d" % struct.unpack(">BBBB", v)
 
-    def write(self, v: bytes) -> None:
-        self.data += v
+    def write(self, v: Union[bytes, bytearray, memoryview]) -> None:
+        if isinstance(self.data, bytearray):
+            self.view.release()
+        else:
+            self.data = bytearray(self.data)
+
+        try:
+            self.data += v
+        except BufferError:
+            # Views returned by earlier reads are still alive, continue on a copy and leave those views intact
+            self.data = self.data + v
+
+        self.view = memoryview(self.data)
         self.length += len(v)
 
     def write_string(self, v: str, encoding: str = 'latin1') -> None:
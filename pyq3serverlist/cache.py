@@ -0,0 +1,167 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple, Union
+
+from .exceptions import PyQ3SLError
+from .logger import logger
+from .server import Server
+from .status import Status
+
+CacheKey = Tuple[str, int, type]
+
+
+class CacheEntry:
+    result: Optional[Union[dict, Status]]
+    error: Optional[PyQ3SLError]
+    expires: float
+    refreshing: bool
+
+    def __init__(self, result: Optional[Union[dict, Status]], error: Optional[PyQ3SLError], expires: float):
+        self.result = result
+        self.error = error
+        self.expires = expires
+        self.refreshing = False
+
+
+class StatusCache:
+    """
+    Caches ``get_status`` results per server (ip, port and server class) for ``ttl`` seconds, evicting the least
+    recently used entries once more than ``max_entries`` are cached. Failed queries are cached for ``negative_ttl``
+    seconds, so unreachable servers are not queried over and over again.
+
+    With ``stale_while_revalidate`` enabled, an expired result is returned right away while the server is queried
+    again in the background. If revalidating fails, the stale result is kept and revalidated again after
+    ``negative_ttl`` seconds. Cached results are shared between callers and must not be modified. Concurrent misses for
+    the same server wait for a single query rather than querying the server once each.
+    """
+    ttl: float
+    negative_ttl: float
+    max_entries: int
+    stale_while_revalidate: bool
+    strip_colors: bool
+    timeout: float
+    clock: Callable[[], float]
+    entries: 'OrderedDict[CacheKey, CacheEntry]'
+    pending: 'Dict[CacheKey, Future[CacheEntry]]'
+    lock: threading.Lock
+    executor: Optional[ThreadPoolExecutor]
+
+    def __init__(
+            self,
+            ttl: float = 10.0,
+            negative_ttl: float = 2.0,
+            max_entries: int = 10000,
+            stale_while_revalidate: bool = False,
+            strip_colors: bool = True,
+            timeout: float = 1.0,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.stale_while_revalidate = stale_while_revalidate
+        self.strip_colors = strip_colors
+        self.timeout = timeout
+        self.clock = clock
+
+        self.entries = OrderedDict()
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.executor = None
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get_status(self, server: Server) -> Union[dict, Status]:
+        key = (server.ip, server.port, type(server))
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+
+                if self.clock() < entry.expires:
+                    return self.unwrap(entry)
+
+                # Only serve stale results, never stale errors
+                if self.stale_while_revalidate and entry.error is None:
+                    if not entry.refreshing:
+                        entry.refreshing = True
+                        self.submit_refresh(server, key, entry)
+                    return entry.result
+
+            pending = self.pending.get(key)
+            querying = pending is None
+            if querying:
+                pending = self.pending[key] = Future()
+
+        # Another caller is already querying the server, wait for its result instead of querying it again
+        if not querying:
+            return self.unwrap(pending.result())
+
+        try:
+            entry = self.refresh(server, key)
+            pending.set_result(entry)
+        except BaseException as e:
+            pending.set_exception(e)
+            raise e
+        finally:
+            with self.lock:
+                self.pending.pop(key, None)
+
+        return self.unwrap(entry)
+
+    def invalidate(self, server: Server) -> None:
+        with self.lock:
+            self.entries.pop((server.ip, server.port, type(server)), None)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+    def close(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+    def refresh(self, server: Server, key: CacheKey, stale: Optional[CacheEntry] = None) -> CacheEntry:
+        try:
+            result = server.get_status(self.strip_colors, self.timeout)
+            entry = CacheEntry(result, None, self.clock() + self.ttl)
+        except PyQ3SLError as e:
+            if stale is not None:
+                # Keep serving the last good result if revalidating it failed, only try again after negative_ttl
+                logger.debug('Keeping stale status of %s after failed revalidation (%s)', server, e)
+                entry = CacheEntry(stale.result, None, self.clock() + self.negative_ttl)
+            else:
+                logger.debug('Caching failed status query for %s (%s)', server, e)
+                entry = CacheEntry(None, e, self.clock() + self.negative_ttl)
+
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+        return entry
+
+    def submit_refresh(self, server: Server, key: CacheKey, stale: CacheEntry) -> None:
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='pyq3serverlist-cache')
+        self.executor.submit(self.revalidate, server, key, stale)
+
+    def revalidate(self, server: Server, key: CacheKey, stale: CacheEntry) -> None:
+        try:
+            self.refresh(server, key, stale)
+        finally:
+            # Allow refreshing the stale entry again if it is still cached (e.g. after an unexpected error)
+            stale.refreshing = False
+
+    @staticmethod
+    def unwrap(entry: CacheEntry) -> Union[dict, Status]:
+        if entry.error is not None:
+            # Raise a new error for every caller, since the cached one is shared between (concurrent) callers
+            raise type(entry.error)(str(entry.error)) from entry.error
+
+        return entry.result
@@ -1,25 +1,80 @@
+import asyncio
+import logging
 import socket
+import time
+from typing import Optional, Tuple, Union
 
 from .buffer import Buffer
 from .exceptions import PyQ3SLError, PyQ3SLTimeoutError
-from .logger import logger
+from .instrumentation import get_instrumentation
+from .logger import logger, packet_logger, format_packet
+from .replay import SENT, RECEIVED, get_recorder
+from .timings import Timings
 
 
-class Connection:
+class _PacketEvents:
+    """
+    Reports every packet sent or received on a connection to its timings, the instrumentation, the packet recorder
+    and the packet logger.
+    """
+    address: str
+    port: int
+    protocol: socket.SocketKind
+    timings: Optional[Timings]
+    sent_at: float
+
+    def _on_sent(self, data: bytes, started: float) -> None:
+        self.sent_at = time.perf_counter()
+        if self.timings is not None:
+            self.timings.send = self.sent_at - started
+        get_instrumentation().query_sent(self.address, self.port, len(data))
+        recorder = get_recorder()
+        if recorder is not None:
+            recorder.record(SENT, self.protocol, self.address, self.port, data)
+
+        # Only hex-encode payloads if they are actually logged
+        if packet_logger.isEnabledFor(logging.DEBUG):
+            packet_logger.debug('Sent data to %s:%d: %s', self.address, self.port, format_packet(data))
+
+    def _on_received(self, data: bytes) -> None:
+        latency = time.perf_counter() - self.sent_at
+        if self.timings is not None:
+            self.timings.received(latency)
+        get_instrumentation().response_received(self.address, self.port, len(data), latency)
+        recorder = get_recorder()
+        if recorder is not None:
+            recorder.record(RECEIVED, self.protocol, self.address, self.port, data)
+
+        if packet_logger.isEnabledFor(logging.DEBUG):
+            packet_logger.debug('Received data from %s:%d: %s', self.address, self.port, format_packet(data))
+
+
+class Connection(_PacketEvents):
     address: str
     port: int
     protocol: socket.SocketKind
     sock: socket.socket
     timeout: float
     is_connected: bool
+    timings: Optional[Timings]
+    sent_at: float
 
-    def __init__(self, address: str, port: int, protocol: socket.SocketKind, timeout: float):
+    def __init__(
+            self,
+            address: str,
+            port: int,
+            protocol: socket.SocketKind,
+            timeout: float,
+            timings: Optional[Timings] = None
+    ):
         self.address = address
         self.port = port
         self.protocol = protocol
         self.timeout = timeout
+        self.timings = timings
 
         self.is_connected = False
+        self.sent_at = time.perf_counter()
 
     def connect(self) -> None:
         if self.is_connected:
@@ -28,8 +83,9 @@ class Connection:
         self.sock = socket.socket(socket.AF_INET, self.protocol)
         self.sock.settimeout(self.timeout)
 
-        logger.debug(f'Connecting to {self.address}:{self.port}')
+        logger.debug('Connecting to %s:%d', self.address, self.port)
 
+        started = time.perf_counter()
         try:
             self.sock.connect((self.address, self.port))
             self.is_connected = True
@@ -40,26 +96,32 @@ class Connection:
             self.is_connected = False
             raise PyQ3SLError(f'Failed to connect to {self.address}:{self.port} ({e})')
 
+        if self.timings is not None:
+            self.timings.connect = time.perf_counter() - started
+
     def write(self, data: bytes) -> None:
         if not self.is_connected:
             self.connect()
 
         logger.debug('Writing to socket')
 
+        started = time.perf_counter()
         try:
             self.sock.sendall(data)
         except socket.error:
             raise PyQ3SLError('Failed to send data to server')
 
-        logger.debug(f'Sent data: {data.hex(" ")}')
+        self._on_sent(data, started)
 
-    def read(self) -> Buffer:
+    def read(self, timeout: Optional[float] = None) -> Buffer:
         if not self.is_connected:
             self.connect()
 
         logger.debug('Reading from socket')
 
         try:
+            # Allow overriding the timeout per read (e.g. for retransmissions)
+            self.sock.settimeout(timeout if timeout is not None else self.timeout)
             # Packet size differs from server to server => read up to max possible UDP size
             data = self.sock.recv(65507)
         except socket.timeout:
@@ -67,7 +129,7 @@ class Connection:
         except socket.error:
             raise PyQ3SLError('Failed to receive data from server')
 
-        logger.debug(f'Received data: {data.hex(" ")}')
+        self._on_received(data)
 
         return Buffer(data)
 
@@ -83,3 +145,146 @@ class Connection:
             return True
 
         return False
+
+
+class _DatagramQueueProtocol(asyncio.DatagramProtocol):
+    queue: 'asyncio.Queue[Union[bytes, Exception]]'
+
+    def __init__(self):
+        self.queue = asyncio.Queue()
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+        self.queue.put_nowait(data)
+
+    def error_received(self, exc: Exception) -> None:
+        self.queue.put_nowait(exc)
+
+
+class AsyncConnection(_PacketEvents):
+    """
+    Asyncio based equivalent of ``Connection``. Uses a datagram endpoint for UDP and a stream for TCP, so a single
+    event loop can keep many queries in flight without blocking a thread per socket.
+    """
+    address: str
+    port: int
+    protocol: socket.SocketKind
+    timeout: float
+    is_connected: bool
+    transport: Optional[asyncio.DatagramTransport]
+    datagram_protocol: Optional[_DatagramQueueProtocol]
+    stream_reader: Optional[asyncio.StreamReader]
+    stream_writer: Optional[asyncio.StreamWriter]
+    timings: Optional[Timings]
+    sent_at: float
+
+    def __init__(
+            self,
+            address: str,
+            port: int,
+            protocol: socket.SocketKind,
+            timeout: float,
+            timings: Optional[Timings] = None
+    ):
+        self.address = address
+        self.port = port
+        self.protocol = protocol
+        self.timeout = timeout
+        self.timings = timings
+
+        self.is_connected = False
+        self.sent_at = time.perf_counter()
+        self.transport = None
+        self.datagram_protocol = None
+        self.stream_reader = None
+        self.stream_writer = None
+
+    async def connect(self) -> None:
+        if self.is_connected:
+            return
+
+        logger.debug('Connecting to %s:%d', self.address, self.port)
+
+        started = time.perf_counter()
+        try:
+            if self.protocol == socket.SOCK_DGRAM:
+                loop = asyncio.get_running_loop()
+                self.transport, self.datagram_protocol = await asyncio.wait_for(
+                    loop.create_datagram_endpoint(
+                        _DatagramQueueProtocol,
+                        remote_addr=(self.address, self.port),
+                        family=socket.AF_INET
+                    ),
+                    self.timeout
+                )
+            else:
+                self.stream_reader, self.stream_writer = await asyncio.wait_for(
+                    asyncio.open_connection(self.address, self.port, family=socket.AF_INET),
+                    self.timeout
+                )
+            self.is_connected = True
+        except asyncio.TimeoutError:
+            self.is_connected = False
+            raise PyQ3SLTimeoutError(f'Connection attempt to {self.address}:{self.port} timed out')
+        except OSError as e:
+            self.is_connected = False
+            raise PyQ3SLError(f'Failed to connect to {self.address}:{self.port} ({e})')
+
+        if self.timings is not None:
+            self.timings.connect = time.perf_counter() - started
+
+    async def write(self, data: bytes) -> None:
+        if not self.is_connected:
+            await self.connect()
+
+        logger.debug('Writing to socket')
+
+        started = time.perf_counter()
+        try:
+            if self.transport is not None:
+                self.transport.sendto(data)
+            else:
+                self.stream_writer.write(data)
+                await self.stream_writer.drain()
+        except OSError:
+            raise PyQ3SLError('Failed to send data to server')
+
+        self._on_sent(data, started)
+
+    async def read(self, timeout: Optional[float] = None) -> Buffer:
+        if not self.is_connected:
+            await self.connect()
+
+        logger.debug('Reading from socket')
+
+        timeout = timeout if timeout is not None else self.timeout
+        try:
+            if self.datagram_protocol is not None:
+                data = await asyncio.wait_for(self.datagram_protocol.queue.get(), timeout)
+                if isinstance(data, Exception):
+                    raise data
+            else:
+                # Packet size differs from server to server => read up to max possible UDP size
+                data = await asyncio.wait_for(self.stream_reader.read(65507), timeout)
+        except asyncio.TimeoutError:
+            raise PyQ3SLTimeoutError('Timed out while receiving server data')
+        except OSError:
+            raise PyQ3SLError('Failed to receive data from server')
+
+        self._on_received(data)
+
+        return Buffer(data)
+
+    def close(self) -> bool:
+        if self.transport is not None:
+            self.transport.close()
+        elif self.stream_writer is not None:
+            self.stream_writer.close()
+        else:
+            return False
+
+        self.transport = None
+        self.datagram_protocol = None
+        self.stream_reader = None
+        self.stream_writer = None
+        self.is_connected = False
+        return True
@@ -0,0 +1,156 @@
+import sqlite3
+import time
+from contextlib import closing
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from .exceptions import PyQ3SLError, PyQ3SLTimeoutError
+from .logger import logger
+from .server import Server
+
+Address = Tuple[str, int]
+
+
+class DeadServerEntry:
+    timeouts: int
+    until: float
+
+    def __init__(self, timeouts: int = 0, until: float = 0.0):
+        self.timeouts = timeouts
+        self.until = until
+
+
+class DeadServerCache:
+    """
+    Tracks consecutive timeouts per server (ip and port), so scans can skip or deprioritize servers which are known to
+    be unreachable. Once a server timed out ``threshold`` times in a row, it is considered dead for ``base_backoff``
+    seconds, doubling with every further timeout (up to ``max_backoff``). Any successful query resets the server.
+
+    If a path is given, entries are loaded from and saved to an SQLite database at that path. Changes are only written
+    on ``save`` (or when leaving the cache's context), so tracking a large scan does not cause a write per server.
+    """
+    threshold: int
+    base_backoff: float
+    max_backoff: float
+    path: Optional[str]
+    clock: Callable[[], float]
+    entries: Dict[Address, DeadServerEntry]
+    dirty: Set[Address]
+
+    def __init__(
+            self,
+            path: Optional[str] = None,
+            threshold: int = 2,
+            base_backoff: float = 600.0,
+            max_backoff: float = 86400.0,
+            clock: Callable[[], float] = time.time
+    ):
+        self.path = path
+        self.threshold = threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        # Use wall clock time by default, since entries may be persisted across runs
+        self.clock = clock
+
+        self.entries = {}
+        self.dirty = set()
+
+        if self.path is not None:
+            self.load()
+
+    def __enter__(self) -> 'DeadServerCache':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.save()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def is_dead(self, server: Server) -> bool:
+        entry = self.entries.get((server.ip, server.port))
+        return entry is not None and entry.until > self.clock()
+
+    def record_timeout(self, server: Server) -> None:
+        address = (server.ip, server.port)
+        entry = self.entries.setdefault(address, DeadServerEntry())
+        entry.timeouts += 1
+        if entry.timeouts >= self.threshold:
+            # Cap the exponent, since the backoff would overflow a float after about a thousand timeouts
+            backoff = min(self.max_backoff, self.base_backoff * 2 ** min(entry.timeouts - self.threshold, 32))
+            entry.until = self.clock() + backoff
+            logger.debug('Considering %s dead for %.0fs after %d consecutive timeouts', server, backoff, entry.timeouts)
+        self.dirty.add(address)
+
+    def record_success(self, server: Server) -> None:
+        address = (server.ip, server.port)
+        if self.entries.pop(address, None) is not None:
+            self.dirty.add(address)
+
+    def record(self, server: Server, result: Union[dict, PyQ3SLError]) -> None:
+        # Only timeouts indicate a dead server and only a parsed status proves it is alive, other errors (e.g. failing
+        # to send or receive) say nothing about the server and leave it unchanged
+        if isinstance(result, PyQ3SLTimeoutError):
+            self.record_timeout(server)
+        elif not isinstance(result, PyQ3SLError):
+            self.record_success(server)
+
+    def track(
+            self,
+            results: Iterable[Tuple[Server, Union[dict, PyQ3SLError]]]
+    ) -> Iterator[Tuple[Server, Union[dict, PyQ3SLError]]]:
+        """
+        Record and pass through results as yielded by ``StatusScanner.scan`` or ``query_all``.
+        """
+        for server, result in results:
+            self.record(server, result)
+            yield server, result
+
+    def filter(self, servers: Iterable[Server]) -> List[Server]:
+        """
+        Return all servers which are not currently considered dead.
+        """
+        now = self.clock()
+        return [server for server in servers if self.until(server) <= now]
+
+    def prioritize(self, servers: Iterable[Server]) -> List[Server]:
+        """
+        Return all servers, with the ones currently considered dead moved to the end (longest dead last).
+        """
+        now = self.clock()
+        return sorted(servers, key=lambda server: max(now, self.until(server)))
+
+    def until(self, server: Server) -> float:
+        entry = self.entries.get((server.ip, server.port))
+        return entry.until if entry is not None else 0.0
+
+    def load(self) -> None:
+        with closing(self.connect()) as connection, connection:
+            rows = connection.execute('SELECT ip, port, timeouts, until FROM dead_servers').fetchall()
+
+        self.entries = {(ip, port): DeadServerEntry(timeouts, until) for ip, port, timeouts, until in rows}
+        self.dirty = set()
+
+    def save(self) -> None:
+        if self.path is None or len(self.dirty) == 0:
+            return
+
+        upserts = [(*address, e.timeouts, e.until) for address in self.dirty if (e := self.entries.get(address))]
+        deletes = [address for address in self.dirty if address not in self.entries]
+        with closing(self.connect()) as connection, connection:
+            connection.executemany('INSERT OR REPLACE INTO dead_servers VALUES (?, ?, ?, ?)', upserts)
+            connection.executemany('DELETE FROM dead_servers WHERE ip = ? AND port = ?', deletes)
+
+        self.dirty = set()
+
+    def connect(self) -> sqlite3.Connection:
+        try:
+            connection = sqlite3.connect(self.path)
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS dead_servers ('
+                'ip TEXT NOT NULL, port INTEGER NOT NULL, timeouts INTEGER NOT NULL, until REAL NOT NULL, '
+                'PRIMARY KEY (ip, port))'
+            )
+        except sqlite3.Error as e:
+            raise PyQ3SLError(f'Failed to open dead server database {self.path} ({e})')
+
+        return connection
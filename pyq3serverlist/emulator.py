@@ -0,0 +1,320 @@
+import asyncio
+import random
+import socket
+import struct
+from typing import List, Optional, Tuple, Union
+
+from .server import Server, MedalOfHonorServer
+
+PRINCIPAL_HEADER = b'\xff\xff\xff\xffgetserversResponse'
+
+Address = Tuple[str, int]
+
+
+class EmulatedServer:
+    """
+    Game server stand-in answering status and info queries, either in the "vanilla" Quake3 format or, if
+    ``medal_of_honor`` is set, in the Medal of Honor variant.
+    """
+    port: int
+    variables: List[Tuple[str, str]]
+    players: List[Tuple[int, int, str]]
+    medal_of_honor: bool
+
+    def __init__(
+            self,
+            variables: List[Tuple[str, str]],
+            players: List[Tuple[int, int, str]],
+            medal_of_honor: bool = False
+    ):
+        self.port = 0
+        self.variables = variables
+        self.players = players
+        self.medal_of_honor = medal_of_honor
+
+    @property
+    def server_class(self) -> type:
+        return MedalOfHonorServer if self.medal_of_honor else Server
+
+    def server(self, host: str) -> Server:
+        return self.server_class(host, self.port)
+
+    def respond(self, data: bytes) -> Optional[bytes]:
+        if data == self.server_class.build_query_packet():
+            return self.build_status_response()
+        if data == self.server_class.build_info_query_packet():
+            return self.build_info_response()
+        return None
+
+    def build_status_response(self) -> bytes:
+        header = b'\xff\xff\xff\xff\x01statusResponse\n' if self.medal_of_honor else b'\xff\xff\xff\xffstatusResponse\n'
+        if self.medal_of_honor:
+            lines = [f'{ping} "{name}"\n' for _, ping, name in self.players]
+        else:
+            lines = [f'{frags} {ping} "{name}"\n' for frags, ping, name in self.players]
+        return header + (self.format_variables(self.variables) + '\n' + ''.join(lines)).encode('latin1')
+
+    def build_info_response(self) -> bytes:
+        header = b'\xff\xff\xff\xff\x01infoResponse\n' if self.medal_of_honor else b'\xff\xff\xff\xffinfoResponse\n'
+        variables = [*self.variables, ('clients', str(len(self.players)))]
+        return header + self.format_variables(variables).encode('latin1')
+
+    @staticmethod
+    def format_variables(variables: List[Tuple[str, str]]) -> str:
+        return ''.join(f'\\{key}\\{value}' for key, value in variables)
+
+
+class EmulatedPrincipal:
+    """
+    Principal server stand-in answering ``getservers`` queries with a list of servers, split into packets of
+    ``entries_per_packet`` entries. Every packet but the last ends with ``packet_marker`` (e.g. ``\\EOT`` as sent by
+    Activision), the last ends with ``end_marker`` (``\\EOT\\0\\0\\0``, ``\\EOF`` or nothing for principals which do
+    not indicate the end of the response). Over UDP, every packet starts with the response header, over TCP only the
+    first one does.
+    """
+    addresses: List[Address]
+    entries_per_packet: int
+    preamble: bytes
+    prefix: bytes
+    packet_marker: bytes
+    end_marker: bytes
+
+    def __init__(
+            self,
+            addresses: List[Address],
+            entries_per_packet: int = 200,
+            preamble: bytes = b'',
+            prefix: bytes = b'',
+            packet_marker: bytes = b'',
+            end_marker: bytes = b'\\EOT\x00\x00\x00'
+    ):
+        self.addresses = addresses
+        self.entries_per_packet = entries_per_packet
+        self.preamble = preamble
+        self.prefix = prefix
+        self.packet_marker = packet_marker
+        self.end_marker = end_marker
+
+    def build_bodies(self) -> List[bytes]:
+        entries = [
+            b'\\' + self.prefix + socket.inet_aton(ip) + struct.pack('>H', port) for ip, port in self.addresses
+        ]
+        # Always send at least one (empty) packet
+        return [
+            b''.join(entries[start:start + self.entries_per_packet])
+            for start in range(0, max(1, len(entries)), self.entries_per_packet)
+        ]
+
+    def build_packets(self) -> List[bytes]:
+        bodies = self.build_bodies()
+        return [
+            PRINCIPAL_HEADER + self.preamble + body + (self.end_marker if i == len(bodies) - 1 else self.packet_marker)
+            for i, body in enumerate(bodies)
+        ]
+
+    def build_segments(self) -> List[bytes]:
+        bodies = self.build_bodies()
+        bodies[0] = PRINCIPAL_HEADER + self.preamble + bodies[0]
+        bodies[-1] += self.end_marker
+        return bodies
+
+    @staticmethod
+    def is_query(data: bytes) -> bool:
+        return data.startswith(b'\xff\xff\xff\xffgetservers ')
+
+
+class DatagramProtocol(asyncio.DatagramProtocol):
+    transport: Optional[asyncio.DatagramTransport]
+
+    def __init__(self):
+        self.transport = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport
+
+
+class GameServerProtocol(DatagramProtocol):
+    emulator: 'Emulator'
+    server: EmulatedServer
+
+    def __init__(self, emulator: 'Emulator', server: EmulatedServer):
+        super().__init__()
+        self.emulator = emulator
+        self.server = server
+
+    def datagram_received(self, data: bytes, address: Address) -> None:
+        response = self.server.respond(data)
+        if response is not None:
+            self.emulator.send(self.transport, [response], address)
+
+
+class PrincipalProtocol(DatagramProtocol):
+    emulator: 'Emulator'
+
+    def __init__(self, emulator: 'Emulator'):
+        super().__init__()
+        self.emulator = emulator
+
+    def datagram_received(self, data: bytes, address: Address) -> None:
+        if EmulatedPrincipal.is_query(data):
+            self.emulator.send(self.transport, self.emulator.principal.build_packets(), address)
+
+
+class Emulator:
+    """
+    Local stand-in for a principal server and its game servers, intended for integration tests and load tests without
+    relying on the internet. Every game server is bound to its own UDP port on ``host``, the principal is bound to a
+    UDP and a TCP port. Ports are assigned by the operating system unless given.
+
+    Game servers answer status queries with ``variables`` cvars and a (seeded) random number of players between
+    ``min_players`` and ``max_players``. The first cvars are sv_hostname, mapname, g_gametype, sv_maxclients and
+    protocol (in that order), so fewer than five variables leave out the later ones. Since status responses must
+    contain at least one cvar, ``variables`` must be at least one. Responses are delayed by ``latency`` seconds, and
+    each response packet is dropped with a probability of ``loss``. Since every game server uses a socket, emulating
+    many servers may require raising the open file limit.
+    """
+    host: str
+    principal_port: int
+    principal_tcp_port: int
+    latency: float
+    loss: float
+    rng: random.Random
+    servers: List[EmulatedServer]
+    principal: EmulatedPrincipal
+    transports: List[asyncio.DatagramTransport]
+    tcp_server: Optional[asyncio.AbstractServer]
+
+    def __init__(
+            self,
+            servers: int = 100,
+            host: str = '127.0.0.1',
+            principal_port: int = 0,
+            principal_tcp_port: int = 0,
+            variables: int = 20,
+            min_players: int = 0,
+            max_players: int = 16,
+            medal_of_honor: bool = False,
+            latency: float = 0.0,
+            loss: float = 0.0,
+            entries_per_packet: int = 200,
+            preamble: bytes = b'',
+            prefix: bytes = b'',
+            packet_marker: bytes = b'',
+            end_marker: bytes = b'\\EOT\x00\x00\x00',
+            seed: int = 0
+    ):
+        if variables < 1:
+            raise ValueError(f'Emulated servers need at least one variable (got {variables})')
+
+        self.host = host
+        self.principal_port = principal_port
+        self.principal_tcp_port = principal_tcp_port
+        self.latency = latency
+        self.loss = loss
+        self.rng = random.Random(seed)
+
+        self.servers = [
+            EmulatedServer(
+                build_variables(variables, i),
+                build_players(self.rng.randint(min_players, max_players), self.rng),
+                medal_of_honor
+            )
+            for i in range(servers)
+        ]
+        self.principal = EmulatedPrincipal([], entries_per_packet, preamble, prefix, packet_marker, end_marker)
+        self.transports = []
+        self.tcp_server = None
+
+    async def __aenter__(self) -> 'Emulator':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            for server in self.servers:
+                transport, _ = await loop.create_datagram_endpoint(
+                    lambda s=server: GameServerProtocol(self, s),
+                    local_addr=(self.host, 0)
+                )
+                self.transports.append(transport)
+                server.port = transport.get_extra_info('sockname')[1]
+
+            self.principal.addresses = [(self.host, server.port) for server in self.servers]
+
+            transport, _ = await loop.create_datagram_endpoint(
+                lambda: PrincipalProtocol(self),
+                local_addr=(self.host, self.principal_port)
+            )
+            self.transports.append(transport)
+            self.principal_port = transport.get_extra_info('sockname')[1]
+
+            self.tcp_server = await asyncio.start_server(self.handle_tcp, self.host, self.principal_tcp_port)
+            self.principal_tcp_port = self.tcp_server.sockets[0].getsockname()[1]
+        except OSError:
+            await self.stop()
+            raise
+
+    async def stop(self) -> None:
+        for transport in self.transports:
+            transport.close()
+        self.transports = []
+
+        if self.tcp_server is not None:
+            self.tcp_server.close()
+            await self.tcp_server.wait_closed()
+            self.tcp_server = None
+
+    def get_servers(self) -> List[Union[Server, MedalOfHonorServer]]:
+        return [server.server(self.host) for server in self.servers]
+
+    def send(self, transport: asyncio.DatagramTransport, packets: List[bytes], address: Address) -> None:
+        packets = [packet for packet in packets if self.loss == 0.0 or self.rng.random() >= self.loss]
+        if len(packets) == 0:
+            return
+
+        if self.latency > 0:
+            asyncio.get_running_loop().call_later(self.latency, self.sendto, transport, packets, address)
+        else:
+            self.sendto(transport, packets, address)
+
+    @staticmethod
+    def sendto(transport: asyncio.DatagramTransport, packets: List[bytes], address: Address) -> None:
+        if transport.is_closing():
+            return
+
+        for packet in packets:
+            transport.sendto(packet, address)
+
+    async def handle_tcp(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            data = await reader.read(2048)
+            if EmulatedPrincipal.is_query(data):
+                if self.latency > 0:
+                    await asyncio.sleep(self.latency)
+                for segment in self.principal.build_segments():
+                    writer.write(segment)
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+def build_variables(count: int, seed: int) -> List[Tuple[str, str]]:
+    variables = [
+        ('sv_hostname', f'^1Emulated ^7Server {seed}'),
+        ('mapname', f'q3dm{seed % 19 + 1}'),
+        ('g_gametype', str(seed % 5)),
+        ('sv_maxclients', '16'),
+        ('protocol', '68'),
+    ]
+    variables.extend((f'cvar{i}', f'value{i}') for i in range(max(0, count - len(variables))))
+    return variables[:count]
+
+
+def build_players(count: int, rng: random.Random) -> List[Tuple[int, int, str]]:
+    return [(rng.randint(-5, 50), rng.randint(0, 200), f'^{i % 8}Player^7{i}') for i in range(count)]
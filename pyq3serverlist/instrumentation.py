@@ -0,0 +1,203 @@
+import bisect
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from .exceptions import PyQ3SLError
+from .timings import Timings
+
+T = TypeVar('T')
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+PARSE_BUCKETS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1)
+PACKET_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+
+class Instrumentation:
+    """
+    Receives events from connections, readers, principal servers and servers. All methods are no-ops, override the
+    ones you are interested in and register an instance using ``set_instrumentation``. Methods are called on the
+    querying thread (or event loop) and should return quickly.
+    """
+
+    def query_sent(self, address: str, port: int, size: int) -> None:
+        pass
+
+    def response_received(self, address: str, port: int, size: int, latency: float) -> None:
+        """
+        Called for every received packet, latency being the time since the last packet was sent on the connection.
+        """
+        pass
+
+    def timeout(self, address: str, port: int) -> None:
+        """
+        Called whenever a query is considered lost (including lost queries which are retransmitted).
+        """
+        pass
+
+    def principal_response(self, address: str, port: int, packets: int, size: int) -> None:
+        pass
+
+    def parse_duration(self, kind: str, duration: float) -> None:
+        pass
+
+    def parse_error(self, kind: str, error: PyQ3SLError) -> None:
+        pass
+
+
+class Histogram:
+    buckets: Tuple[float, ...]
+    counts: List[int]
+    sum: float
+    count: int
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(sorted(buckets))
+        # Last count is the implicit +Inf bucket
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        bounds = [format_value(bound) for bound in self.buckets] + ['+Inf']
+        total = 0
+        cumulative = []
+        for bound, count in zip(bounds, self.counts):
+            total += count
+            cumulative.append((bound, total))
+        return cumulative
+
+
+class MetricsCollector(Instrumentation):
+    """
+    Aggregates events in-process into counters and histograms, which can be exported in the Prometheus text format
+    using ``render`` (e.g. from a ``/metrics`` endpoint). Metrics are not labeled by server address, which would
+    result in an unbounded number of time series.
+    """
+    prefix: str
+    lock: threading.Lock
+    counters: Dict[str, float]
+    parse_errors: Dict[str, int]
+    latency: Histogram
+    principal_packets: Histogram
+    parse_durations: Dict[str, Histogram]
+
+    def __init__(self, prefix: str = 'pyq3serverlist'):
+        self.prefix = prefix
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.counters = {
+            'queries_sent_total': 0,
+            'bytes_sent_total': 0,
+            'packets_received_total': 0,
+            'bytes_received_total': 0,
+            'timeouts_total': 0,
+            'principal_responses_total': 0,
+        }
+        self.parse_errors = {}
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.principal_packets = Histogram(PACKET_BUCKETS)
+        self.parse_durations = {}
+
+    def query_sent(self, address: str, port: int, size: int) -> None:
+        with self.lock:
+            self.counters['queries_sent_total'] += 1
+            self.counters['bytes_sent_total'] += size
+
+    def response_received(self, address: str, port: int, size: int, latency: float) -> None:
+        with self.lock:
+            self.counters['packets_received_total'] += 1
+            self.counters['bytes_received_total'] += size
+            self.latency.observe(latency)
+
+    def timeout(self, address: str, port: int) -> None:
+        with self.lock:
+            self.counters['timeouts_total'] += 1
+
+    def principal_response(self, address: str, port: int, packets: int, size: int) -> None:
+        with self.lock:
+            self.counters['principal_responses_total'] += 1
+            self.principal_packets.observe(packets)
+
+    def parse_duration(self, kind: str, duration: float) -> None:
+        with self.lock:
+            histogram = self.parse_durations.get(kind)
+            if histogram is None:
+                histogram = self.parse_durations[kind] = Histogram(PARSE_BUCKETS)
+            histogram.observe(duration)
+
+    def parse_error(self, kind: str, error: PyQ3SLError) -> None:
+        with self.lock:
+            self.parse_errors[kind] = self.parse_errors.get(kind, 0) + 1
+
+    def render(self) -> str:
+        lines = []
+        with self.lock:
+            for name, value in self.counters.items():
+                lines.append(f'# TYPE {self.prefix}_{name} counter')
+                lines.append(f'{self.prefix}_{name} {format_value(value)}')
+
+            lines.append(f'# TYPE {self.prefix}_parse_errors_total counter')
+            for kind, value in sorted(self.parse_errors.items()):
+                lines.append(f'{self.prefix}_parse_errors_total{{kind="{kind}"}} {value}')
+
+            lines.extend(self.render_histogram('response_latency_seconds', self.latency))
+            lines.extend(self.render_histogram('principal_response_packets', self.principal_packets))
+            lines.append(f'# TYPE {self.prefix}_parse_duration_seconds histogram')
+            for kind, histogram in sorted(self.parse_durations.items()):
+                lines.extend(self.render_histogram('parse_duration_seconds', histogram, f'kind="{kind}"', False))
+
+        return '\n'.join(lines) + '\n'
+
+    def render_histogram(self, name: str, histogram: Histogram, labels: str = '', header: bool = True) -> List[str]:
+        name = f'{self.prefix}_{name}'
+        lines = [f'# TYPE {name} histogram'] if header else []
+        separator = ',' if labels else ''
+        for bound, count in histogram.cumulative():
+            lines.append(f'{name}_bucket{{{labels}{separator}le="{bound}"}} {count}')
+        suffix = f'{{{labels}}}' if labels else ''
+        lines.append(f'{name}_sum{suffix} {format_value(histogram.sum)}')
+        lines.append(f'{name}_count{suffix} {histogram.count}')
+        return lines
+
+
+def format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+_instrumentation = Instrumentation()
+
+
+def get_instrumentation() -> Instrumentation:
+    return _instrumentation
+
+
+def set_instrumentation(instrumentation: Optional[Instrumentation]) -> None:
+    """
+    Register the instrumentation to report events to (or remove any registered instrumentation by passing None).
+    """
+    global _instrumentation
+    _instrumentation = instrumentation if instrumentation is not None else Instrumentation()
+
+
+def timed_parse(kind: str, timings: Optional[Timings], parse: Callable[..., T], *args) -> T:
+    started = time.perf_counter()
+    try:
+        result = parse(*args)
+    except PyQ3SLError as e:
+        _instrumentation.parse_error(kind, e)
+        raise e
+
+    duration = time.perf_counter() - started
+    if timings is not None:
+        timings.parse = duration
+    _instrumentation.parse_duration(kind, duration)
+
+    return result
@@ -1,3 +1,17 @@
 import logging
 
 logger = logging.getLogger(__package__)
+
+# Packet payloads are logged on a separate channel, so they can be silenced (or enabled) independently of other debug
+# logs, e.g. via logging.getLogger('pyq3serverlist.packets').setLevel(logging.INFO)
+packet_logger = logging.getLogger(f'{__package__}.packets')
+
+# Maximum number of payload bytes included in a packet log message
+PACKET_LOG_LIMIT = 256
+
+
+def format_packet(data: bytes, limit: int = PACKET_LOG_LIMIT) -> str:
+    if len(data) <= limit:
+        return data.hex(' ')
+
+    return f'{data[:limit].hex(" ")} ... ({len(data) - limit} more bytes)'
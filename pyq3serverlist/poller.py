@@ -0,0 +1,78 @@
+from typing import FrozenSet, Optional
+
+from .principalserver import PrincipalServer
+from .serverlist import ServerList
+
+
+class ServerListDelta:
+    added: ServerList
+    removed: ServerList
+    unchanged: ServerList
+
+    def __init__(self, added: ServerList, removed: ServerList, unchanged: ServerList):
+        self.added = added
+        self.removed = removed
+        self.unchanged = unchanged
+
+    def __repr__(self):
+        return f'ServerListDelta(added={len(self.added)}, removed={len(self.removed)}, unchanged={len(self.unchanged)})'
+
+
+class PrincipalPoller:
+    """
+    Repeatedly retrieves the server list from a principal and reports how the list changed since the previous poll.
+    The last snapshot is kept as a set of compact server keys (see ``Server.key``). The first poll reports all servers
+    as added.
+    """
+    principal: PrincipalServer
+    query_protocol: int
+    game_name: str
+    keywords: str
+    server_entry_prefix: Optional[bytes]
+    snapshot: FrozenSet[int]
+
+    def __init__(
+            self,
+            principal: PrincipalServer,
+            query_protocol: int,
+            game_name: str = '',
+            keywords: str = 'full empty',
+            server_entry_prefix: Optional[bytes] = None
+    ):
+        self.principal = principal
+        self.query_protocol = query_protocol
+        self.game_name = game_name
+        self.keywords = keywords
+        self.server_entry_prefix = server_entry_prefix
+        self.snapshot = frozenset()
+
+    def poll(self) -> ServerListDelta:
+        servers = self.principal.get_servers(
+            self.query_protocol,
+            self.game_name,
+            self.keywords,
+            self.server_entry_prefix,
+            compact=True
+        )
+        return self.update(servers)
+
+    async def poll_async(self) -> ServerListDelta:
+        servers = await self.principal.get_servers_async(
+            self.query_protocol,
+            self.game_name,
+            self.keywords,
+            self.server_entry_prefix,
+            compact=True
+        )
+        return self.update(servers)
+
+    def update(self, servers: ServerList) -> ServerListDelta:
+        current = servers.key_set()
+        delta = ServerListDelta(
+            ServerList.from_keys(sorted(current - self.snapshot)),
+            ServerList.from_keys(sorted(self.snapshot - current)),
+            ServerList.from_keys(sorted(current & self.snapshot))
+        )
+        self.snapshot = current
+
+        return delta
@@ -0,0 +1,122 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple, Union
+
+from .exceptions import PyQ3SLError
+from .logger import logger
+from .principalserver import PrincipalServer
+from .server import Server
+
+
+class PrincipalQuery:
+    principal: PrincipalServer
+    query_protocol: int
+    game_name: str
+    keywords: str
+    server_entry_prefix: Optional[bytes]
+
+    def __init__(
+            self,
+            principal: PrincipalServer,
+            query_protocol: int,
+            game_name: str = '',
+            keywords: str = 'full empty',
+            server_entry_prefix: Optional[bytes] = None
+    ):
+        self.principal = principal
+        self.query_protocol = query_protocol
+        self.game_name = game_name
+        self.keywords = keywords
+        self.server_entry_prefix = server_entry_prefix
+
+
+class PrincipalGroup:
+    """
+    Queries multiple principals at once and merges their server lists into a single, deduplicated result.
+    Every principal keeps its own reader, network protocol and timeout, so a slow principal does not hold up the others.
+    Errors of individual queries are collected in ``errors`` rather than raised, unless all queries fail.
+    """
+    queries: List[PrincipalQuery]
+    errors: Dict[PrincipalQuery, PyQ3SLError]
+
+    def __init__(self):
+        self.queries = []
+        self.errors = {}
+
+    def add(
+            self,
+            principal: PrincipalServer,
+            query_protocol: int,
+            game_name: str = '',
+            keywords: str = 'full empty',
+            server_entry_prefix: Optional[bytes] = None
+    ) -> None:
+        self.queries.append(PrincipalQuery(principal, query_protocol, game_name, keywords, server_entry_prefix))
+
+    def get_servers(self) -> Dict[Server, List[PrincipalServer]]:
+        """
+        Query all principals concurrently. Returns every server mapped to the principals which listed it.
+        Blocking queries share the principal's connection, so multiple queries to the same principal run one by one.
+        """
+        by_principal: Dict[PrincipalServer, List[PrincipalQuery]] = {}
+        for q in self.queries:
+            by_principal.setdefault(q.principal, []).append(q)
+
+        results: List[Tuple[PrincipalQuery, Union[List[Server], PyQ3SLError]]] = []
+        with ThreadPoolExecutor(max_workers=max(1, len(by_principal))) as executor:
+            futures = [executor.submit(self.run_queries, queries) for queries in by_principal.values()]
+            for future in as_completed(futures):
+                results.extend(future.result())
+
+        return self.merge(results)
+
+    @staticmethod
+    def run_queries(queries: List[PrincipalQuery]) -> List[Tuple[PrincipalQuery, Union[List[Server], PyQ3SLError]]]:
+        results: List[Tuple[PrincipalQuery, Union[List[Server], PyQ3SLError]]] = []
+        for q in queries:
+            try:
+                results.append((
+                    q,
+                    q.principal.get_servers(q.query_protocol, q.game_name, q.keywords, q.server_entry_prefix)
+                ))
+            except PyQ3SLError as e:
+                results.append((q, e))
+
+        return results
+
+    async def get_servers_async(self) -> Dict[Server, List[PrincipalServer]]:
+        # Every async query uses its own connection, so all of them can run concurrently
+        results = await asyncio.gather(*[
+            q.principal.get_servers_async(q.query_protocol, q.game_name, q.keywords, q.server_entry_prefix)
+            for q in self.queries
+        ], return_exceptions=True)
+
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, PyQ3SLError):
+                raise result
+
+        return self.merge(list(zip(self.queries, results)))
+
+    def merge(
+            self,
+            results: List[Tuple[PrincipalQuery, Union[List[Server], PyQ3SLError]]]
+    ) -> Dict[Server, List[PrincipalServer]]:
+        self.errors = {}
+        servers: Dict[Server, List[PrincipalServer]] = {}
+        for query, result in results:
+            if isinstance(result, PyQ3SLError):
+                logger.debug('Failed to retrieve servers from %s (%s)', query.principal, result)
+                self.errors[query] = result
+                continue
+
+            for server in result:
+                principals = servers.setdefault(server, [])
+                # The same principal may be queried more than once (e.g. for different protocols)
+                if query.principal not in principals:
+                    principals.append(query.principal)
+
+        # Only fail if there is nothing to return at all
+        if len(results) > 0 and len(self.errors) == len(results):
+            raise next(iter(self.errors.values()))
+
+        return servers
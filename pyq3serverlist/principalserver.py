@@ -1,10 +1,15 @@
 import socket
-from typing import List, Optional
+import struct
+from typing import List, Optional, Union
 
 from .buffer import Buffer
-from .connection import Connection
+from .connection import Connection, AsyncConnection
+from .exceptions import PyQ3SLTimeoutError
+from .instrumentation import get_instrumentation, timed_parse
 from .reader import Reader, EOFReader
 from .server import Server
+from .serverlist import ServerList
+from .timings import Timings
 
 
 class PrincipalServer:
@@ -26,13 +31,65 @@ class PrincipalServer:
         self.reader = reader
         self.connection = Connection(self.address, self.port, network_protocol, timeout)
 
+    def __repr__(self):
+        return f'{self.address}:{self.port}'
+
     def get_servers(
             self,
             query_protocol: int,
             game_name: str = '',
             keywords: str = 'full empty',
-            server_entry_prefix: Optional[bytes] = None
-    ) -> List[Server]:
+            server_entry_prefix: Optional[bytes] = None,
+            compact: bool = False,
+            timings: Optional[Timings] = None
+    ) -> Union[List[Server], ServerList]:
+        packet = self.build_query_packet(query_protocol, game_name, keywords)
+
+        # The connection is reused across queries, so only attach timings for the duration of this one
+        self.connection.timings = timings
+        try:
+            self.connection.write(packet)
+            buffer = self.reader.read(self.connection, b'\\')
+        except PyQ3SLTimeoutError as e:
+            get_instrumentation().timeout(self.address, self.port)
+            raise e
+        finally:
+            self.connection.timings = None
+
+        return timed_parse('servers', timings, self.parse_response, buffer, b'\\', server_entry_prefix, compact)
+
+    async def get_servers_async(
+            self,
+            query_protocol: int,
+            game_name: str = '',
+            keywords: str = 'full empty',
+            server_entry_prefix: Optional[bytes] = None,
+            compact: bool = False,
+            timings: Optional[Timings] = None
+    ) -> Union[List[Server], ServerList]:
+        connection = AsyncConnection(
+            self.address,
+            self.port,
+            self.connection.protocol,
+            self.connection.timeout,
+            timings
+        )
+
+        packet = self.build_query_packet(query_protocol, game_name, keywords)
+
+        try:
+            await connection.write(packet)
+            buffer = await self.reader.read_async(connection, b'\\')
+        except PyQ3SLTimeoutError as e:
+            get_instrumentation().timeout(self.address, self.port)
+            raise e
+        finally:
+            connection.close()
+
+        return timed_parse('servers', timings, self.parse_response, buffer, b'\\', server_entry_prefix, compact)
+
+    @staticmethod
+    def build_query_packet(query_protocol: int, game_name: str = '', keywords: str = 'full empty') -> bytes:
         buffer = Buffer(b'\xff' * 4)
         buffer.write_string('getservers ')
         # Add game name if set
@@ -41,14 +98,15 @@ class PrincipalServer:
         # Add query protocol and keywords
         buffer.write_string(f'{query_protocol} {keywords}')
 
-        self.connection.write(buffer.get_buffer())
-
-        buffer = self.reader.read(self.connection, b'\\')
-
-        return self.parse_response(buffer, b'\\', server_entry_prefix)
+        return bytes(buffer.get_buffer())
 
     @staticmethod
-    def parse_response(buffer: Buffer, delim: Optional[bytes] = None, prefix: Optional[bytes] = None) -> List[Server]:
+    def parse_response(
+            buffer: Buffer,
+            delim: Optional[bytes] = None,
+            prefix: Optional[bytes] = None,
+            compact: bool = False
+    ) -> Union[List[Server], ServerList]:
         delim_len = len(delim) if delim is not None else 0
         """
         Some 3rd party implementations of the protocol also prefix every server entry with the same
@@ -57,14 +115,20 @@ class PrincipalServer:
         prefix_len = len(prefix) if prefix is not None else 0
 
         # Servers are represented as six byte sequences, plus the length of any separator and prefix
-        servers: List[Server] = []
-        while buffer.has(6 + delim_len + prefix_len):
-            # Skip backspace delimiter and prefix
-            buffer.skip(delim_len + prefix_len)
-            ip, port = buffer.read_ip(), buffer.read_ushort()
+        skip = delim_len + prefix_len
+        entries = buffer.read(len(buffer) // (6 + skip) * (6 + skip))
 
-            # Init and append valid server
-            if ip != '0.0.0.0' and port != 0:
-                servers.append(Server(ip, port))
+        if compact:
+            # Keep addresses packed, only create server objects once they are accessed
+            servers = ServerList()
+            for ip, port in struct.iter_unpack(f'>{skip}xIH', entries):
+                if ip != 0 and port != 0:
+                    servers.append(ip, port)
+            return servers
 
-        return servers
+        # Decode all entries in bulk, skipping the backspace delimiter and prefix of each entry
+        return [
+            Server(socket.inet_ntoa(ip), port)
+            for ip, port in struct.iter_unpack(f'>{skip}x4sH', entries)
+            if ip != b'\x00\x00\x00\x00' and port != 0
+        ]
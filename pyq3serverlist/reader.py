@@ -1,10 +1,12 @@
 import socket
+import time
 from abc import abstractmethod
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
 from .exceptions import PyQ3SLError, PyQ3SLTimeoutError
-from .connection import Connection
+from .connection import Connection, AsyncConnection
 from .buffer import Buffer
+from .instrumentation import get_instrumentation
 
 
 class Reader:
@@ -12,29 +14,39 @@ class Reader:
     def read(self, connection: Connection, delim: Optional[bytes]) -> Buffer:
         pass
 
-    @staticmethod
-    def split_buffer(buffer: Buffer, require_header: bool, delim: Optional[bytes]) -> Tuple[bytes, bytes, bytes]:
-        header = b''
-        body = b''
+    @abstractmethod
+    async def read_async(self, connection: AsyncConnection, delim: Optional[bytes]) -> Buffer:
+        pass
 
+    @staticmethod
+    def split_buffer(
+            buffer: Buffer,
+            require_header: bool,
+            delim: Optional[bytes]
+    ) -> Tuple[memoryview, memoryview, memoryview]:
         has_header = buffer.peek(22) == (b'\xff' * 4 + b'getserversResponse')
         if require_header and not has_header:
             raise PyQ3SLError('Principal returned invalid data')
 
-        if has_header:
-            header += buffer.read(22)
+        header_length = 22 if has_header else 0
 
         """
-        To complete the header, read bytes until we see the first delimiter.
+        To complete the header, include all bytes until we see the first delimiter.
         Some principals also send a few extra bytes before the first server delimiter,
         Activision for example sends b'\n\x00'.
         """
-        while delim is not None and buffer.has() and buffer.peek(len(delim)) != delim:
-            header += buffer.read()
+        if delim is not None:
+            index = buffer.find(delim, header_length)
+            header_length = index if index != -1 else len(buffer)
 
-        # Read byte by byte until we reach the end or see some sort of end marker
-        while buffer.has() and buffer.peek(4) not in [b'\\EOF', b'\\EOT']:
-            body += buffer.read()
+        header = buffer.read(header_length)
+
+        # Body continues until we reach the end or see some sort of end marker
+        body_length = min(
+            (index for marker in [b'\\EOF', b'\\EOT'] if (index := buffer.find(marker)) != -1),
+            default=len(buffer)
+        )
+        body = buffer.read(body_length)
 
         # Read what's left of the buffer (if anything)
         tail = buffer.read(len(buffer))
@@ -56,32 +68,63 @@ class EOFReader(Reader):
         eof = False
         while not eof:
             buffer = connection.read()
+            eof = self.append_packet(response, buffer, udp or n == 0, delim)
+            n += 1
 
-            # Every UDP packet must start with a header. For TCP, only the first packet will start with a header.
-            _, body, tail = self.split_buffer(buffer, udp or n == 0, delim)
+        get_instrumentation().principal_response(connection.address, connection.port, n, len(response))
 
-            # Append body to response
-            response.write(body)
+        return response
+
+    async def read_async(self, connection: AsyncConnection, delim: Optional[bytes]) -> Buffer:
+        response = Buffer()
 
-            # Check whether the tail indicates the end of the response
-            if tail[:4] == b'\\EOF':
-                # EOF is clear, always indicates the end of the entire response.
-                eof = True
-            elif tail[:5] == b'\\EOT\x00':
-                # EOT can indicate either the end of the entire response or the end of a response packet (Activision).
-                # However, EOT followed by trailing nil-bytes always indicates the end of the response.
-                eof = True
+        udp = connection.protocol == socket.SOCK_DGRAM
 
+        n = 0
+        eof = False
+        while not eof:
+            buffer = await connection.read()
+            eof = self.append_packet(response, buffer, udp or n == 0, delim)
             n += 1
 
+        get_instrumentation().principal_response(connection.address, connection.port, n, len(response))
+
         return response
 
+    def append_packet(self, response: Buffer, buffer: Buffer, require_header: bool, delim: Optional[bytes]) -> bool:
+        # Every UDP packet must start with a header. For TCP, only the first packet will start with a header.
+        _, body, tail = self.split_buffer(buffer, require_header, delim)
+
+        # Append body to response
+        response.write(body)
+
+        # Check whether the tail indicates the end of the response
+        if tail[:4] == b'\\EOF':
+            # EOF is clear, always indicates the end of the entire response.
+            return True
+        elif tail[:5] == b'\\EOT\x00':
+            # EOT can indicate either the end of the entire response or the end of a response packet (Activision).
+            # However, EOT followed by trailing nil-bytes always indicates the end of the response.
+            return True
+
+        return False
+
 
 class TimeoutReader(Reader):
     """
     Reads server list response packets until the principal stops sending data.
     For principals that send (proper) EOF markers, use ``EOFReader`` instead.
+
+    By default, the connection's timeout is used while waiting for any packet. Since principals usually send all
+    packets in quick succession, a (much shorter) ``idle_timeout`` can be used to wait for packets after the first one.
+    A ``deadline`` limits the total time spent reading the response (in seconds, starting with the first read).
     """
+    idle_timeout: Optional[float]
+    deadline: Optional[float]
+
+    def __init__(self, idle_timeout: Optional[float] = None, deadline: Optional[float] = None):
+        self.idle_timeout = idle_timeout
+        self.deadline = deadline
 
     def read(self, connection: Connection, delim: Optional[bytes]) -> Buffer:
         response = Buffer()
@@ -91,9 +134,10 @@ class TimeoutReader(Reader):
         n = 0
         last_length = 0
         end = False
+        started = time.monotonic()
         while not end:
             try:
-                buffer = connection.read()
+                buffer = connection.read(self.next_timeout(connection, n, started))
             except PyQ3SLTimeoutError as e:
                 # Re-raise exception if we did not read any packets at all.
                 if n == 0:
@@ -103,10 +147,40 @@ class TimeoutReader(Reader):
             length = len(buffer)
 
             # Every UDP packet must start with a header. For TCP, only the first packet will start with a header.
-            _, body, _ = self.split_buffer(buffer, udp or n == 0, delim)
+            self.append_packet(response, buffer, udp or n == 0, delim)
+
+            # Continue to try reading from socket until packets get shorter
+            end = n > 0 and length < last_length
+
+            n = n + 1
+            last_length = length
 
-            # Append body to response
-            response.write(body)
+        get_instrumentation().principal_response(connection.address, connection.port, n, len(response))
+
+        return response
+
+    async def read_async(self, connection: AsyncConnection, delim: Optional[bytes]) -> Buffer:
+        response = Buffer()
+
+        udp = connection.protocol == socket.SOCK_DGRAM
+
+        n = 0
+        last_length = 0
+        end = False
+        started = time.monotonic()
+        while not end:
+            try:
+                buffer = await connection.read(self.next_timeout(connection, n, started))
+            except PyQ3SLTimeoutError as e:
+                # Re-raise exception if we did not read any packets at all.
+                if n == 0:
+                    raise e
+                break
+
+            length = len(buffer)
+
+            # Every UDP packet must start with a header. For TCP, only the first packet will start with a header.
+            self.append_packet(response, buffer, udp or n == 0, delim)
 
             # Continue to try reading from socket until packets get shorter
             end = n > 0 and length < last_length
@@ -114,4 +188,23 @@ class TimeoutReader(Reader):
             n = n + 1
             last_length = length
 
+        get_instrumentation().principal_response(connection.address, connection.port, n, len(response))
+
         return response
+
+    def next_timeout(self, connection: Union[Connection, AsyncConnection], n: int, started: float) -> float:
+        timeout = self.idle_timeout if n > 0 and self.idle_timeout is not None else connection.timeout
+        if self.deadline is None:
+            return timeout
+
+        remaining = started + self.deadline - time.monotonic()
+        if remaining <= 0:
+            raise PyQ3SLTimeoutError('Deadline exceeded while receiving server data')
+
+        return min(timeout, remaining)
+
+    def append_packet(self, response: Buffer, buffer: Buffer, require_header: bool, delim: Optional[bytes]) -> None:
+        _, body, _ = self.split_buffer(buffer, require_header, delim)
+
+        # Append body to response
+        response.write(body)
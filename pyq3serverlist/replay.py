@@ -0,0 +1,235 @@
+import socket
+import struct
+import threading
+import time
+from typing import BinaryIO, Iterable, List, Optional
+
+from .buffer import Buffer
+from .exceptions import PyQ3SLError, PyQ3SLTimeoutError
+from .timings import Timings
+
+MAGIC = b'PQ3SLREC\x01'
+SENT = 0
+RECEIVED = 1
+
+# timestamp, direction, protocol, port, address length, data length
+RECORD_HEADER = struct.Struct('>dBBHBI')
+
+
+class PacketRecord:
+    timestamp: float
+    direction: int
+    protocol: socket.SocketKind
+    address: str
+    port: int
+    data: bytes
+
+    def __init__(
+            self,
+            timestamp: float,
+            direction: int,
+            protocol: socket.SocketKind,
+            address: str,
+            port: int,
+            data: bytes
+    ):
+        self.timestamp = timestamp
+        self.direction = direction
+        self.protocol = protocol
+        self.address = address
+        self.port = port
+        self.data = data
+
+    def __repr__(self):
+        direction = 'sent' if self.direction == SENT else 'received'
+        return f'PacketRecord({self.timestamp:.6f}, {direction}, {self.address}:{self.port}, {len(self.data)} bytes)'
+
+
+class PacketRecorder:
+    """
+    Records every datagram/segment sent or received by any ``Connection`` or ``AsyncConnection`` to a compact binary
+    file while recording is active (between ``start`` and ``stop``, or inside a ``with`` block). Timestamps are
+    relative to the start of the recording. Recordings can be loaded using ``read_records`` and replayed via
+    ``ReplayConnection``.
+    """
+    path: str
+    file: Optional[BinaryIO]
+    started: float
+    lock: threading.Lock
+
+    def __init__(self, path: str):
+        self.path = path
+        self.file = None
+        self.started = 0.0
+        self.lock = threading.Lock()
+
+    def __enter__(self) -> 'PacketRecorder':
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        try:
+            self.file = open(self.path, 'wb')
+        except OSError as e:
+            raise PyQ3SLError(f'Failed to open recording {self.path} ({e})')
+
+        self.file.write(MAGIC)
+        self.started = time.perf_counter()
+        set_recorder(self)
+
+    def stop(self) -> None:
+        set_recorder(None)
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+    def record(self, direction: int, protocol: socket.SocketKind, address: str, port: int, data: bytes) -> None:
+        timestamp = time.perf_counter() - self.started
+        encoded = address.encode()
+        header = RECORD_HEADER.pack(timestamp, direction, int(protocol), port, len(encoded), len(data))
+        with self.lock:
+            if self.file is not None:
+                self.file.write(header + encoded + bytes(data))
+
+
+_recorder: Optional[PacketRecorder] = None
+
+
+def get_recorder() -> Optional[PacketRecorder]:
+    return _recorder
+
+
+def set_recorder(recorder: Optional[PacketRecorder]) -> None:
+    global _recorder
+    _recorder = recorder
+
+
+def read_records(path: str) -> List[PacketRecord]:
+    try:
+        with open(path, 'rb') as file:
+            data = file.read()
+    except OSError as e:
+        raise PyQ3SLError(f'Failed to read recording {path} ({e})')
+
+    if data[:len(MAGIC)] != MAGIC:
+        raise PyQ3SLError(f'File {path} is not a packet recording')
+
+    records = []
+    view = memoryview(data)
+    offset = len(MAGIC)
+    while offset < len(data):
+        if offset + RECORD_HEADER.size > len(data):
+            raise PyQ3SLError(f'Packet recording {path} is truncated')
+        timestamp, direction, protocol, port, address_length, data_length = RECORD_HEADER.unpack_from(view, offset)
+        offset += RECORD_HEADER.size
+        address = str(view[offset:offset + address_length], 'utf-8')
+        offset += address_length
+        payload = bytes(view[offset:offset + data_length])
+        offset += data_length
+        if len(payload) != data_length:
+            raise PyQ3SLError(f'Packet recording {path} is truncated')
+        records.append(PacketRecord(timestamp, direction, socket.SocketKind(protocol), address, port, payload))
+
+    return records
+
+
+class ReplayConnection:
+    """
+    Stands in for ``Connection``, replaying recorded packets of a single address, port and protocol. Every write skips
+    ahead to the next recorded query, every read returns the next packet received in response to it. If no (further)
+    packet was received in response, reading times out right away.
+
+    With ``realtime`` enabled, reads are delayed to reproduce the recorded time between a query and each response
+    packet (timing out if that exceeds the read timeout). Otherwise, packets are replayed as fast as possible.
+    """
+    address: str
+    port: int
+    protocol: socket.SocketKind
+    timeout: float
+    realtime: bool
+    timings: Optional[Timings]
+    records: List[PacketRecord]
+    index: int
+    sent_timestamp: float
+    sent_at: float
+
+    def __init__(
+            self,
+            records: Iterable[PacketRecord],
+            address: str,
+            port: int,
+            protocol: socket.SocketKind = socket.SOCK_DGRAM,
+            timeout: float = 1.0,
+            realtime: bool = False
+    ):
+        self.address = address
+        self.port = port
+        self.protocol = protocol
+        self.timeout = timeout
+        self.realtime = realtime
+        self.timings = None
+
+        self.records = [
+            record for record in records
+            if record.address == address and record.port == port and record.protocol == protocol
+        ]
+        self.index = 0
+        self.sent_timestamp = 0.0
+        self.sent_at = time.perf_counter()
+
+    @classmethod
+    def from_file(
+            cls,
+            path: str,
+            address: str,
+            port: int,
+            protocol: socket.SocketKind = socket.SOCK_DGRAM,
+            timeout: float = 1.0,
+            realtime: bool = False
+    ) -> 'ReplayConnection':
+        return cls(read_records(path), address, port, protocol, timeout, realtime)
+
+    def connect(self) -> None:
+        pass
+
+    def write(self, data: bytes) -> None:
+        # Skip any responses which were not read, as well as the recorded query itself
+        while self.index < len(self.records):
+            record = self.records[self.index]
+            self.index += 1
+            if record.direction == SENT:
+                self.sent_timestamp = record.timestamp
+                break
+        else:
+            raise PyQ3SLError(f'Recording does not contain any further queries to {self.address}:{self.port}')
+
+        self.sent_at = time.perf_counter()
+
+    def read(self, timeout: Optional[float] = None) -> Buffer:
+        timeout = timeout if timeout is not None else self.timeout
+        record = self.records[self.index] if self.index < len(self.records) else None
+        if record is None or record.direction != RECEIVED:
+            if self.realtime:
+                time.sleep(timeout)
+            raise PyQ3SLTimeoutError('Timed out while receiving server data')
+
+        if self.realtime:
+            delay = self.sent_at + record.timestamp - self.sent_timestamp - time.perf_counter()
+            if delay > timeout:
+                time.sleep(timeout)
+                raise PyQ3SLTimeoutError('Timed out while receiving server data')
+            if delay > 0:
+                time.sleep(delay)
+
+        self.index += 1
+        if self.timings is not None:
+            self.timings.received(time.perf_counter() - self.sent_at)
+
+        return Buffer(record.data)
+
+    def close(self) -> bool:
+        return True
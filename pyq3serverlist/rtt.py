@@ -0,0 +1,79 @@
+import socket
+import struct
+import threading
+from typing import Dict, Hashable, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .server import Server
+
+
+class RTTEstimate:
+    srtt: float
+    rttvar: float
+    rto: float
+
+    def __init__(self, srtt: float, rttvar: float, rto: float):
+        self.srtt = srtt
+        self.rttvar = rttvar
+        self.rto = rto
+
+
+class RTOEstimator:
+    """
+    Estimates retransmission timeouts from measured round trip times, the same way TCP does (RFC 6298): the timeout is
+    the smoothed RTT plus four times the RTT variance. Estimates are kept per server or, if ``prefix_length`` is set,
+    per IPv4 network prefix (e.g. per /24), so servers without any samples yet can benefit from their neighbours.
+    Servers without any estimate use ``initial_timeout``.
+    """
+    initial_timeout: float
+    min_timeout: float
+    max_timeout: float
+    prefix_length: Optional[int]
+    estimates: Dict[Hashable, RTTEstimate]
+    lock: threading.Lock
+
+    def __init__(
+            self,
+            initial_timeout: float = 1.0,
+            min_timeout: float = 0.05,
+            max_timeout: float = 5.0,
+            prefix_length: Optional[int] = None
+    ):
+        self.initial_timeout = initial_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.prefix_length = prefix_length
+        self.estimates = {}
+        self.lock = threading.Lock()
+
+    def key(self, server: 'Server') -> Hashable:
+        if self.prefix_length is None:
+            return server.ip, server.port
+
+        try:
+            ip, *_ = struct.unpack('>I', socket.inet_aton(server.ip))
+        except OSError:
+            # Cannot determine prefix for hostnames, fall back to estimating per server
+            return server.ip, server.port
+
+        return ip >> (32 - self.prefix_length)
+
+    def timeout(self, server: 'Server', attempt: int = 0) -> float:
+        """
+        Timeout to use for the given (zero based) attempt, doubling the timeout for every retransmission.
+        """
+        estimate = self.estimates.get(self.key(server))
+        rto = estimate.rto if estimate is not None else self.initial_timeout
+        return min(self.max_timeout, rto * 2 ** attempt)
+
+    def update(self, server: 'Server', rtt: float) -> None:
+        key = self.key(server)
+        with self.lock:
+            estimate = self.estimates.get(key)
+            if estimate is None:
+                estimate = self.estimates[key] = RTTEstimate(rtt, rtt / 2, 0.0)
+            else:
+                estimate.rttvar = 0.75 * estimate.rttvar + 0.25 * abs(estimate.srtt - rtt)
+                estimate.srtt = 0.875 * estimate.srtt + 0.125 * rtt
+
+            estimate.rto = max(self.min_timeout, min(self.max_timeout, estimate.srtt + 4 * estimate.rttvar))
@@ -0,0 +1,227 @@
+import selectors
+import socket
+import time
+from collections import OrderedDict, deque
+from itertools import cycle
+from typing import Deque, Dict, Generator, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .buffer import Buffer
+from .exceptions import PyQ3SLError, PyQ3SLTimeoutError
+from .instrumentation import Instrumentation, get_instrumentation, timed_parse
+from .logger import logger
+from .server import Server
+
+Address = Tuple[str, int]
+
+# Receive buffer size requested for every socket (the kernel may grant less, e.g. limited by net.core.rmem_max on Linux)
+RECEIVE_BUFFER_SIZE = 4 * 1024 * 1024
+# Receive buffer space to reserve per query awaiting a reply (status responses plus the kernel's per-datagram overhead)
+REPLY_BUFFER_SIZE = 4096
+# Time after sending during which a reply is expected, unanswered queries only take up receive buffer space until then
+REPLY_WINDOW = 0.25
+
+
+class StatusScanner:
+    """
+    Queries the status of many servers using a few unconnected UDP sockets. Replies are matched back to their server
+    by source address and yielded as they arrive. Since every query uses the same timeout, deadlines are reached in
+    the order queries were sent, so a single FIFO of deadlines replaces per-socket timeouts.
+
+    Replies which do not fit into the sockets' receive buffers are dropped by the kernel, turning responsive servers
+    into timeouts. Unless ``max_in_flight`` is given, the number of queries awaiting a reply is therefore limited to
+    what the receive buffers granted by the kernel can hold. Queries only count as awaiting a reply until they are
+    answered or ``REPLY_WINDOW`` seconds have passed, so unresponsive servers do not hold up the scan (they still time
+    out after ``timeout`` seconds).
+    """
+    timeout: float
+    strip_colors: bool
+    sockets: int
+    max_in_flight: Optional[int]
+
+    def __init__(
+            self,
+            timeout: float = 1.0,
+            strip_colors: bool = True,
+            sockets: int = 1,
+            max_in_flight: Optional[int] = None
+    ):
+        self.timeout = timeout
+        self.strip_colors = strip_colors
+        self.sockets = sockets
+        self.max_in_flight = max_in_flight
+
+    def scan(self, servers: Iterable[Server]) -> Iterator[Tuple[Server, Union[dict, PyQ3SLError]]]:
+        """
+        Yield ``(server, result)`` tuples in order of completion, where result is either the parsed status or the
+        error that occurred while querying the server. Servers sharing the address of a pending query are not queried
+        again, but yielded with the result of that query.
+        """
+        socks: List[socket.socket] = []
+        selector = selectors.DefaultSelector()
+        try:
+            for _ in range(max(1, self.sockets)):
+                sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                sock.setblocking(False)
+                try:
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECEIVE_BUFFER_SIZE)
+                except OSError:
+                    # Keep the default receive buffer size, max_in_flight is derived from it below
+                    pass
+                sock.bind(('', 0))
+                selector.register(sock, selectors.EVENT_READ)
+                socks.append(sock)
+
+            max_in_flight = self.max_in_flight
+            if max_in_flight is None:
+                granted = sum(sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF) for sock in socks)
+                max_in_flight = max(1, granted // REPLY_BUFFER_SIZE)
+                logger.debug('Limiting status queries awaiting a reply to %d (%d bytes of receive buffer)',
+                             max_in_flight, granted)
+
+            yield from self._scan(iter(servers), socks, selector, max_in_flight)
+        finally:
+            selector.close()
+            for sock in socks:
+                sock.close()
+
+    def _scan(
+            self,
+            servers: Iterator[Server],
+            socks: List[socket.socket],
+            selector: selectors.BaseSelector,
+            max_in_flight: int
+    ) -> Iterator[Tuple[Server, Union[dict, PyQ3SLError]]]:
+        pending: Dict[Address, Tuple[List[Server], float]] = {}
+        deadlines: Deque[Tuple[float, Address]] = deque()
+        awaiting: 'OrderedDict[Address, float]' = OrderedDict()
+        sockets = cycle(socks)
+        window = min(self.timeout, REPLY_WINDOW)
+        instrumentation = get_instrumentation()
+
+        exhausted = False
+        while not exhausted or pending:
+            # Queries not answered within the reply window are unlikely to be answered at all (or answered much later),
+            # so stop reserving receive buffer space for them
+            cutoff = time.monotonic() - window
+            while awaiting and next(iter(awaiting.values())) < cutoff:
+                awaiting.popitem(last=False)
+
+            if not exhausted:
+                exhausted = yield from self._send(
+                    servers, sockets, pending, deadlines, awaiting, max_in_flight, instrumentation
+                )
+
+            if not pending:
+                continue
+
+            wait = deadlines[0][0]
+            if not exhausted and len(awaiting) >= max_in_flight:
+                # Wake up to send further queries once the oldest query awaiting a reply leaves the reply window
+                wait = min(wait, next(iter(awaiting.values())) + window)
+            for key, _ in selector.select(max(0.0, wait - time.monotonic())):
+                yield from self._receive(key.fileobj, pending, awaiting, instrumentation)
+
+            yield from self._expire(pending, deadlines, awaiting, instrumentation)
+
+    def _send(
+            self,
+            servers: Iterator[Server],
+            sockets: Iterator[socket.socket],
+            pending: Dict[Address, Tuple[List[Server], float]],
+            deadlines: Deque[Tuple[float, Address]],
+            awaiting: 'OrderedDict[Address, float]',
+            max_in_flight: int,
+            instrumentation: Instrumentation
+    ) -> Generator[Tuple[Server, PyQ3SLError], None, bool]:
+        """
+        Top up queries awaiting a reply, yielding servers which could not be queried. Returns whether all servers have
+        been queried.
+        """
+        while len(awaiting) < max_in_flight:
+            server = next(servers, None)
+            if server is None:
+                return True
+
+            try:
+                address = (socket.gethostbyname(server.ip), server.port)
+            except socket.error as e:
+                yield server, PyQ3SLError(f'Failed to resolve {server.ip} ({e})')
+                continue
+
+            # Servers with the same address as a pending query share its result rather than querying the address again
+            if address in pending:
+                pending[address][0].append(server)
+                continue
+
+            packet = server.build_query_packet()
+            try:
+                next(sockets).sendto(packet, address)
+            except socket.error:
+                yield server, PyQ3SLError('Failed to send data to server')
+                continue
+
+            logger.debug('Sent status query to %s:%d', *address)
+            instrumentation.query_sent(address[0], address[1], len(packet))
+
+            sent = time.monotonic()
+            pending[address] = ([server], sent)
+            awaiting[address] = sent
+            deadlines.append((sent + self.timeout, address))
+
+        return False
+
+    @staticmethod
+    def _expire(
+            pending: Dict[Address, Tuple[List[Server], float]],
+            deadlines: Deque[Tuple[float, Address]],
+            awaiting: 'OrderedDict[Address, float]',
+            instrumentation: Instrumentation
+    ) -> Iterator[Tuple[Server, PyQ3SLError]]:
+        # Expire queries which did not receive a reply in time (entries of answered queries are skipped lazily)
+        now = time.monotonic()
+        while deadlines and (deadlines[0][1] not in pending or deadlines[0][0] <= now):
+            _, address = deadlines.popleft()
+            entry = pending.pop(address, None)
+            if entry is not None:
+                awaiting.pop(address, None)
+                instrumentation.timeout(*address)
+                for server in entry[0]:
+                    yield server, PyQ3SLTimeoutError('Timed out while receiving server data')
+
+    def _receive(
+            self,
+            sock: socket.socket,
+            pending: Dict[Address, Tuple[List[Server], float]],
+            awaiting: 'OrderedDict[Address, float]',
+            instrumentation: Instrumentation
+    ) -> Iterator[Tuple[Server, Union[dict, PyQ3SLError]]]:
+        while True:
+            try:
+                # Packet size differs from server to server => read up to max possible UDP size
+                data, address = sock.recvfrom(65507)
+            except BlockingIOError:
+                return
+            except socket.error:
+                # Some platforms report ICMP errors for earlier datagrams on unconnected sockets, ignore those
+                continue
+
+            entry = pending.pop(address, None)
+            if entry is None:
+                logger.debug('Ignoring unexpected data from %s:%d', *address)
+                continue
+
+            awaiting.pop(address, None)
+            servers, sent = entry
+            instrumentation.response_received(address[0], address[1], len(data), time.monotonic() - sent)
+
+            # Parse the reply once per server class, servers with duplicate addresses share the result
+            results: Dict[type, Union[dict, PyQ3SLError]] = {}
+            for server in servers:
+                if type(server) not in results:
+                    try:
+                        results[type(server)] = timed_parse(
+                            'status', None, server.parse_response, Buffer(data), self.strip_colors
+                        )
+                    except PyQ3SLError as e:
+                        results[type(server)] = e
+                yield server, results[type(server)]
@@ -0,0 +1,212 @@
+import asyncio
+import heapq
+import random
+import time
+from typing import AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from .exceptions import PyQ3SLError
+from .logger import logger
+from .server import Server
+from .status import Status
+
+
+class ServerSchedule:
+    server: Server
+    interval: float
+    due: float
+    failures: int
+    fingerprint: Optional[tuple]
+
+    def __init__(self, server: Server, due: float):
+        self.server = server
+        self.interval = 0.0
+        self.due = due
+        self.failures = 0
+        self.fingerprint = None
+
+
+class StatusScheduler:
+    """
+    Continuously queries the status of a set of servers, adapting every server's poll interval to its activity.
+
+    Servers whose status changed since the last query are polled again after ``min_interval``. Unchanged servers are
+    polled less and less often (up to ``populated_max_interval`` if players are online, ``max_interval`` otherwise).
+    Failing servers are backed off exponentially, up to ``max_backoff``. All intervals are jittered to spread out load.
+    Queries are sent at no more than ``max_qps`` queries per second overall.
+    """
+    min_interval: float
+    populated_max_interval: float
+    max_interval: float
+    max_backoff: float
+    max_qps: float
+    jitter: float
+    timeout: float
+    strip_colors: bool
+    rng: random.Random
+    schedules: Dict[Server, ServerSchedule]
+    heap: List[Tuple[float, int, Server]]
+    sequence: int
+    results: Optional['asyncio.Queue[Tuple[Server, Union[dict, Status, PyQ3SLError]]]']
+    wakeup: Optional[asyncio.Event]
+    tasks: set
+    running: bool
+
+    def __init__(
+            self,
+            servers: Iterable[Server] = (),
+            min_interval: float = 5.0,
+            populated_max_interval: float = 30.0,
+            max_interval: float = 300.0,
+            max_backoff: float = 3600.0,
+            max_qps: float = 100.0,
+            jitter: float = 0.1,
+            timeout: float = 1.0,
+            strip_colors: bool = True,
+            rng: Optional[random.Random] = None
+    ):
+        self.min_interval = min_interval
+        self.populated_max_interval = populated_max_interval
+        self.max_interval = max_interval
+        self.max_backoff = max_backoff
+        self.max_qps = max_qps
+        self.jitter = jitter
+        self.timeout = timeout
+        self.strip_colors = strip_colors
+        self.rng = rng if rng is not None else random.Random()
+
+        self.schedules = {}
+        self.heap = []
+        self.sequence = 0
+        self.results = None
+        self.wakeup = None
+        self.tasks = set()
+        self.running = False
+
+        for server in servers:
+            self.add(server)
+
+    def add(self, server: Server) -> None:
+        if server in self.schedules:
+            return
+
+        schedule = ServerSchedule(server, time.monotonic())
+        self.schedules[server] = schedule
+        self.push(schedule)
+        # Servers added while running are due right away, so do not wait for the next server to come up
+        if self.wakeup is not None:
+            self.wakeup.set()
+
+    def remove(self, server: Server) -> None:
+        # Heap entries of removed servers are skipped once they come up
+        self.schedules.pop(server, None)
+
+    def stop(self) -> None:
+        self.running = False
+        if self.wakeup is not None:
+            self.wakeup.set()
+
+    async def __aiter__(self) -> AsyncIterator[Tuple[Server, Union[dict, Status, PyQ3SLError]]]:
+        """
+        Run the scheduler, yielding ``(server, result)`` tuples as queries complete (until ``stop`` is called).
+        """
+        self.results = asyncio.Queue()
+        loop = asyncio.ensure_future(self.loop())
+        try:
+            while not loop.done() or not self.results.empty():
+                get = asyncio.ensure_future(self.results.get())
+                await asyncio.wait([get, loop], return_when=asyncio.FIRST_COMPLETED)
+                if get.done():
+                    yield get.result()
+                else:
+                    get.cancel()
+        finally:
+            self.stop()
+            await loop
+
+    async def run(self, callback: Callable[[Server, Union[dict, Status, PyQ3SLError]], None]) -> None:
+        async for server, result in self:
+            callback(server, result)
+
+    async def loop(self) -> None:
+        self.running = True
+        self.wakeup = asyncio.Event()
+        last_sent = 0.0
+        try:
+            while self.running:
+                schedule = self.next_due()
+                now = time.monotonic()
+                # Respect global query budget as well as the server's own schedule
+                delay = max(schedule.due - now if schedule is not None else 1.0, last_sent + 1 / self.max_qps - now)
+                if delay > 0:
+                    self.wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self.wakeup.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                heapq.heappop(self.heap)
+                last_sent = now
+                task = asyncio.ensure_future(self.query(schedule))
+                self.tasks.add(task)
+                task.add_done_callback(self.tasks.discard)
+        finally:
+            self.running = False
+            for task in list(self.tasks):
+                task.cancel()
+            await asyncio.gather(*self.tasks, return_exceptions=True)
+
+    def next_due(self) -> Optional[ServerSchedule]:
+        while self.heap:
+            due, _, server = self.heap[0]
+            schedule = self.schedules.get(server)
+            # Skip entries of removed (or removed and re-added) servers
+            if schedule is not None and schedule.due == due:
+                return schedule
+            heapq.heappop(self.heap)
+
+        return None
+
+    async def query(self, schedule: ServerSchedule) -> None:
+        result: Union[dict, Status, PyQ3SLError] = PyQ3SLError('Status query did not complete')
+        try:
+            result = await schedule.server.get_status_async(self.strip_colors, self.timeout)
+        except PyQ3SLError as e:
+            result = e
+        finally:
+            # Always reschedule, so a query failing unexpectedly (or being cancelled) does not drop the server
+            self.reschedule(schedule, result)
+
+        await self.results.put((schedule.server, result))
+
+    def reschedule(self, schedule: ServerSchedule, result: Union[dict, Status, PyQ3SLError]) -> None:
+        schedule.interval = self.next_interval(schedule, result)
+        schedule.due = time.monotonic() + schedule.interval
+        if schedule.server in self.schedules:
+            self.push(schedule)
+            if self.wakeup is not None:
+                self.wakeup.set()
+
+    def next_interval(self, schedule: ServerSchedule, result: Union[dict, Status, PyQ3SLError]) -> float:
+        if isinstance(result, PyQ3SLError):
+            schedule.failures += 1
+            logger.debug('Backing off %s after %d failure(s) (%s)', schedule.server, schedule.failures, result)
+            # Cap the exponent, since the backoff would overflow a float after about a thousand failures
+            interval = min(self.max_backoff, self.min_interval * 2 ** min(schedule.failures, 32))
+        else:
+            schedule.failures = 0
+            players = result.get('players', [])
+            fingerprint = (result.get('mapname'), tuple(sorted(str(player.get('name')) for player in players)))
+            if fingerprint != schedule.fingerprint:
+                interval = self.min_interval
+            elif len(players) > 0:
+                interval = min(self.populated_max_interval, schedule.interval * 2)
+            else:
+                interval = min(self.max_interval, schedule.interval * 2)
+            schedule.fingerprint = fingerprint
+
+        return interval * (1 + self.rng.uniform(-self.jitter, self.jitter))
+
+    def push(self, schedule: ServerSchedule) -> None:
+        self.sequence += 1
+        heapq.heappush(self.heap, (schedule.due, self.sequence, schedule.server))
@@ -1,12 +1,30 @@
 import socket
-from typing import Any
+import struct
+import time
+from typing import Any, Iterable, Optional, Tuple, Union
 
 from .buffer import Buffer
-from .connection import Connection
-from .exceptions import PyQ3SLError
+from .connection import Connection, AsyncConnection
+from .exceptions import PyQ3SLError, PyQ3SLTimeoutError
+from .instrumentation import get_instrumentation, timed_parse
+from .logger import logger
+from .rtt import RTOEstimator
+from .status import Status, strip_color_codes
+from .timings import Timings
+
+PLAYERS_MODES = ('full', 'count', 'none')
 
 
 class Server:
+    """
+    Game server identified by ip and port. Servers are hashable and should be treated as immutable,
+    so they can be used to deduplicate and index large collections of servers.
+    """
+    __slots__ = ('ip', 'port')
+
+    # A player with 0 frags, 0 ping and an empty name (0 0 ""), shorter lines are trailing garbage
+    MIN_PLAYER_LINE_LENGTH = 6
+
     ip: str
     port: int
 
@@ -14,7 +32,6 @@ class Server:
         self.ip = ip
         self.port = port
 
-
     def __repr__(self):
         return f'{self.ip}:{self.port}'
 
@@ -27,22 +44,171 @@ class Server:
             other.ip == self.ip and \
             other.port == self.port
 
-    def get_status(self, strip_colors: bool = True, timeout: float = 1.0):
-        connection = Connection(self.ip, self.port, socket.SOCK_DGRAM, timeout)
+    def __hash__(self):
+        return hash((self.ip, self.port))
+
+    @property
+    def key(self) -> int:
+        """
+        Compact integer key combining the IPv4 address and port (``ip << 16 | port``).
+        """
+        try:
+            ip, *_ = struct.unpack('>I', socket.inet_aton(self.ip))
+        except OSError:
+            raise PyQ3SLError(f'Cannot build key for non-IPv4 address {self.ip}')
+
+        return (ip << 16) | self.port
+
+    @classmethod
+    def from_key(cls, key: int) -> 'Server':
+        return cls(socket.inet_ntoa(struct.pack('>I', key >> 16)), key & 0xffff)
+
+    def get_status(
+            self,
+            strip_colors: bool = True,
+            timeout: float = 1.0,
+            lazy: bool = False,
+            fields: Optional[Iterable[str]] = None,
+            players: str = 'full',
+            retries: int = 0,
+            rto: Optional[RTOEstimator] = None,
+            timings: Optional[Timings] = None
+    ) -> Union[dict, Status]:
+        # Fail before querying the server, rather than only once the response is parsed
+        check_players_mode(players)
+        connection = Connection(self.ip, self.port, socket.SOCK_DGRAM, timeout, timings)
+
+        packet = self.build_query_packet()
+
+        result = self.query(connection, packet, retries, rto)
+        return timed_parse('status', timings, self.parse_response, result, strip_colors, lazy, fields, players)
+
+    async def get_status_async(
+            self,
+            strip_colors: bool = True,
+            timeout: float = 1.0,
+            lazy: bool = False,
+            fields: Optional[Iterable[str]] = None,
+            players: str = 'full',
+            retries: int = 0,
+            rto: Optional[RTOEstimator] = None,
+            timings: Optional[Timings] = None
+    ) -> Union[dict, Status]:
+        check_players_mode(players)
+        connection = AsyncConnection(self.ip, self.port, socket.SOCK_DGRAM, timeout, timings)
 
         packet = self.build_query_packet()
 
-        connection.write(packet)
-        result = connection.read()
-        return self.parse_response(result, strip_colors)
+        result = await self.query_async(connection, packet, retries, rto)
+        return timed_parse('status', timings, self.parse_response, result, strip_colors, lazy, fields, players)
+
+    def get_info(
+            self,
+            strip_colors: bool = True,
+            timeout: float = 1.0,
+            retries: int = 0,
+            rto: Optional[RTOEstimator] = None,
+            timings: Optional[Timings] = None
+    ) -> dict:
+        connection = Connection(self.ip, self.port, socket.SOCK_DGRAM, timeout, timings)
+
+        packet = self.build_info_query_packet()
+
+        result = self.query(connection, packet, retries, rto)
+        return timed_parse('info', timings, self.parse_info_response, result, strip_colors)
+
+    async def get_info_async(
+            self,
+            strip_colors: bool = True,
+            timeout: float = 1.0,
+            retries: int = 0,
+            rto: Optional[RTOEstimator] = None,
+            timings: Optional[Timings] = None
+    ) -> dict:
+        connection = AsyncConnection(self.ip, self.port, socket.SOCK_DGRAM, timeout, timings)
 
-    def parse_response(self, buffer: Buffer, strip_colors: bool) -> dict:
+        packet = self.build_info_query_packet()
+
+        result = await self.query_async(connection, packet, retries, rto)
+        return timed_parse('info', timings, self.parse_info_response, result, strip_colors)
+
+    def query(self, connection: Connection, packet: bytes, retries: int, rto: Optional[RTOEstimator]) -> Buffer:
+        """
+        Send the query packet and read the response, retransmitting the packet up to retries times if no response is
+        received in time. If an RTO estimator is given, it determines the timeout of each attempt and is updated with
+        the measured round trip time.
+        """
+        for attempt in range(retries + 1):
+            read_timeout = rto.timeout(self, attempt) if rto is not None else None
+            sent = time.perf_counter()
+            connection.write(packet)
+            try:
+                buffer = connection.read(read_timeout)
+            except PyQ3SLTimeoutError as e:
+                get_instrumentation().timeout(self.ip, self.port)
+                if attempt == retries:
+                    raise e
+                logger.debug('Retransmitting query to %s (attempt %d of %d)', self, attempt + 2, retries + 1)
+                continue
+
+            # Only use round trip times of queries that were not retransmitted, since responses are ambiguous otherwise
+            if rto is not None and attempt == 0:
+                rto.update(self, time.perf_counter() - sent)
+
+            return buffer
+
+    async def query_async(
+            self,
+            connection: AsyncConnection,
+            packet: bytes,
+            retries: int = 0,
+            rto: Optional[RTOEstimator] = None
+    ) -> Buffer:
+        """
+        Asyncio based equivalent of ``query``, closing the connection once done.
+        """
+        try:
+            for attempt in range(retries + 1):
+                read_timeout = rto.timeout(self, attempt) if rto is not None else None
+                sent = time.perf_counter()
+                await connection.write(packet)
+                try:
+                    buffer = await connection.read(read_timeout)
+                except PyQ3SLTimeoutError as e:
+                    get_instrumentation().timeout(self.ip, self.port)
+                    if attempt == retries:
+                        raise e
+                    logger.debug('Retransmitting query to %s (attempt %d of %d)', self, attempt + 2, retries + 1)
+                    continue
+
+                # Only use round trip times of queries that were not retransmitted (see query)
+                if rto is not None and attempt == 0:
+                    rto.update(self, time.perf_counter() - sent)
+
+                return buffer
+        finally:
+            connection.close()
+
+    def parse_response(
+            self,
+            buffer: Buffer,
+            strip_colors: bool,
+            lazy: bool = False,
+            fields: Optional[Iterable[str]] = None,
+            players: str = 'full'
+    ) -> Union[dict, Status]:
         """
         Response should consist of at least three lines:
         1: header indicating response type
         2: list of server variables, delimited by \
         3+: lines containing player info (final player line being empty)
+
+        If lazy is set, a ``Status`` is returned, which only strips colors from fields that are actually accessed.
+        If fields are given, only those server variables are included. Players are either parsed in full ('full'),
+        only counted without being parsed ('count', returned as 'num_players') or skipped entirely ('none').
         """
+        check_players_mode(players)
+
         # Make sure header indicates status response as type
         if not self.has_valid_response_header(buffer):
             raise PyQ3SLError('Server returned invalid packet header')
@@ -51,65 +217,136 @@ class Server:
         if not self.has_valid_response_body(buffer):
             raise PyQ3SLError('Server returned invalid packet body')
 
-        # Parse variable keys and values
-        i = 0
-        keys = []
-        values = []
-        while buffer.peek(1) == b'\\':
-            """
-            Skip the \\ indicating the start of the key/value and use
-            a) all bytes until the next separator (anything but the last value
-            or
-            b) all bytes until the next linebreak (last value)
-            as the key/value
-            """
-            buffer.skip(1)
-            element = buffer.read_string([b'\\', b'\n'], strip_colors=strip_colors)
-            if i % 2 == 0:
-                keys.append(element)
-            else:
-                values.append(element)
-
-            i += 1
-
-        players = []
-        # A player with 0 frags, 0 ping and an empty name would take up 7 bytes plus the line break
-        while buffer.peek(1) == b'\n' and buffer.has(8):
-            player = self.parse_player(buffer, strip_colors)
-            players.append(player)
+        # Decode the remaining payload once, then split it in bulk
+        payload = str(buffer.read(len(buffer)), 'latin1', errors='replace')
+
+        """
+        Variables are delimited by backslashes and end at the first linebreak after the last backslash. ioquake3
+        server may contain an "fs_manifest", which contains "\\n " as a delimiter. Since "\\n" would usually terminate
+        the server info line, this breaks the format. Only using the linebreak after the last backslash keeps the
+        "\\n " in "fs_manifest" intact, since it is not the last value.
+        """
+        end = payload.find('\n', payload.rfind('\\'))
+        if end == -1:
+            raise PyQ3SLError('Expected string delimiters were not found')
+
+        elements = payload[1:end].split('\\')
+        keys, values = elements[::2], elements[1::2]
+        if strip_colors:
+            # Keys are always stripped right away, since they are needed for lookups
+            keys = [strip_color_codes(key) for key in keys]
+
+        variables: Iterable[Tuple[str, str]] = zip(keys, values)
+        if fields is not None:
+            wanted = set(fields)
+            variables = ((key, value) for key, value in variables if key in wanted)
+        if strip_colors and not lazy:
+            variables = ((key, strip_color_codes(value)) for key, value in variables)
+
+        status = {
+            'ip': self.ip,
+            'port': self.port,
+            **dict(variables)
+        }
+
+        status.update(self.parse_players(payload[end + 1:], players, lazy, strip_colors))
+
+        if lazy:
+            return Status(status, strip_colors)
+
+        return status
+
+    def parse_players(self, payload: str, players: str, lazy: bool, strip_colors: bool) -> dict:
+        """
+        Parse or count the player lines of a status response, returning the fields to add to the status.
+        """
+        if players == 'none':
+            return {}
+
+        # Each line contains a player (final player line being empty), some servers send trailing bytes (e.g. "\x00")
+        # after the last player line
+        lines = [line for line in payload.split('\n') if len(line) >= self.MIN_PLAYER_LINE_LENGTH]
+        if players == 'count':
+            # Count player lines without parsing them
+            return {'num_players': len(lines)}
+        if lazy:
+            return {'players': [Status(self.parse_player(line, False), strip_colors) for line in lines]}
+
+        return {'players': [self.parse_player(line, strip_colors) for line in lines]}
+
+    def parse_info_response(self, buffer: Buffer, strip_colors: bool) -> dict:
+        """
+        Info response consists of two lines:
+        1: header indicating response type
+        2: list of server variables, delimited by backslashes (usually including clients, sv_maxclients, mapname and
+        hostname)
+        """
+        if not self.has_valid_info_response_header(buffer):
+            raise PyQ3SLError('Server returned invalid packet header')
+
+        if not self.has_valid_response_body(buffer):
+            raise PyQ3SLError('Server returned invalid packet body')
+
+        payload = str(buffer.read(len(buffer)), 'latin1', errors='replace')
+
+        # Some servers terminate the variables with a linebreak and/or nil-byte, others do not terminate them at all
+        elements = payload.rstrip('\n\x00').split('\\')[1:]
+        if strip_colors:
+            elements = [strip_color_codes(element) for element in elements]
 
         return {
             'ip': self.ip,
             'port': self.port,
-            **dict(zip(keys, values)),
-            'players': players
+            **dict(zip(elements[::2], elements[1::2]))
         }
 
     @staticmethod
     def build_query_packet() -> bytes:
         return b'\xff\xff\xff\xffgetstatus\x00'
 
+    @staticmethod
+    def build_info_query_packet() -> bytes:
+        return b'\xff\xff\xff\xffgetinfo xxx\x00'
+
     @staticmethod
     def has_valid_response_header(buffer: Buffer) -> bool:
         return buffer.has(19) and buffer.read(19) == b'\xff\xff\xff\xffstatusResponse\n'
 
+    @staticmethod
+    def has_valid_info_response_header(buffer: Buffer) -> bool:
+        return buffer.has(17) and buffer.read(17) == b'\xff\xff\xff\xffinfoResponse\n'
+
     @staticmethod
     def has_valid_response_body(buffer: Buffer) -> bool:
-        return buffer.peek(1) == b'\\' and buffer.get_buffer().count(b'\\') % 2 == 0
+        return buffer.peek(1) == b'\\' and buffer.count(b'\\') % 2 == 0
 
     @staticmethod
-    def parse_player(buffer: Buffer, strip_colors: bool) -> dict:
-        frags = int(buffer.read_string(b' ', consume_sep=True, strip_colors=strip_colors))
-        ping = int(buffer.read_string(b' ', consume_sep=True, strip_colors=strip_colors))
-        buffer.skip(1)
-        name = buffer.read_string(b'"', consume_sep=True, strip_colors=strip_colors)
+    def parse_player(line: str, strip_colors: bool) -> dict:
+        # Player lines are formatted as: <frags> <ping> "<name>"
+        try:
+            frags, ping, name = line.split(' ', 2)
+            frags, ping = int(frags), int(ping)
+        except ValueError:
+            raise PyQ3SLError('Server returned invalid player data')
 
         return {
             'frags': frags,
             'ping': ping,
-            'name': name,
+            'name': Server.parse_player_name(name, strip_colors),
         }
 
+    @staticmethod
+    def parse_player_name(name: str, strip_colors: bool) -> str:
+        # Skip the opening quote and use everything up to the closing quote
+        end = name.find('"', 1)
+        if end == -1:
+            raise PyQ3SLError('Expected string delimiters were not found')
+
+        if strip_colors:
+            return strip_color_codes(name[1:end])
+
+        return name[1:end]
+
 
 class MedalOfHonorServer(Server):
     """
@@ -117,6 +354,11 @@ class MedalOfHonorServer(Server):
     "vanilla" protocol. Since all the Medal of Honor games use GameSpy to list servers, Medal of Honor servers can only
     be created directly.
     """
+    __slots__ = ()
+
+    # A player with 0 ping and an empty name (0 "")
+    MIN_PLAYER_LINE_LENGTH = 4
+
     def __init__(self, ip: str, port: int):
         super().__init__(ip, port)
 
@@ -125,19 +367,35 @@ class MedalOfHonorServer(Server):
         # Medal of Honor uses a slightly different query packet
         return b'\xff\xff\xff\xff\x02getstatus xxx\x00'
 
+    @staticmethod
+    def build_info_query_packet() -> bytes:
+        # Same as for status queries, Medal of Honor expects an extra byte (b'\x02')
+        return b'\xff\xff\xff\xff\x02getinfo xxx\x00'
+
     @staticmethod
     def has_valid_response_header(buffer: Buffer) -> bool:
         # Medal of Honor responses contain an extra byte (b'\x01')
         return buffer.has(20) and buffer.read(20) == b'\xff\xff\xff\xff\x01statusResponse\n'
 
     @staticmethod
-    def parse_player(buffer: Buffer, strip_colors: bool) -> dict:
+    def has_valid_info_response_header(buffer: Buffer) -> bool:
+        return buffer.has(18) and buffer.read(18) == b'\xff\xff\xff\xff\x01infoResponse\n'
+
+    @staticmethod
+    def parse_player(line: str, strip_colors: bool) -> dict:
         # Medal of Honor only sends a player's ping and name (seems like colors are not supported)
-        ping = int(buffer.read_string(b' ', consume_sep=True, strip_colors=strip_colors))
-        buffer.skip(1)
-        name = buffer.read_string(b'"', consume_sep=True, strip_colors=strip_colors)
+        try:
+            ping, name = line.split(' ', 1)
+            ping = int(ping)
+        except ValueError:
+            raise PyQ3SLError('Server returned invalid player data')
 
         return {
             'ping': ping,
-            'name': name,
+            'name': Server.parse_player_name(name, strip_colors),
         }
+
+
+def check_players_mode(players: str) -> None:
+    if players not in PLAYERS_MODES:
+        raise ValueError(f'Invalid players mode: {players} (expected one of {", ".join(PLAYERS_MODES)})')
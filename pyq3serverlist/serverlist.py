@@ -0,0 +1,90 @@
+import socket
+import struct
+from array import array
+from collections.abc import Sequence
+from typing import Any, FrozenSet, Iterable, Iterator, Optional, Union, overload
+
+from .exceptions import PyQ3SLError
+from .server import Server
+
+
+class ServerList(Sequence):
+    """
+    Compact list of servers. Addresses are stored as packed unsigned integers (IPv4 address as uint32, port
+    as uint16). ``Server`` objects and dotted IP strings are only created once an element is accessed.
+    """
+    ips: array
+    ports: array
+    keys: Optional[FrozenSet[int]]
+
+    def __init__(self, ips: Optional[array] = None, ports: Optional[array] = None):
+        self.ips = ips if ips is not None else array('I')
+        self.ports = ports if ports is not None else array('H')
+        self.keys = None
+
+    def __len__(self) -> int:
+        return len(self.ips)
+
+    @overload
+    def __getitem__(self, index: int) -> Server:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> 'ServerList':
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Server, 'ServerList']:
+        if isinstance(index, slice):
+            return ServerList(self.ips[index], self.ports[index])
+
+        return Server(self.ip(index), self.ports[index])
+
+    def __iter__(self) -> Iterator[Server]:
+        for ip, port in zip(self.ips, self.ports):
+            yield Server(socket.inet_ntoa(struct.pack('>I', ip)), port)
+
+    def __contains__(self, server: Any) -> bool:
+        if type(server) is not Server:
+            return False
+
+        try:
+            key = server.key
+        except PyQ3SLError:
+            return False
+
+        return key in self.key_set()
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ServerList):
+            return self.ips == other.ips and self.ports == other.ports
+        if isinstance(other, list):
+            return list(self) == other
+
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+    @classmethod
+    def from_keys(cls, keys: Iterable[int]) -> 'ServerList':
+        servers = cls()
+        for key in keys:
+            servers.append(key >> 16, key & 0xffff)
+        return servers
+
+    def key_set(self) -> FrozenSet[int]:
+        """
+        Set of all server keys (see ``Server.key``), built on first use only, since most lists are never searched.
+        """
+        if self.keys is None:
+            self.keys = frozenset((ip << 16) | port for ip, port in zip(self.ips, self.ports))
+
+        return self.keys
+
+    def ip(self, index: int) -> str:
+        return socket.inet_ntoa(struct.pack('>I', self.ips[index]))
+
+    def append(self, ip: int, port: int) -> None:
+        self.ips.append(ip)
+        self.ports.append(port)
+        self.keys = None
@@ -0,0 +1,62 @@
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator
+
+from .buffer import COLOR_REGEX
+
+
+def strip_color_codes(value: str) -> str:
+    # Most values do not contain any color codes, skip the regex for those
+    if '^' not in value:
+        return value
+
+    return COLOR_REGEX.sub('', value)
+
+
+class Status(Mapping):
+    """
+    Read-only mapping of status response fields, which strips color codes lazily. Values are only stripped once they
+    are accessed and the stripped value is memoized, so fields which are never read never pass through the regex.
+    Both variants of a value remain available via ``raw`` and ``stripped``.
+    """
+    values: Dict[str, Any]
+    strip_colors: bool
+    stripped_values: Dict[str, str]
+
+    def __init__(self, values: Dict[str, Any], strip_colors: bool = True):
+        self.values = values
+        self.strip_colors = strip_colors
+        self.stripped_values = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if self.strip_colors:
+            return self.stripped(key)
+
+        return self.values[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.values)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+    def raw(self, key: str) -> Any:
+        return self.values[key]
+
+    def stripped(self, key: str) -> Any:
+        value = self.values[key]
+        if not isinstance(value, str):
+            return value
+
+        stripped = self.stripped_values.get(key)
+        if stripped is None:
+            stripped = self.stripped_values[key] = strip_color_codes(value)
+
+        return stripped
+
+    def to_dict(self) -> dict:
+        return {
+            key: [player.to_dict() for player in value] if key == 'players' else value for key, value in self.items()
+        }
@@ -0,0 +1,43 @@
+from typing import Optional
+
+
+class Timings:
+    """
+    High resolution timings (in seconds) of a single query, filled in while the query is performed:
+    connect: resolving the address and connecting the socket (only if a new connection was established)
+    send: sending the query packet
+    first_byte: time from sending the query until receiving the first packet (i.e. the ping as seen by the querier)
+    last_packet: time from sending the query until receiving the last packet (for multi-packet responses)
+    parse: parsing the response
+    """
+    connect: Optional[float]
+    send: Optional[float]
+    first_byte: Optional[float]
+    last_packet: Optional[float]
+    parse: Optional[float]
+    packets: int
+
+    def __init__(self):
+        self.connect = None
+        self.send = None
+        self.first_byte = None
+        self.last_packet = None
+        self.parse = None
+        self.packets = 0
+
+    def __repr__(self):
+        return f'Timings({", ".join(f"{key}={value}" for key, value in self)})'
+
+    def __iter__(self):
+        yield 'connect', self.connect
+        yield 'send', self.send
+        yield 'first_byte', self.first_byte
+        yield 'last_packet', self.last_packet
+        yield 'parse', self.parse
+        yield 'packets', self.packets
+
+    def received(self, elapsed: float) -> None:
+        if self.first_byte is None:
+            self.first_byte = elapsed
+        self.last_packet = elapsed
+        self.packets += 1
@@ -0,0 +1,67 @@
+import unittest
+from typing import Iterator, List
+
+from helpers import STATUS_RESPONSE, UDPServer
+from pyq3serverlist import Server, PyQ3SLError, PyQ3SLTimeoutError, query_all
+
+
+class QueryAllTest(unittest.TestCase):
+    responders: List[UDPServer]
+
+    def setUp(self):
+        self.responders = []
+
+    def tearDown(self):
+        for responder in self.responders:
+            responder.close()
+
+    def server(self, *replies: bytes) -> Server:
+        responder = UDPServer.replying(*replies)
+        self.responders.append(responder)
+        return Server('127.0.0.1', responder.port)
+
+    def test_query_all(self):
+        # GIVEN
+        responsive = [self.server(STATUS_RESPONSE) for _ in range(5)]
+        dead = self.server()
+        malformed = self.server(b'\xff\xff\xff\xffsomethingElse\n')
+
+        # WHEN
+        actual = list(query_all([*responsive, dead, malformed], max_workers=4, timeout=0.2))
+
+        # THEN
+        results = dict(actual)
+        self.assertEqual(7, len(actual))
+        self.assertEqual(7, len(results))
+        for server in responsive:
+            self.assertEqual('q3dm17', results[server]['mapname'])
+        self.assertIsInstance(results[dead], PyQ3SLTimeoutError)
+        self.assertIsInstance(results[malformed], PyQ3SLError)
+        self.assertNotIsInstance(results[malformed], PyQ3SLTimeoutError)
+
+    def test_query_all_bounds_submitted_queries(self):
+        # GIVEN
+        max_workers = 4
+        pulled = 0
+        responder = UDPServer.replying(STATUS_RESPONSE)
+        self.responders.append(responder)
+
+        def servers() -> Iterator[Server]:
+            nonlocal pulled
+            for _ in range(100):
+                pulled += 1
+                yield Server('127.0.0.1', responder.port)
+
+        # WHEN
+        received = 0
+        for _, result in query_all(servers(), max_workers=max_workers):
+            # THEN
+            self.assertLessEqual(pulled - received, max_workers * 2)
+            self.assertNotIsInstance(result, PyQ3SLError)
+            received += 1
+
+        self.assertEqual(100, received)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,227 @@
+import unittest
+from dataclasses import dataclass
+from typing import List, Optional
+
+from pyq3serverlist import PyQ3SLError
+from pyq3serverlist.buffer import Buffer
+
+
+class BufferTest(unittest.TestCase):
+    def test_find(self):
+        @dataclass
+        class FindTestCase:
+            name: str
+            data: bytes
+            skip: int
+            sub: bytes
+            offset: int = 0
+            expected: Optional[int] = None
+
+        tests: List[FindTestCase] = [
+            FindTestCase(
+                name='finds sub relative to start',
+                data=b'abc\\def',
+                skip=0,
+                sub=b'\\',
+                expected=3
+            ),
+            FindTestCase(
+                name='finds sub relative to index',
+                data=b'abc\\def\\',
+                skip=2,
+                sub=b'\\',
+                expected=1
+            ),
+            FindTestCase(
+                name='ignores occurrences before index',
+                data=b'\\abc\\',
+                skip=1,
+                sub=b'\\',
+                expected=3
+            ),
+            FindTestCase(
+                name='finds sub at offset from index',
+                data=b'x\\a\\b',
+                skip=1,
+                sub=b'\\',
+                offset=1,
+                expected=2
+            ),
+            FindTestCase(
+                name='returns -1 if sub is not found after index',
+                data=b'abc\\def',
+                skip=4,
+                sub=b'\\',
+                expected=-1
+            ),
+        ]
+
+        for t in tests:
+            # GIVEN
+            buffer = Buffer(t.data)
+            buffer.skip(t.skip)
+
+            # WHEN
+            actual = buffer.find(t.sub, t.offset)
+
+            # THEN
+            self.assertEqual(t.expected, actual, t.name)
+
+    def test_count(self):
+        # GIVEN
+        buffer = Buffer(b'a\nb\nc\nd')
+        buffer.skip(2)
+
+        # WHEN
+        actual = buffer.count(b'\n')
+
+        # THEN
+        self.assertEqual(2, actual)
+
+    def test_read(self):
+        # GIVEN
+        buffer = Buffer(b'abcdef')
+
+        # WHEN
+        first = buffer.read(2)
+        peeked = buffer.peek(3)
+        second = buffer.read(3)
+
+        # THEN
+        self.assertIsInstance(first, memoryview)
+        self.assertIsInstance(peeked, memoryview)
+        self.assertIsInstance(second, memoryview)
+        self.assertEqual(b'ab', first)
+        self.assertEqual(b'cde', peeked)
+        self.assertEqual(b'cde', second)
+        self.assertEqual(1, len(buffer))
+
+    def test_read_beyond_length(self):
+        # GIVEN
+        buffer = Buffer(b'abc')
+        buffer.skip(2)
+
+        # WHEN/THEN
+        with self.assertRaises(PyQ3SLError) as ctx:
+            buffer.read(2)
+        self.assertEqual('Attempt to read beyond buffer length', str(ctx.exception))
+
+    def test_write(self):
+        # GIVEN
+        buffer = Buffer(b'ab')
+
+        # WHEN
+        buffer.write(b'cd')
+        buffer.write_ushort(27960)
+
+        # THEN
+        self.assertEqual(b'abcd\x6d\x38', buffer.read(6))
+
+    def test_write_with_live_views(self):
+        # GIVEN
+        buffer = Buffer()
+        buffer.write(b'abc')
+        view = buffer.read(2)
+
+        # WHEN
+        buffer.write(b'def')
+
+        # THEN
+        self.assertEqual(b'ab', view)
+        self.assertEqual(b'cdef', buffer.read(4))
+
+    def test_write_does_not_modify_caller_data(self):
+        # GIVEN
+        data = bytearray(b'abc')
+        buffer = Buffer(data)
+
+        # WHEN
+        buffer.write(b'def')
+
+        # THEN
+        self.assertEqual(bytearray(b'abc'), data)
+        self.assertEqual(b'abcdef', buffer.read(6))
+
+    def test_read_string(self):
+        @dataclass
+        class ReadStringTestCase:
+            name: str
+            data: bytes
+            sep: object
+            consume_sep: bool = False
+            strip_colors: bool = True
+            expected: Optional[str] = None
+            expectedRemaining: Optional[bytes] = None
+            wantErrContains: Optional[str] = None
+
+        tests: List[ReadStringTestCase] = [
+            ReadStringTestCase(
+                name='reads string up to separator',
+                data=b'abc\\def',
+                sep=b'\\',
+                expected='abc',
+                expectedRemaining=b'\\def'
+            ),
+            ReadStringTestCase(
+                name='consumes separator',
+                data=b'abc\\def',
+                sep=b'\\',
+                consume_sep=True,
+                expected='abc',
+                expectedRemaining=b'def'
+            ),
+            ReadStringTestCase(
+                name='uses first separator found',
+                data=b'abc\n def\\ghi',
+                sep=[b'\\', b'\n'],
+                expected='abc\n def',
+                expectedRemaining=b'\\ghi'
+            ),
+            ReadStringTestCase(
+                name='strips colors',
+                data=b'^1a^Xff0000bc\n',
+                sep=b'\n',
+                expected='abc',
+                expectedRemaining=b'\n'
+            ),
+            ReadStringTestCase(
+                name='keeps colors',
+                data=b'^1abc\n',
+                sep=b'\n',
+                strip_colors=False,
+                expected='^1abc',
+                expectedRemaining=b'\n'
+            ),
+            ReadStringTestCase(
+                name='errors if separator is not found',
+                data=b'abc',
+                sep=b'\\',
+                wantErrContains='Expected string delimiters were not found'
+            ),
+        ]
+
+        for t in tests:
+            # GIVEN
+            buffer = Buffer(t.data)
+
+            if t.wantErrContains is not None:
+                # WHEN/THEN
+                self.assertRaisesRegex(
+                    PyQ3SLError,
+                    t.wantErrContains,
+                    buffer.read_string,
+                    t.sep,
+                    t.consume_sep,
+                    strip_colors=t.strip_colors
+                )
+            else:
+                # WHEN
+                actual = buffer.read_string(t.sep, t.consume_sep, strip_colors=t.strip_colors)
+
+                # THEN
+                self.assertEqual(t.expected, actual, t.name)
+                self.assertEqual(t.expectedRemaining, bytes(buffer.get_buffer()), t.name)
+
+
+if __name__ == '__main__':
+    unittest.main()
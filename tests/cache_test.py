@@ -0,0 +1,192 @@
+import threading
+import unittest
+from typing import List, Optional, Union
+
+from pyq3serverlist import Server, StatusCache, PyQ3SLTimeoutError
+
+
+class StubServer(Server):
+    """
+    Returns (or raises) the given results in order instead of querying the server.
+    """
+    results: List[Union[dict, Exception]]
+    calls: int
+    called: threading.Event
+    release: Optional[threading.Event]
+
+    def __init__(
+            self,
+            ip: str,
+            port: int,
+            results: List[Union[dict, Exception]],
+            release: Optional[threading.Event] = None
+    ):
+        super().__init__(ip, port)
+        self.results = results
+        self.calls = 0
+        self.called = threading.Event()
+        self.release = release
+
+    def get_status(self, strip_colors: bool = True, timeout: float = 1.0, **kwargs) -> dict:
+        self.calls += 1
+        result = self.results.pop(0)
+        self.called.set()
+        # Block until released, if requested
+        if self.release is not None:
+            self.release.wait(1.0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class Clock:
+    now: float
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class StatusCacheTest(unittest.TestCase):
+    def test_get_status_caches_until_ttl_expires(self):
+        # GIVEN
+        clock = Clock()
+        cache = StatusCache(ttl=10.0, clock=clock)
+        server = StubServer('127.0.0.1', 27960, [{'mapname': 'q3dm17'}, {'mapname': 'q3dm6'}])
+
+        # WHEN/THEN
+        self.assertDictEqual({'mapname': 'q3dm17'}, cache.get_status(server))
+        clock.now = 9.9
+        self.assertDictEqual({'mapname': 'q3dm17'}, cache.get_status(server))
+        clock.now = 10.0
+        self.assertDictEqual({'mapname': 'q3dm6'}, cache.get_status(server))
+        self.assertEqual(2, server.calls)
+
+    def test_get_status_caches_errors_for_negative_ttl(self):
+        # GIVEN
+        clock = Clock()
+        cache = StatusCache(negative_ttl=2.0, clock=clock)
+        server = StubServer('127.0.0.1', 27960, [PyQ3SLTimeoutError('Timed out'), {'mapname': 'q3dm17'}])
+
+        # WHEN/THEN
+        with self.assertRaises(PyQ3SLTimeoutError) as first:
+            cache.get_status(server)
+        with self.assertRaises(PyQ3SLTimeoutError) as second:
+            cache.get_status(server)
+        self.assertIsNot(first.exception, second.exception)
+        self.assertIs(first.exception.__cause__, second.exception.__cause__)
+        self.assertEqual('Timed out', str(second.exception))
+        clock.now = 2.0
+        self.assertDictEqual({'mapname': 'q3dm17'}, cache.get_status(server))
+        self.assertEqual(2, server.calls)
+
+    def test_get_status_evicts_least_recently_used(self):
+        # GIVEN
+        cache = StatusCache(max_entries=2, clock=Clock())
+        first = StubServer('127.0.0.1', 27960, [{'n': 1}, {'n': 2}])
+        second = StubServer('127.0.0.2', 27960, [{'n': 1}])
+        third = StubServer('127.0.0.3', 27960, [{'n': 1}])
+
+        # WHEN
+        cache.get_status(first)
+        cache.get_status(second)
+        cache.get_status(first)
+        cache.get_status(third)
+
+        # THEN
+        self.assertEqual(2, len(cache))
+        self.assertDictEqual({'n': 1}, cache.get_status(first))
+        self.assertEqual(1, first.calls)
+
+    def test_get_status_returns_stale_result_while_revalidating(self):
+        # GIVEN
+        clock = Clock()
+        cache = StatusCache(ttl=10.0, stale_while_revalidate=True, clock=clock)
+        server = StubServer('127.0.0.1', 27960, [{'mapname': 'q3dm17'}, {'mapname': 'q3dm6'}])
+        cache.get_status(server)
+        server.called.clear()
+        clock.now = 11.0
+
+        # WHEN
+        actual = cache.get_status(server)
+
+        # THEN
+        self.assertDictEqual({'mapname': 'q3dm17'}, actual)
+        self.assertTrue(server.called.wait(1.0))
+        cache.close()
+        self.assertDictEqual({'mapname': 'q3dm6'}, cache.get_status(server))
+        self.assertEqual(2, server.calls)
+
+    def test_get_status_keeps_stale_result_if_revalidation_fails(self):
+        # GIVEN
+        clock = Clock()
+        cache = StatusCache(ttl=10.0, negative_ttl=2.0, stale_while_revalidate=True, clock=clock)
+        server = StubServer(
+            '127.0.0.1',
+            27960,
+            [{'mapname': 'q3dm17'}, PyQ3SLTimeoutError('Timed out'), {'mapname': 'q3dm6'}]
+        )
+        cache.get_status(server)
+        clock.now = 11.0
+
+        # WHEN
+        cache.get_status(server)
+        cache.close()
+
+        # THEN
+        self.assertDictEqual({'mapname': 'q3dm17'}, cache.get_status(server))
+        self.assertEqual(2, server.calls)
+        clock.now = 13.0
+        self.assertDictEqual({'mapname': 'q3dm17'}, cache.get_status(server))
+        cache.close()
+        self.assertDictEqual({'mapname': 'q3dm6'}, cache.get_status(server))
+        self.assertEqual(3, server.calls)
+
+    def test_get_status_revalidates_again_after_unexpected_error(self):
+        # GIVEN
+        clock = Clock()
+        cache = StatusCache(ttl=10.0, stale_while_revalidate=True, clock=clock)
+        server = StubServer('127.0.0.1', 27960, [{'mapname': 'q3dm17'}, RuntimeError('Unexpected'), {'mapname': 'q3dm6'}])
+        cache.get_status(server)
+        clock.now = 11.0
+
+        # WHEN
+        cache.get_status(server)
+        cache.close()
+        cache.get_status(server)
+        cache.close()
+
+        # THEN
+        self.assertDictEqual({'mapname': 'q3dm6'}, cache.get_status(server))
+        self.assertEqual(3, server.calls)
+
+    def test_get_status_queries_once_for_concurrent_misses(self):
+        # GIVEN
+        release = threading.Event()
+        cache = StatusCache(clock=Clock())
+        server = StubServer('127.0.0.1', 27960, [{'mapname': 'q3dm17'}], release)
+        results = []
+
+        def get_status() -> None:
+            results.append(cache.get_status(server))
+
+        threads = [threading.Thread(target=get_status) for _ in range(5)]
+
+        # WHEN
+        for thread in threads:
+            thread.start()
+        self.assertTrue(server.called.wait(1.0))
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        # THEN
+        self.assertListEqual([{'mapname': 'q3dm17'}] * 5, results)
+        self.assertEqual(1, server.calls)
+        self.assertDictEqual({}, cache.pending)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import os
+import tempfile
+import unittest
+
+from pyq3serverlist import DeadServerCache, Server, PyQ3SLError, PyQ3SLTimeoutError
+
+
+class Clock:
+    now: float
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class DeadServerCacheTest(unittest.TestCase):
+    def test_record_timeout(self):
+        # GIVEN
+        clock = Clock()
+        cache = DeadServerCache(threshold=2, base_backoff=60.0, max_backoff=200.0, clock=clock)
+        server = Server('127.0.0.1', 27960)
+
+        # WHEN/THEN
+        cache.record_timeout(server)
+        self.assertFalse(cache.is_dead(server))
+        cache.record_timeout(server)
+        self.assertTrue(cache.is_dead(server))
+        self.assertEqual(1060.0, cache.until(server))
+        cache.record_timeout(server)
+        self.assertEqual(1120.0, cache.until(server))
+        cache.record_timeout(server)
+        self.assertEqual(1200.0, cache.until(server))
+        clock.now = 1200.0
+        self.assertFalse(cache.is_dead(server))
+
+    def test_record_timeout_after_many_timeouts(self):
+        # GIVEN
+        cache = DeadServerCache(threshold=1, base_backoff=60.0, max_backoff=3600.0, clock=Clock())
+        server = Server('127.0.0.1', 27960)
+
+        # WHEN
+        for _ in range(2000):
+            cache.record_timeout(server)
+
+        # THEN
+        self.assertEqual(4600.0, cache.until(server))
+
+    def test_record_success(self):
+        # GIVEN
+        cache = DeadServerCache(threshold=1, clock=Clock())
+        server = Server('127.0.0.1', 27960)
+        cache.record_timeout(server)
+
+        # WHEN
+        cache.record_success(server)
+
+        # THEN
+        self.assertFalse(cache.is_dead(server))
+        self.assertEqual(0, len(cache))
+
+    def test_track(self):
+        # GIVEN
+        cache = DeadServerCache(threshold=1, clock=Clock())
+        alive, dead, broken = Server('127.0.0.1', 27960), Server('127.0.0.2', 27960), Server('127.0.0.3', 27960)
+        results = [(alive, {}), (dead, PyQ3SLTimeoutError('Timed out')), (broken, PyQ3SLError('Invalid header'))]
+
+        # WHEN
+        actual = list(cache.track(results))
+
+        # THEN
+        self.assertListEqual(results, actual)
+        self.assertListEqual([alive, broken], cache.filter([alive, dead, broken]))
+        self.assertListEqual([alive, broken, dead], cache.prioritize([dead, alive, broken]))
+
+    def test_record_error(self):
+        # GIVEN
+        cache = DeadServerCache(threshold=1, clock=Clock())
+        server = Server('127.0.0.1', 27960)
+        cache.record_timeout(server)
+
+        # WHEN
+        cache.record(server, PyQ3SLError('Failed to receive data from server'))
+
+        # THEN
+        self.assertTrue(cache.is_dead(server))
+        self.assertEqual(1, len(cache))
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # GIVEN
+            path = os.path.join(directory, 'dead.sqlite')
+            clock = Clock()
+            server, recovered = Server('127.0.0.1', 27960), Server('127.0.0.2', 27960)
+            with DeadServerCache(path, threshold=1, base_backoff=60.0, clock=clock) as cache:
+                cache.record_timeout(server)
+                cache.record_timeout(recovered)
+            with DeadServerCache(path, threshold=1, clock=clock) as cache:
+                cache.record_success(recovered)
+
+            # WHEN
+            actual = DeadServerCache(path, clock=clock)
+
+            # THEN
+            self.assertEqual(1, len(actual))
+            self.assertTrue(actual.is_dead(server))
+            self.assertEqual(1060.0, actual.until(server))
+            self.assertFalse(actual.is_dead(recovered))
+
+
+if __name__ == '__main__':
+    unittest.main()
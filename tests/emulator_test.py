@@ -0,0 +1,135 @@
+import asyncio
+import socket
+import unittest
+from dataclasses import dataclass
+
+from pyq3serverlist import Emulator, PrincipalServer, StatusScanner, EOFReader, TimeoutReader, PyQ3SLError, \
+    PyQ3SLTimeoutError
+
+
+class EmulatorTest(unittest.TestCase):
+    def test_get_servers(self):
+        @dataclass
+        class GetServersTestCase:
+            name: str
+            emulator: Emulator
+            network_protocol: socket.SocketKind = socket.SOCK_DGRAM
+            server_entry_prefix: bytes = None
+            timeout_reader: bool = False
+
+        tests = [
+            GetServersTestCase(
+                name='single UDP packet',
+                emulator=Emulator(servers=10)
+            ),
+            GetServersTestCase(
+                name='multiple UDP packets with EOF',
+                emulator=Emulator(servers=25, entries_per_packet=10, end_marker=b'\\EOF')
+            ),
+            GetServersTestCase(
+                name='multiple UDP packets with EOT per packet and preamble',
+                emulator=Emulator(servers=25, entries_per_packet=10, preamble=b'\n\x00', packet_marker=b'\\EOT')
+            ),
+            GetServersTestCase(
+                name='entry prefix',
+                emulator=Emulator(servers=25, entries_per_packet=10, prefix=b'\x00'),
+                server_entry_prefix=b'\x00'
+            ),
+            GetServersTestCase(
+                name='without end marker',
+                emulator=Emulator(servers=25, entries_per_packet=10, end_marker=b''),
+                timeout_reader=True
+            ),
+            GetServersTestCase(
+                name='TCP',
+                emulator=Emulator(servers=25, entries_per_packet=10),
+                network_protocol=socket.SOCK_STREAM
+            ),
+        ]
+
+        for t in tests:
+            async def run():
+                async with t.emulator as emulator:
+                    port = emulator.principal_tcp_port \
+                        if t.network_protocol == socket.SOCK_STREAM else emulator.principal_port
+                    reader = TimeoutReader(idle_timeout=0.1) if t.timeout_reader else EOFReader()
+                    principal = PrincipalServer(emulator.host, port, reader, t.network_protocol)
+                    return emulator.get_servers(), await principal.get_servers_async(
+                        68,
+                        server_entry_prefix=t.server_entry_prefix
+                    )
+
+            # WHEN
+            expected, actual = asyncio.run(run())
+
+            # THEN
+            self.assertEqual(expected, actual, t.name)
+
+    def test_get_status(self):
+        # GIVEN
+        async def run():
+            async with Emulator(servers=20, min_players=1, max_players=8) as emulator:
+                servers = emulator.get_servers()
+                statuses = await asyncio.gather(*[server.get_status_async() for server in servers])
+                # Scanner is blocking, so run it in a thread while the event loop serves the emulated servers
+                scanned = await asyncio.get_running_loop().run_in_executor(
+                    None,
+                    lambda: list(StatusScanner(timeout=1.0).scan(servers))
+                )
+                return emulator, statuses, scanned
+
+        # WHEN
+        emulator, statuses, scanned = asyncio.run(run())
+
+        # THEN
+        for server, status in zip(emulator.servers, statuses):
+            self.assertEqual(server.port, status['port'])
+            self.assertEqual(len(server.players), len(status['players']))
+            self.assertEqual(dict(server.variables)['mapname'], status['mapname'])
+            self.assertTrue(status['sv_hostname'].startswith('Emulated Server'))
+        self.assertEqual(20, len(scanned))
+        for _, result in scanned:
+            self.assertNotIsInstance(result, PyQ3SLError)
+
+    def test_get_status_medal_of_honor(self):
+        # GIVEN
+        async def run():
+            async with Emulator(servers=1, min_players=3, max_players=3, medal_of_honor=True) as emulator:
+                server, *_ = emulator.get_servers()
+                return await server.get_status_async(), await server.get_info_async()
+
+        # WHEN
+        status, info = asyncio.run(run())
+
+        # THEN
+        self.assertEqual(3, len(status['players']))
+        self.assertEqual({'ping', 'name'}, set(status['players'][0].keys()))
+        self.assertEqual('3', info['clients'])
+
+    def test_loss(self):
+        # GIVEN
+        async def run():
+            async with Emulator(servers=1, loss=1.0) as emulator:
+                server, *_ = emulator.get_servers()
+                return await server.get_status_async(timeout=0.1)
+
+        # WHEN/THEN
+        self.assertRaises(PyQ3SLTimeoutError, asyncio.run, run())
+
+    def test_variables(self):
+        # GIVEN
+        async def run():
+            async with Emulator(servers=1, variables=1) as emulator:
+                server, *_ = emulator.get_servers()
+                return await server.get_status_async()
+
+        # WHEN
+        status = asyncio.run(run())
+
+        # THEN
+        self.assertEqual({'ip', 'port', 'sv_hostname', 'players'}, set(status.keys()))
+        self.assertRaises(ValueError, Emulator, variables=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
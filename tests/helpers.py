@@ -0,0 +1,82 @@
+import socket
+import threading
+from typing import Callable, List
+
+STATUS_RESPONSE = b'\xff\xff\xff\xffstatusResponse\n\\mapname\\q3dm17\n'
+
+
+class UDPServer:
+    """
+    Local UDP server for tests, which answers every received packet with the packets returned by ``respond``
+    (an empty list to not answer at all). Close the server to stop it.
+    """
+    sock: socket.socket
+    port: int
+    respond: Callable[[bytes], List[bytes]]
+
+    def __init__(self, respond: Callable[[bytes], List[bytes]]):
+        self.respond = respond
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(('127.0.0.1', 0))
+        self.port = self.sock.getsockname()[1]
+
+        threading.Thread(target=self.serve, daemon=True).start()
+
+    @classmethod
+    def replying(cls, *packets: bytes) -> 'UDPServer':
+        return cls(lambda _: list(packets))
+
+    def serve(self) -> None:
+        try:
+            while True:
+                data, address = self.sock.recvfrom(2048)
+                for packet in self.respond(data):
+                    self.sock.sendto(packet, address)
+        except OSError:
+            # Socket was closed
+            pass
+
+    def close(self) -> None:
+        self.sock.close()
+
+
+class TCPServer:
+    """
+    Local TCP server for tests, which answers the first packet received on every connection with the segments
+    returned by ``respond``. Connections are kept open until the server is closed.
+    """
+    sock: socket.socket
+    port: int
+    respond: Callable[[bytes], List[bytes]]
+    connections: List[socket.socket]
+
+    def __init__(self, respond: Callable[[bytes], List[bytes]]):
+        self.respond = respond
+        self.connections = []
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.bind(('127.0.0.1', 0))
+        self.sock.listen()
+        self.port = self.sock.getsockname()[1]
+
+        threading.Thread(target=self.serve, daemon=True).start()
+
+    @classmethod
+    def replying(cls, *segments: bytes) -> 'TCPServer':
+        return cls(lambda _: list(segments))
+
+    def serve(self) -> None:
+        try:
+            while True:
+                connection, _ = self.sock.accept()
+                self.connections.append(connection)
+                data = connection.recv(2048)
+                for segment in self.respond(data):
+                    connection.sendall(segment)
+        except OSError:
+            # Socket was closed
+            pass
+
+    def close(self) -> None:
+        self.sock.close()
+        for connection in self.connections:
+            connection.close()
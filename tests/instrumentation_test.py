@@ -0,0 +1,63 @@
+import unittest
+
+from helpers import STATUS_RESPONSE, UDPServer
+from pyq3serverlist import MetricsCollector, Server, PyQ3SLError, PyQ3SLTimeoutError, set_instrumentation
+from pyq3serverlist.instrumentation import Histogram
+
+
+class HistogramTest(unittest.TestCase):
+    def test_observe(self):
+        # GIVEN
+        histogram = Histogram([0.1, 1.0])
+
+        # WHEN
+        for value in [0.05, 0.1, 0.5, 2.0]:
+            histogram.observe(value)
+
+        # THEN
+        self.assertEqual([('0.1', 2), ('1', 3), ('+Inf', 4)], histogram.cumulative())
+        self.assertEqual(4, histogram.count)
+        self.assertAlmostEqual(2.65, histogram.sum)
+
+
+class MetricsCollectorTest(unittest.TestCase):
+    def setUp(self):
+        # Drop the first query, then answer with a valid and an invalid response
+        responses = [[], [STATUS_RESPONSE], [b'\xff\xff\xff\xffsomethingElse\n']]
+        self.server = UDPServer(lambda _: responses.pop(0))
+        self.port = self.server.port
+
+        self.metrics = MetricsCollector()
+        set_instrumentation(self.metrics)
+
+    def tearDown(self):
+        set_instrumentation(None)
+        self.server.close()
+
+    def test_collect(self):
+        # GIVEN
+        server = Server('127.0.0.1', self.port)
+
+        # WHEN
+        self.assertRaises(PyQ3SLTimeoutError, server.get_status, timeout=0.1)
+        server.get_status()
+        self.assertRaises(PyQ3SLError, server.get_status)
+
+        # THEN
+        self.assertEqual(3, self.metrics.counters['queries_sent_total'])
+        self.assertEqual(2, self.metrics.counters['packets_received_total'])
+        self.assertEqual(1, self.metrics.counters['timeouts_total'])
+        self.assertEqual({'status': 1}, self.metrics.parse_errors)
+        self.assertEqual(2, self.metrics.latency.count)
+        self.assertEqual(1, self.metrics.parse_durations['status'].count)
+
+        rendered = self.metrics.render()
+        self.assertIn('# TYPE pyq3serverlist_queries_sent_total counter\n', rendered)
+        self.assertIn('pyq3serverlist_queries_sent_total 3\n', rendered)
+        self.assertIn('pyq3serverlist_parse_errors_total{kind="status"} 1\n', rendered)
+        self.assertIn('pyq3serverlist_response_latency_seconds_bucket{le="+Inf"} 2\n', rendered)
+        self.assertIn('pyq3serverlist_parse_duration_seconds_count{kind="status"} 1\n', rendered)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,15 @@
+import unittest
+
+from pyq3serverlist.logger import format_packet
+
+
+class LoggerTest(unittest.TestCase):
+    def test_format_packet(self):
+        # WHEN/THEN
+        self.assertEqual('ff ff ff ff', format_packet(b'\xff\xff\xff\xff'))
+        self.assertEqual('ff ff ... (2 more bytes)', format_packet(b'\xff\xff\xff\xff', 2))
+        self.assertEqual('', format_packet(b''))
+
+
+if __name__ == '__main__':
+    unittest.main()
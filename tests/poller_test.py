@@ -0,0 +1,51 @@
+import unittest
+from array import array
+from typing import List
+
+from pyq3serverlist import PrincipalPoller, PrincipalServer, Server, ServerList
+
+
+class StubPrincipalServer(PrincipalServer):
+    """
+    Returns the given server lists in order instead of querying the principal.
+    """
+    responses: List[ServerList]
+
+    def __init__(self, responses: List[ServerList]):
+        super().__init__('127.0.0.1', 27950)
+        self.responses = responses
+
+    def get_servers(self, *args, **kwargs) -> ServerList:
+        return self.responses.pop(0)
+
+
+def server_list(*last_octets: int) -> ServerList:
+    return ServerList(array('I', [0x7f000000 + octet for octet in last_octets]), array('H', [27960] * len(last_octets)))
+
+
+class PrincipalPollerTest(unittest.TestCase):
+    def test_poll(self):
+        # GIVEN
+        principal = StubPrincipalServer([server_list(1, 2, 3), server_list(2, 3, 4), server_list(2, 3, 4)])
+        poller = PrincipalPoller(principal, 68)
+
+        # WHEN
+        first, second, third = poller.poll(), poller.poll(), poller.poll()
+
+        # THEN
+        self.assertListEqual([Server('127.0.0.1', 27960), Server('127.0.0.2', 27960), Server('127.0.0.3', 27960)],
+                             list(first.added))
+        self.assertListEqual([], list(first.removed))
+        self.assertListEqual([], list(first.unchanged))
+
+        self.assertListEqual([Server('127.0.0.4', 27960)], list(second.added))
+        self.assertListEqual([Server('127.0.0.1', 27960)], list(second.removed))
+        self.assertListEqual([Server('127.0.0.2', 27960), Server('127.0.0.3', 27960)], list(second.unchanged))
+
+        self.assertListEqual([], list(third.added))
+        self.assertListEqual([], list(third.removed))
+        self.assertEqual(3, len(third.unchanged))
+
+
+if __name__ == '__main__':
+    unittest.main()
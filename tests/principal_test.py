@@ -1,10 +1,16 @@
+import asyncio
+import socket
 import unittest
 from dataclasses import dataclass
 from typing import Optional, List
 
-from pyq3serverlist import Server, PyQ3SLError, PrincipalServer
+from helpers import TCPServer, UDPServer
+from pyq3serverlist import Server, PyQ3SLError, PyQ3SLTimeoutError, PrincipalServer, ServerList, Reader, EOFReader, \
+    TimeoutReader
 from pyq3serverlist.buffer import Buffer
 
+HEADER = b'\xff\xff\xff\xffgetserversResponse'
+
 
 class PrincipalTest(unittest.TestCase):
     def test_parse_response(self):
@@ -108,6 +114,74 @@ class PrincipalTest(unittest.TestCase):
                 # THEN
                 self.assertListEqual(t.expected, actual)
 
+                # WHEN
+                compact = PrincipalServer.parse_response(Buffer(t.data), t.separator, t.entry_prefix, compact=True)
+
+                # THEN
+                self.assertIsInstance(compact, ServerList)
+                self.assertListEqual(t.expected, list(compact))
+
+    def test_get_servers_async(self):
+        @dataclass
+        class GetServersAsyncTestCase:
+            name: str
+            replies: List[bytes]
+            reader: Reader
+            network_protocol: socket.SocketKind = socket.SOCK_DGRAM
+
+        tests: List[GetServersAsyncTestCase] = [
+            GetServersAsyncTestCase(
+                name='udp with eof reader',
+                replies=[HEADER + b'\\\x7f\x00\x00\x01m8\\EOT', HEADER + b'\\\x7f\x00\x00\x02m8\\EOF'],
+                reader=EOFReader()
+            ),
+            GetServersAsyncTestCase(
+                name='udp with timeout reader',
+                replies=[HEADER + b'\\\x7f\x00\x00\x01m8', HEADER + b'\\\x7f\x00\x00\x02m8'],
+                reader=TimeoutReader(idle_timeout=0.1)
+            ),
+            GetServersAsyncTestCase(
+                name='tcp with eof reader',
+                replies=[HEADER + b'\\\x7f\x00\x00\x01m8\\\x7f\x00\x00\x02m8\\EOT\x00\x00\x00'],
+                reader=EOFReader(),
+                network_protocol=socket.SOCK_STREAM
+            ),
+            GetServersAsyncTestCase(
+                name='tcp with timeout reader',
+                replies=[HEADER + b'\\\x7f\x00\x00\x01m8\\\x7f\x00\x00\x02m8'],
+                reader=TimeoutReader(idle_timeout=0.1),
+                network_protocol=socket.SOCK_STREAM
+            ),
+        ]
+
+        for t in tests:
+            # GIVEN
+            if t.network_protocol == socket.SOCK_STREAM:
+                server = TCPServer.replying(*t.replies)
+            else:
+                server = UDPServer.replying(*t.replies)
+            principal = PrincipalServer('127.0.0.1', server.port, t.reader, t.network_protocol)
+
+            try:
+                # WHEN
+                actual = asyncio.run(principal.get_servers_async(68))
+            finally:
+                server.close()
+
+            # THEN
+            self.assertListEqual([Server('127.0.0.1', 27960), Server('127.0.0.2', 27960)], actual, t.name)
+
+    def test_get_servers_async_timeout(self):
+        # GIVEN
+        server = UDPServer.replying()
+        principal = PrincipalServer('127.0.0.1', server.port, timeout=0.1)
+
+        try:
+            # WHEN/THEN
+            self.assertRaises(PyQ3SLTimeoutError, asyncio.run, principal.get_servers_async(68))
+        finally:
+            server.close()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,87 @@
+import asyncio
+import unittest
+from typing import List
+
+from helpers import UDPServer
+from pyq3serverlist import PrincipalGroup, PrincipalServer, Server, PyQ3SLTimeoutError
+
+HEADER = b'\xff\xff\xff\xffgetserversResponse'
+
+
+class PrincipalGroupTest(unittest.TestCase):
+    servers: List[UDPServer]
+
+    def setUp(self):
+        self.servers = []
+
+    def tearDown(self):
+        for server in self.servers:
+            server.close()
+
+    def principal(self, *replies: bytes) -> PrincipalServer:
+        # Principals without any replies never answer
+        server = UDPServer.replying(*replies)
+        self.servers.append(server)
+        return PrincipalServer('127.0.0.1', server.port, timeout=0.2)
+
+    def test_get_servers(self):
+        # GIVEN
+        first = self.principal(HEADER + b'\\\x7f\x00\x00\x01m8\\\x7f\x00\x00\x02m8\\EOF')
+        second = self.principal(HEADER + b'\\\x7f\x00\x00\x02m8\\\x7f\x00\x00\x03m8\\EOF')
+        dead = self.principal()
+        group = PrincipalGroup()
+        group.add(first, 68)
+        group.add(second, 68)
+        group.add(dead, 68)
+
+        for get_servers in [group.get_servers, lambda: asyncio.run(group.get_servers_async())]:
+            # WHEN
+            actual = get_servers()
+
+            # THEN
+            self.assertDictEqual({
+                Server('127.0.0.1', 27960): [first],
+                Server('127.0.0.2', 27960): [first, second],
+                Server('127.0.0.3', 27960): [second]
+            }, {server: sorted(principals, key=lambda p: p is second) for server, principals in actual.items()})
+            self.assertListEqual([dead], [q.principal for q in group.errors])
+            self.assertIsInstance(next(iter(group.errors.values())), PyQ3SLTimeoutError)
+
+    def test_get_servers_all_failing(self):
+        # GIVEN
+        group = PrincipalGroup()
+        group.add(self.principal(), 68)
+
+        # WHEN/THEN
+        self.assertRaises(PyQ3SLTimeoutError, group.get_servers)
+
+    def test_get_servers_same_principal(self):
+        # GIVEN
+        principal = self.principal(HEADER + b'\\\x7f\x00\x00\x01m8\\EOF')
+        group = PrincipalGroup()
+        group.add(principal, 68)
+        group.add(principal, 43)
+
+        for get_servers in [group.get_servers, lambda: asyncio.run(group.get_servers_async())]:
+            # WHEN
+            actual = get_servers()
+
+            # THEN
+            self.assertDictEqual({Server('127.0.0.1', 27960): [principal]}, actual)
+            self.assertDictEqual({}, group.errors)
+
+    def test_get_servers_same_principal_all_failing(self):
+        # GIVEN
+        principal = self.principal()
+        group = PrincipalGroup()
+        group.add(principal, 68)
+        group.add(principal, 43)
+
+        for get_servers in [group.get_servers, lambda: asyncio.run(group.get_servers_async())]:
+            # WHEN/THEN
+            self.assertRaises(PyQ3SLTimeoutError, get_servers)
+            self.assertEqual(2, len(group.errors))
+
+
+if __name__ == '__main__':
+    unittest.main()
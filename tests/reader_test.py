@@ -0,0 +1,243 @@
+import asyncio
+import socket
+import unittest
+from dataclasses import dataclass
+from typing import List, Optional
+
+from pyq3serverlist import Reader, EOFReader, TimeoutReader, PyQ3SLError, PyQ3SLTimeoutError
+from pyq3serverlist.buffer import Buffer
+
+HEADER = b'\xff\xff\xff\xffgetserversResponse'
+
+
+class PacketConnection:
+    """
+    Stands in for ``Connection``, returning the given packets and timing out once all packets have been read.
+    """
+    address: str
+    port: int
+    protocol: socket.SocketKind
+    timeout: float
+    packets: List[bytes]
+    timeouts: List[Optional[float]]
+
+    def __init__(self, packets: List[bytes], protocol: socket.SocketKind = socket.SOCK_DGRAM):
+        self.address = '127.0.0.1'
+        self.port = 27950
+        self.packets = packets
+        self.protocol = protocol
+        self.timeout = 1.0
+        self.timeouts = []
+
+    def read(self, timeout: Optional[float] = None) -> Buffer:
+        self.timeouts.append(timeout)
+        if len(self.packets) == 0:
+            raise PyQ3SLTimeoutError('Timed out while receiving server data')
+        return Buffer(self.packets.pop(0))
+
+
+class AsyncPacketConnection(PacketConnection):
+    """
+    Stands in for ``AsyncConnection``, behaving like ``PacketConnection``.
+    """
+
+    async def read(self, timeout: Optional[float] = None) -> Buffer:
+        return super().read(timeout)
+
+
+class ReaderTest(unittest.TestCase):
+    def test_split_buffer(self):
+        @dataclass
+        class SplitBufferTestCase:
+            name: str
+            data: bytes
+            require_header: bool = True
+            delim: Optional[bytes] = b'\\'
+            expected: Optional[tuple] = None
+            wantErrContains: Optional[str] = None
+
+        tests: List[SplitBufferTestCase] = [
+            SplitBufferTestCase(
+                name='splits packet with eof marker',
+                data=HEADER + b'\\\x7f\x00\x00\x01m8\\EOF',
+                expected=(HEADER, b'\\\x7f\x00\x00\x01m8', b'\\EOF')
+            ),
+            SplitBufferTestCase(
+                name='splits packet with extra header bytes and eot marker',
+                data=HEADER + b'\n\x00\\\x7f\x00\x00\x01m8\\EOT\x00\x00\x00',
+                expected=(HEADER + b'\n\x00', b'\\\x7f\x00\x00\x01m8', b'\\EOT\x00\x00\x00')
+            ),
+            SplitBufferTestCase(
+                name='splits packet without end marker',
+                data=HEADER + b'\\\x7f\x00\x00\x01m8\\\x7f\x00\x00\x02m9',
+                expected=(HEADER, b'\\\x7f\x00\x00\x01m8\\\x7f\x00\x00\x02m9', b'')
+            ),
+            SplitBufferTestCase(
+                name='splits packet without header if not required',
+                data=b'\\\x7f\x00\x00\x01m8\\EOF',
+                require_header=False,
+                expected=(b'', b'\\\x7f\x00\x00\x01m8', b'\\EOF')
+            ),
+            SplitBufferTestCase(
+                name='splits packet without delimiter',
+                data=HEADER + b'\x7f\x00\x00\x01m8',
+                delim=None,
+                expected=(HEADER, b'\x7f\x00\x00\x01m8', b'')
+            ),
+            SplitBufferTestCase(
+                name='treats packet without any delimiter as header only',
+                data=HEADER + b'\n\x00',
+                expected=(HEADER + b'\n\x00', b'', b'')
+            ),
+            SplitBufferTestCase(
+                name='errors for missing header',
+                data=b'\\\x7f\x00\x00\x01m8\\EOF',
+                wantErrContains='Principal returned invalid data'
+            )
+        ]
+
+        for t in tests:
+            # GIVEN
+            buffer = Buffer(t.data)
+
+            if t.wantErrContains is not None:
+                # WHEN/THEN
+                self.assertRaisesRegex(
+                    PyQ3SLError,
+                    t.wantErrContains,
+                    Reader.split_buffer,
+                    buffer,
+                    t.require_header,
+                    t.delim
+                )
+            else:
+                # WHEN
+                actual = Reader.split_buffer(buffer, t.require_header, t.delim)
+
+                # THEN
+                self.assertTupleEqual(t.expected, tuple(bytes(part) for part in actual))
+
+    def test_read(self):
+        @dataclass
+        class ReadTestCase:
+            name: str
+            reader: Reader
+            packets: List[bytes]
+            protocol: socket.SocketKind = socket.SOCK_DGRAM
+            expected: Optional[bytes] = None
+            wantErrContains: Optional[str] = None
+
+        tests: List[ReadTestCase] = [
+            ReadTestCase(
+                name='eof reader reads packets until eof marker',
+                reader=EOFReader(),
+                packets=[
+                    HEADER + b'\\\x7f\x00\x00\x01m8\\EOT',
+                    HEADER + b'\\\x7f\x00\x00\x02m9\\EOF'
+                ],
+                expected=b'\\\x7f\x00\x00\x01m8\\\x7f\x00\x00\x02m9'
+            ),
+            ReadTestCase(
+                name='eof reader reads tcp packets without header until eot marker',
+                reader=EOFReader(),
+                packets=[
+                    HEADER + b'\\\x7f\x00\x00\x01m8',
+                    b'\\\x7f\x00\x00\x02m9\\EOT\x00\x00\x00'
+                ],
+                protocol=socket.SOCK_STREAM,
+                expected=b'\\\x7f\x00\x00\x01m8\\\x7f\x00\x00\x02m9'
+            ),
+            ReadTestCase(
+                name='timeout reader reads packets until packets get shorter',
+                reader=TimeoutReader(),
+                packets=[
+                    HEADER + b'\\\x7f\x00\x00\x01m8\\\x7f\x00\x00\x02m9',
+                    HEADER + b'\\\x7f\x00\x00\x03m8\\\x7f\x00\x00\x04m9',
+                    HEADER + b'\\\x7f\x00\x00\x05m8',
+                    HEADER + b'\\\x7f\x00\x00\x06m8'
+                ],
+                expected=b'\\\x7f\x00\x00\x01m8\\\x7f\x00\x00\x02m9\\\x7f\x00\x00\x03m8\\\x7f\x00\x00\x04m9'
+                         b'\\\x7f\x00\x00\x05m8'
+            ),
+            ReadTestCase(
+                name='timeout reader reads packets until read times out',
+                reader=TimeoutReader(),
+                packets=[
+                    HEADER + b'\\\x7f\x00\x00\x01m8',
+                    HEADER + b'\\\x7f\x00\x00\x02m8'
+                ],
+                expected=b'\\\x7f\x00\x00\x01m8\\\x7f\x00\x00\x02m8'
+            ),
+            ReadTestCase(
+                name='timeout reader errors if first read times out',
+                reader=TimeoutReader(),
+                packets=[],
+                wantErrContains='Timed out while receiving server data'
+            )
+        ]
+
+        for t in tests:
+            # GIVEN
+            connection = PacketConnection(list(t.packets), t.protocol)
+            async_connection = AsyncPacketConnection(list(t.packets), t.protocol)
+
+            if t.wantErrContains is not None:
+                # WHEN/THEN
+                self.assertRaisesRegex(
+                    PyQ3SLError,
+                    t.wantErrContains,
+                    t.reader.read,
+                    connection,
+                    b'\\'
+                )
+                self.assertRaisesRegex(
+                    PyQ3SLError,
+                    t.wantErrContains,
+                    asyncio.run,
+                    t.reader.read_async(async_connection, b'\\')
+                )
+            else:
+                # WHEN
+                actual = t.reader.read(connection, b'\\')
+                actual_async = asyncio.run(t.reader.read_async(async_connection, b'\\'))
+
+                # THEN
+                self.assertEqual(t.expected, bytes(actual.get_buffer()), t.name)
+                self.assertEqual(t.expected, bytes(actual_async.get_buffer()), t.name)
+
+    def test_read_with_idle_timeout(self):
+        # GIVEN
+        reader = TimeoutReader(idle_timeout=0.05)
+        connection = PacketConnection([HEADER + b'\\\x7f\x00\x00\x01m8', HEADER + b'\\\x7f\x00\x00\x02m8'])
+
+        # WHEN
+        actual = reader.read(connection, b'\\')
+
+        # THEN
+        self.assertEqual(b'\\\x7f\x00\x00\x01m8\\\x7f\x00\x00\x02m8', bytes(actual.get_buffer()))
+        self.assertListEqual([1.0, 0.05, 0.05], connection.timeouts)
+
+    def test_read_with_deadline(self):
+        # GIVEN
+        reader = TimeoutReader(idle_timeout=0.05, deadline=0.5)
+        connection = PacketConnection([HEADER + b'\\\x7f\x00\x00\x01m8'])
+
+        # WHEN
+        reader.read(connection, b'\\')
+
+        # THEN
+        first, second = connection.timeouts
+        self.assertTrue(0.4 < first <= 0.5)
+        self.assertEqual(0.05, second)
+
+    def test_read_with_exceeded_deadline(self):
+        # GIVEN
+        reader = TimeoutReader(deadline=0.0)
+        connection = PacketConnection([HEADER + b'\\\x7f\x00\x00\x01m8'])
+
+        # WHEN/THEN
+        self.assertRaisesRegex(PyQ3SLTimeoutError, 'Deadline exceeded', reader.read, connection, b'\\')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import os
+import tempfile
+import unittest
+
+from helpers import STATUS_RESPONSE, UDPServer
+from pyq3serverlist import PrincipalServer, Server, TimeoutReader, PacketRecorder, ReplayConnection, \
+    read_records, PyQ3SLTimeoutError
+
+HEADER = b'\xff\xff\xff\xffgetserversResponse'
+
+
+class ReplayTest(unittest.TestCase):
+    def setUp(self):
+        self.server = UDPServer(lambda data: [
+            HEADER + b'\\\x7f\x00\x00\x01\x6d\x38',
+            HEADER + b'\\\x7f\x00\x00\x02\x6d\x38\\EOT\x00\x00\x00'
+        ] if b'getservers' in data else [STATUS_RESPONSE])
+        self.port = self.server.port
+
+        fd, self.path = tempfile.mkstemp(suffix='.pq3rec')
+        os.close(fd)
+
+    def tearDown(self):
+        self.server.close()
+        os.remove(self.path)
+
+    def test_record_and_replay(self):
+        # GIVEN
+        principal = PrincipalServer('127.0.0.1', self.port)
+        server = Server('127.0.0.1', self.port)
+        with PacketRecorder(self.path):
+            expected_servers = principal.get_servers(68)
+            expected_status = server.get_status()
+
+        # WHEN
+        records = read_records(self.path)
+
+        # THEN
+        self.assertEqual(5, len(records))
+        self.assertEqual(principal.build_query_packet(68), records[0].data)
+
+        # WHEN
+        principal.connection = ReplayConnection(records, '127.0.0.1', self.port)
+        actual_servers = principal.get_servers(68)
+        # Skip the recorded principal query and its responses
+        connection = ReplayConnection(records[3:], '127.0.0.1', self.port)
+        actual_status = server.parse_response(server.query(connection, server.build_query_packet(), 0, None), True)
+
+        # THEN
+        self.assertEqual(expected_servers, actual_servers)
+        self.assertEqual(expected_status, actual_status)
+
+    def test_replay_with_timeout_reader(self):
+        # GIVEN
+        with PacketRecorder(self.path):
+            PrincipalServer('127.0.0.1', self.port).get_servers(68)
+        principal = PrincipalServer('127.0.0.1', self.port, TimeoutReader())
+        principal.connection = ReplayConnection.from_file(
+            self.path, '127.0.0.1', self.port, timeout=0.1, realtime=True
+        )
+
+        # WHEN
+        actual = principal.get_servers(68)
+
+        # THEN
+        self.assertEqual([Server('127.0.0.1', 27960), Server('127.0.0.2', 27960)], actual)
+        # Recording does not contain any further responses
+        self.assertRaises(PyQ3SLTimeoutError, principal.connection.read, 0.01)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import asyncio
+import unittest
+
+from helpers import STATUS_RESPONSE, UDPServer
+from pyq3serverlist import RTOEstimator, Server, PyQ3SLTimeoutError
+
+
+class RTOEstimatorTest(unittest.TestCase):
+    def test_timeout(self):
+        # GIVEN
+        rto = RTOEstimator(initial_timeout=1.0, min_timeout=0.05, max_timeout=5.0)
+        server = Server('127.0.0.1', 27960)
+
+        # WHEN/THEN
+        self.assertEqual(1.0, rto.timeout(server))
+        self.assertEqual(4.0, rto.timeout(server, 2))
+        self.assertEqual(5.0, rto.timeout(server, 3))
+
+    def test_update(self):
+        # GIVEN
+        rto = RTOEstimator(min_timeout=0.05, max_timeout=5.0)
+        server = Server('127.0.0.1', 27960)
+
+        # WHEN/THEN
+        rto.update(server, 0.1)
+        # srtt = 0.1, rttvar = 0.05 => 0.1 + 4 * 0.05
+        self.assertAlmostEqual(0.3, rto.timeout(server))
+        rto.update(server, 0.1)
+        # srtt = 0.1, rttvar = 0.0375 => 0.1 + 4 * 0.0375
+        self.assertAlmostEqual(0.25, rto.timeout(server))
+        for _ in range(50):
+            rto.update(server, 0.001)
+        self.assertEqual(0.05, rto.timeout(server))
+
+    def test_update_per_prefix(self):
+        # GIVEN
+        rto = RTOEstimator(prefix_length=24)
+
+        # WHEN
+        rto.update(Server('10.0.0.1', 27960), 0.1)
+
+        # THEN
+        self.assertAlmostEqual(0.3, rto.timeout(Server('10.0.0.2', 27961)))
+        self.assertEqual(1.0, rto.timeout(Server('10.0.1.1', 27960)))
+
+
+class RetransmissionTest(unittest.TestCase):
+    def setUp(self):
+        # Drop the first query, answer all others
+        responses = [[]]
+        self.server = UDPServer(lambda _: responses.pop() if responses else [STATUS_RESPONSE])
+        self.port = self.server.port
+
+    def tearDown(self):
+        self.server.close()
+
+    def test_get_status_retransmits_query(self):
+        # GIVEN
+        server = Server('127.0.0.1', self.port)
+        rto = RTOEstimator(initial_timeout=0.2)
+
+        # WHEN
+        actual = server.get_status(retries=1, rto=rto)
+
+        # THEN
+        self.assertEqual('q3dm17', actual['mapname'])
+        # Response to a retransmitted query must not be used as an RTT sample
+        self.assertEqual(0, len(rto.estimates))
+
+        # WHEN
+        server.get_status(rto=rto)
+
+        # THEN
+        self.assertLess(rto.timeout(server), 0.2)
+
+    def test_get_status_async_retransmits_query(self):
+        # GIVEN
+        server = Server('127.0.0.1', self.port)
+        rto = RTOEstimator(initial_timeout=0.2)
+
+        # WHEN
+        actual = asyncio.run(server.get_status_async(retries=1, rto=rto))
+
+        # THEN
+        self.assertEqual('q3dm17', actual['mapname'])
+        self.assertEqual(0, len(rto.estimates))
+
+        # WHEN
+        asyncio.run(server.get_status_async(rto=rto))
+
+        # THEN
+        self.assertLess(rto.timeout(server), 0.2)
+
+    def test_get_status_times_out_without_retransmission(self):
+        # GIVEN
+        server = Server('127.0.0.1', self.port)
+
+        # WHEN/THEN
+        self.assertRaises(PyQ3SLTimeoutError, server.get_status, timeout=0.2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import asyncio
+import time
+import unittest
+from typing import List
+
+from helpers import UDPServer
+from pyq3serverlist import Emulator, Server, MedalOfHonorServer, StatusScanner, PyQ3SLError, PyQ3SLTimeoutError
+
+
+class StatusScannerTest(unittest.TestCase):
+    servers: List[UDPServer]
+
+    def setUp(self):
+        self.servers = []
+
+    def tearDown(self):
+        for server in self.servers:
+            server.close()
+
+    def responder(self, *replies: bytes) -> int:
+        server = UDPServer.replying(*replies)
+        self.servers.append(server)
+        return server.port
+
+    def test_scan(self):
+        # GIVEN
+        port = self.responder(b'\xff\xff\xff\xffstatusResponse\n\\sv_hostname\\^1Test\n0 12 "^2Player"\n')
+        moh_port = self.responder(b'\xff\xff\xff\xff\x01statusResponse\n\\sv_hostname\\MoH\n12 "Player"\n')
+        # Bind (but never answer on) a socket for the dead server, so we know nobody else is using the port
+        dead_port = self.responder()
+        scanner = StatusScanner(timeout=0.2)
+
+        # WHEN
+        actual = {(server.ip, server.port): result for server, result in scanner.scan([
+            Server('127.0.0.1', port),
+            MedalOfHonorServer('127.0.0.1', moh_port),
+            Server('127.0.0.1', dead_port)
+        ])}
+
+        # THEN
+        self.assertEqual(3, len(actual))
+        self.assertDictEqual({
+            'ip': '127.0.0.1',
+            'port': port,
+            'sv_hostname': 'Test',
+            'players': [{'frags': 0, 'ping': 12, 'name': 'Player'}]
+        }, actual[('127.0.0.1', port)])
+        self.assertDictEqual({
+            'ip': '127.0.0.1',
+            'port': moh_port,
+            'sv_hostname': 'MoH',
+            'players': [{'ping': 12, 'name': 'Player'}]
+        }, actual[('127.0.0.1', moh_port)])
+        self.assertIsInstance(actual[('127.0.0.1', dead_port)], PyQ3SLTimeoutError)
+
+    def test_scan_many(self):
+        # GIVEN
+        async def run():
+            async with Emulator(servers=300, variables=60, min_players=16, max_players=32) as emulator:
+                servers = emulator.get_servers()
+                # Scanner is blocking, so run it in a thread while the event loop serves the emulated servers
+                return await asyncio.get_running_loop().run_in_executor(
+                    None,
+                    lambda: list(StatusScanner(timeout=2.0).scan(servers))
+                )
+
+        # WHEN
+        actual = asyncio.run(run())
+
+        # THEN
+        self.assertEqual(300, len(actual))
+        # Replies must not be dropped because the receive buffer overflows
+        self.assertListEqual([], [(server, result) for server, result in actual if isinstance(result, PyQ3SLError)])
+
+    def test_scan_duplicates(self):
+        # GIVEN
+        port = self.responder(b'\xff\xff\xff\xffstatusResponse\n\\sv_hostname\\Test\n')
+        servers = [Server('127.0.0.1', port), Server('127.0.0.1', port), Server('127.0.0.1', port)]
+        scanner = StatusScanner(timeout=0.2)
+
+        # WHEN
+        actual = list(scanner.scan(servers))
+
+        # THEN
+        self.assertEqual(3, len(actual))
+        for server, result in actual:
+            self.assertDictEqual({'ip': '127.0.0.1', 'port': port, 'sv_hostname': 'Test', 'players': []}, result)
+
+    def test_scan_unresponsive(self):
+        # GIVEN
+        servers = [Server('127.0.0.1', self.responder()) for _ in range(10)]
+        scanner = StatusScanner(timeout=1.0, max_in_flight=2)
+
+        # WHEN
+        started = time.monotonic()
+        actual = list(scanner.scan(servers))
+        elapsed = time.monotonic() - started
+
+        # THEN
+        self.assertEqual(10, len(actual))
+        self.assertTrue(all(isinstance(result, PyQ3SLTimeoutError) for _, result in actual))
+        # Unanswered queries stop counting against max_in_flight after the reply window, not after the timeout
+        self.assertLess(elapsed, 4.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
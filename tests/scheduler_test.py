@@ -0,0 +1,126 @@
+import asyncio
+import random
+import unittest
+from typing import Dict
+
+from pyq3serverlist import Server, StatusScheduler, PyQ3SLError, PyQ3SLTimeoutError
+from pyq3serverlist.scheduler import ServerSchedule
+
+
+class StubServer(Server):
+    """
+    Answers every status query with the same result without querying the server.
+    """
+    def __init__(self, ip: str, port: int, result: dict = None):
+        super().__init__(ip, port)
+        self.result = result
+
+    async def get_status_async(self, strip_colors: bool = True, timeout: float = 1.0, **kwargs) -> dict:
+        if self.result is None:
+            raise PyQ3SLTimeoutError('Timed out while receiving server data')
+        return self.result
+
+
+class StatusSchedulerTest(unittest.TestCase):
+    def test_next_interval(self):
+        # GIVEN
+        scheduler = StatusScheduler(min_interval=5.0, populated_max_interval=30.0, max_interval=300.0, jitter=0.0)
+        populated = ServerSchedule(Server('127.0.0.1', 27960), 0.0)
+        empty = ServerSchedule(Server('127.0.0.2', 27960), 0.0)
+        dead = ServerSchedule(Server('127.0.0.3', 27960), 0.0)
+        status = {'mapname': 'q3dm17', 'players': [{'name': 'Player'}]}
+
+        def poll(schedule: ServerSchedule, result) -> float:
+            schedule.interval = scheduler.next_interval(schedule, result)
+            return schedule.interval
+
+        # WHEN/THEN
+        self.assertListEqual([5.0, 10.0, 20.0, 30.0, 30.0], [poll(populated, status) for _ in range(5)])
+        self.assertEqual(5.0, poll(populated, {'mapname': 'q3dm6', 'players': []}))
+        self.assertListEqual([5.0, 10.0, 20.0], [poll(empty, {'mapname': 'q3dm17', 'players': []}) for _ in range(3)])
+        timeout = PyQ3SLTimeoutError('Timed out')
+        self.assertListEqual([10.0, 20.0, 40.0], [poll(dead, timeout) for _ in range(3)])
+
+    def test_next_interval_after_many_failures(self):
+        # GIVEN
+        scheduler = StatusScheduler(min_interval=5.0, max_backoff=3600.0, jitter=0.0)
+        schedule = ServerSchedule(Server('127.0.0.1', 27960), 0.0)
+        schedule.failures = 2000
+
+        # WHEN
+        actual = scheduler.next_interval(schedule, PyQ3SLTimeoutError('Timed out'))
+
+        # THEN
+        self.assertEqual(3600.0, actual)
+        self.assertEqual(2001, schedule.failures)
+
+    def test_query_reschedules_after_unexpected_error(self):
+        # GIVEN
+        class BrokenServer(Server):
+            async def get_status_async(self, strip_colors: bool = True, timeout: float = 1.0, **kwargs) -> dict:
+                raise RuntimeError('Unexpected')
+
+        server = BrokenServer('127.0.0.1', 27960)
+        scheduler = StatusScheduler([server], jitter=0.0)
+        schedule = scheduler.schedules[server]
+        scheduler.heap.clear()
+
+        # WHEN/THEN
+        self.assertRaises(RuntimeError, asyncio.run, scheduler.query(schedule))
+        self.assertEqual(1, schedule.failures)
+        self.assertIs(schedule, scheduler.next_due())
+
+    def test_next_interval_with_jitter(self):
+        # GIVEN
+        scheduler = StatusScheduler(min_interval=10.0, jitter=0.1, rng=random.Random(1))
+        schedule = ServerSchedule(Server('127.0.0.1', 27960), 0.0)
+
+        # WHEN
+        actual = scheduler.next_interval(schedule, {'players': []})
+
+        # THEN
+        self.assertTrue(9.0 <= actual <= 11.0)
+
+    def test_iter(self):
+        # GIVEN
+        servers = [StubServer('127.0.0.1', 27960, {'players': []}), StubServer('127.0.0.2', 27960)]
+        scheduler = StatusScheduler(servers, min_interval=0.01, max_qps=1000.0)
+
+        async def collect(n: int) -> Dict[Server, list]:
+            results: Dict[Server, list] = {}
+            async for server, result in scheduler:
+                results.setdefault(server, []).append(result)
+                if sum(len(r) for r in results.values()) == n:
+                    break
+            return results
+
+        # WHEN
+        actual = asyncio.run(collect(6))
+
+        # THEN
+        self.assertGreater(len(actual[servers[0]]), 0)
+        self.assertTrue(all(result == {'players': []} for result in actual[servers[0]]))
+        self.assertTrue(all(isinstance(result, PyQ3SLError) for result in actual[servers[1]]))
+
+    def test_add_while_iterating(self):
+        # GIVEN
+        first = StubServer('127.0.0.1', 27960, {'players': []})
+        added = StubServer('127.0.0.2', 27960, {'players': []})
+        scheduler = StatusScheduler([first], min_interval=5.0, max_qps=1000.0)
+
+        async def collect() -> Server:
+            async for server, _ in scheduler:
+                if server is first:
+                    scheduler.add(added)
+                else:
+                    return server
+
+        # WHEN
+        actual = asyncio.run(asyncio.wait_for(collect(), 1.0))
+
+        # THEN
+        self.assertIs(added, actual)
+
+
+if __name__ == '__main__':
+    unittest.main()
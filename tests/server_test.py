@@ -1,8 +1,10 @@
+import asyncio
 import unittest
 from dataclasses import dataclass
 from typing import List, Optional
 
-from pyq3serverlist import PyQ3SLError, Server, MedalOfHonorServer
+from helpers import UDPServer
+from pyq3serverlist import PyQ3SLError, PyQ3SLTimeoutError, Server, MedalOfHonorServer, Status
 from pyq3serverlist.buffer import Buffer
 
 
@@ -273,6 +275,50 @@ class ServerTest(unittest.TestCase):
                     ]
                 }
             ),
+            ParseResponseTestCase(
+                name='parses response packet with linebreaks in fs_manifest',
+                data=b'\xff\xff\xff\xffstatusResponse\n'
+                     b'\\fs_manifest\\pak0.pk3\n pak1.pk3\\sv_hostname\\^1Test\n'
+                     b'3 45 "^2Player"\n',
+                expected={
+                    'ip': '127.0.0.1',
+                    'port': 27960,
+                    'fs_manifest': 'pak0.pk3\n pak1.pk3',
+                    'sv_hostname': 'Test',
+                    'players': [
+                        {'frags': 3, 'ping': 45, 'name': 'Player'}
+                    ]
+                }
+            ),
+            ParseResponseTestCase(
+                name='ignores trailing bytes after player lines',
+                data=b'\xff\xff\xff\xffstatusResponse\n\\key\\value\n0 1 "abc"\n\x00',
+                expected={
+                    'ip': '127.0.0.1',
+                    'port': 27960,
+                    'key': 'value',
+                    'players': [
+                        {'frags': 0, 'ping': 1, 'name': 'abc'}
+                    ]
+                }
+            ),
+            ParseResponseTestCase(
+                name='ignores trailing lines too short to be a player line',
+                data=b'\xff\xff\xff\xffstatusResponse\n\\key\\value\n0 0 ""\n1 2\n',
+                expected={
+                    'ip': '127.0.0.1',
+                    'port': 27960,
+                    'key': 'value',
+                    'players': [
+                        {'frags': 0, 'ping': 0, 'name': ''}
+                    ]
+                }
+            ),
+            ParseResponseTestCase(
+                name='errors for invalid player line',
+                data=b'\xff\xff\xff\xffstatusResponse\n\\key\\value\nabc 45 "Player"\n',
+                wantErrContains='Server returned invalid player data'
+            ),
             ParseResponseTestCase(
                 name='errors for incomplete header',
                 data=b'\xff\xff\xff\xff',
@@ -321,6 +367,195 @@ class ServerTest(unittest.TestCase):
                 # THEN
                 self.assertDictEqual(t.expected, actual)
 
+                # WHEN
+                lazy = server.parse_response(Buffer(t.data), t.strip_colors, lazy=True)
+
+                # THEN
+                self.assertIsInstance(lazy, Status)
+                self.assertEqual(t.expected, lazy)
+
+    def test_parse_response_selective(self):
+        @dataclass
+        class ParseResponseSelectiveTestCase:
+            name: str
+            fields: Optional[List[str]]
+            players: str
+            expected: dict
+
+        data = b'\xff\xff\xff\xffstatusResponse\n\\sv_hostname\\^1Test\\mapname\\q3dm17\\g_gametype\\0\n' \
+               b'3 45 "^2Player"\n' \
+               b'0 12 "Other"\n' \
+               b'\x00'
+
+        tests: List[ParseResponseSelectiveTestCase] = [
+            ParseResponseSelectiveTestCase(
+                name='parses selected fields and counts players',
+                fields=['sv_hostname', 'mapname', 'sv_maxclients'],
+                players='count',
+                expected={'ip': '127.0.0.1', 'port': 27960, 'sv_hostname': 'Test', 'mapname': 'q3dm17', 'num_players': 2}
+            ),
+            ParseResponseSelectiveTestCase(
+                name='parses all fields and skips players',
+                fields=None,
+                players='none',
+                expected={'ip': '127.0.0.1', 'port': 27960, 'sv_hostname': 'Test', 'mapname': 'q3dm17', 'g_gametype': '0'}
+            ),
+            ParseResponseSelectiveTestCase(
+                name='parses selected fields and all players',
+                fields=['g_gametype'],
+                players='full',
+                expected={
+                    'ip': '127.0.0.1',
+                    'port': 27960,
+                    'g_gametype': '0',
+                    'players': [
+                        {'frags': 3, 'ping': 45, 'name': 'Player'},
+                        {'frags': 0, 'ping': 12, 'name': 'Other'}
+                    ]
+                }
+            )
+        ]
+
+        for t in tests:
+            # GIVEN
+            server = Server('127.0.0.1', 27960)
+
+            # WHEN
+            actual = server.parse_response(Buffer(data), True, fields=t.fields, players=t.players)
+
+            # THEN
+            self.assertDictEqual(t.expected, actual)
+
+    def test_get_status_invalid_players_mode(self):
+        # GIVEN
+        # Nothing listens on port 9 (discard), the mode must be rejected before querying the server anyway
+        server = Server('127.0.0.1', 9)
+
+        # WHEN/THEN
+        self.assertRaises(ValueError, server.get_status, players='all')
+        self.assertRaises(ValueError, asyncio.run, server.get_status_async(players='all'))
+        self.assertRaises(ValueError, server.parse_response, Buffer(b''), True, players='all')
+
+    def test_parse_info_response(self):
+        @dataclass
+        class ParseInfoResponseTestCase:
+            name: str
+            data: bytes
+            strip_colors: bool = True
+            expected: Optional[dict] = None
+            wantErrContains: Optional[str] = None
+
+        tests: List[ParseInfoResponseTestCase] = [
+            ParseInfoResponseTestCase(
+                name='parses info response packet',
+                data=b'\xff\xff\xff\xffinfoResponse\n\\challenge\\xxx\\clients\\3\\sv_maxclients\\16'
+                     b'\\mapname\\q3dm17\\hostname\\^1Test',
+                expected={
+                    'ip': '127.0.0.1',
+                    'port': 27960,
+                    'challenge': 'xxx',
+                    'clients': '3',
+                    'sv_maxclients': '16',
+                    'mapname': 'q3dm17',
+                    'hostname': 'Test'
+                }
+            ),
+            ParseInfoResponseTestCase(
+                name='parses info response packet with trailing linebreak without stripping colors',
+                data=b'\xff\xff\xff\xffinfoResponse\n\\clients\\0\\hostname\\^1Test\n',
+                strip_colors=False,
+                expected={
+                    'ip': '127.0.0.1',
+                    'port': 27960,
+                    'clients': '0',
+                    'hostname': '^1Test'
+                }
+            ),
+            ParseInfoResponseTestCase(
+                name='errors for status response header',
+                data=b'\xff\xff\xff\xffstatusResponse\n\\clients\\0\n',
+                wantErrContains='Server returned invalid packet header'
+            ),
+            ParseInfoResponseTestCase(
+                name='errors for body containing uneven number of backslashes',
+                data=b'\xff\xff\xff\xffinfoResponse\n\\clients\\0\\hostname',
+                wantErrContains='Server returned invalid packet body'
+            )
+        ]
+
+        for t in tests:
+            # GIVEN
+            server = Server('127.0.0.1', 27960)
+            buffer = Buffer(t.data)
+
+            if t.wantErrContains is not None:
+                # WHEN/THEN
+                self.assertRaisesRegex(
+                    PyQ3SLError,
+                    t.wantErrContains,
+                    server.parse_info_response,
+                    buffer,
+                    t.strip_colors
+                )
+            else:
+                # WHEN
+                actual = server.parse_info_response(buffer, t.strip_colors)
+
+                # THEN
+                self.assertDictEqual(t.expected, actual)
+
+    def test_hash(self):
+        # GIVEN
+        servers = [Server('127.0.0.1', 27960), Server('127.0.0.1', 27960), Server('127.0.0.1', 27961)]
+
+        # WHEN
+        actual = set(servers)
+
+        # THEN
+        self.assertSetEqual({Server('127.0.0.1', 27960), Server('127.0.0.1', 27961)}, actual)
+
+    def test_key(self):
+        # GIVEN
+        server = Server('127.0.0.1', 27960)
+
+        # WHEN
+        key = server.key
+
+        # THEN
+        self.assertEqual(0x7f0000016d38, key)
+        self.assertEqual(server, Server.from_key(key))
+        self.assertRaisesRegex(PyQ3SLError, 'Cannot build key', getattr, Server('example.com', 27960), 'key')
+
+    def test_get_status_async(self):
+        # GIVEN
+        responder = UDPServer.replying(b'\xff\xff\xff\xffstatusResponse\n\\sv_hostname\\^1Test\n0 12 "^2Player"\n')
+        server = Server('127.0.0.1', responder.port)
+
+        try:
+            # WHEN
+            actual = asyncio.run(server.get_status_async())
+        finally:
+            responder.close()
+
+        # THEN
+        self.assertDictEqual({
+            'ip': '127.0.0.1',
+            'port': responder.port,
+            'sv_hostname': 'Test',
+            'players': [{'frags': 0, 'ping': 12, 'name': 'Player'}]
+        }, actual)
+
+    def test_get_status_async_timeout(self):
+        # GIVEN
+        responder = UDPServer.replying()
+        server = Server('127.0.0.1', responder.port)
+
+        try:
+            # WHEN/THEN
+            self.assertRaises(PyQ3SLTimeoutError, asyncio.run, server.get_status_async(timeout=0.1))
+        finally:
+            responder.close()
+
 
 class MedalOfHonorServerTest(unittest.TestCase):
     def test_parse_response(self):
@@ -490,6 +725,18 @@ class MedalOfHonorServerTest(unittest.TestCase):
                     ]
                 }
             ),
+            ParseResponseTestCase(
+                name='parses shortest player line and ignores trailing bytes',
+                data=b'\xff\xff\xff\xff\x01statusResponse\n\\key\\value\n0 ""\n\x00',
+                expected={
+                    'ip': '127.0.0.1',
+                    'port': 12203,
+                    'key': 'value',
+                    'players': [
+                        {'ping': 0, 'name': ''}
+                    ]
+                }
+            ),
             ParseResponseTestCase(
                 name='errors for incomplete header',
                 data=b'\xff\xff\xff\xff\x01',
@@ -523,6 +770,13 @@ class MedalOfHonorServerTest(unittest.TestCase):
                 # THEN
                 self.assertDictEqual(t.expected, actual)
 
+                # WHEN
+                lazy = server.parse_response(Buffer(t.data), t.strip_colors, lazy=True)
+
+                # THEN
+                self.assertIsInstance(lazy, Status)
+                self.assertEqual(t.expected, lazy)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+from array import array
+
+from pyq3serverlist import Server, MedalOfHonorServer, ServerList
+
+
+class ServerListTest(unittest.TestCase):
+    def setUp(self):
+        self.servers = ServerList(array('I', [0x7f000001, 0x7f000002, 0x0a000001]), array('H', [27960, 27961, 27962]))
+
+    def test_len(self):
+        self.assertEqual(3, len(self.servers))
+
+    def test_getitem(self):
+        self.assertEqual(Server('127.0.0.1', 27960), self.servers[0])
+        self.assertEqual(Server('10.0.0.1', 27962), self.servers[-1])
+        self.assertRaises(IndexError, self.servers.__getitem__, 3)
+
+    def test_getitem_slice(self):
+        actual = self.servers[1:]
+
+        self.assertIsInstance(actual, ServerList)
+        self.assertListEqual([Server('127.0.0.2', 27961), Server('10.0.0.1', 27962)], list(actual))
+
+    def test_iter(self):
+        self.assertListEqual(
+            [Server('127.0.0.1', 27960), Server('127.0.0.2', 27961), Server('10.0.0.1', 27962)],
+            list(self.servers)
+        )
+
+    def test_contains(self):
+        self.assertIn(Server('127.0.0.2', 27961), self.servers)
+        self.assertNotIn(Server('127.0.0.2', 27960), self.servers)
+        self.assertNotIn(Server('example.com', 27960), self.servers)
+        self.assertNotIn(MedalOfHonorServer('127.0.0.1', 27960), self.servers)
+
+    def test_append(self):
+        self.servers.append(0x7f000003, 27963)
+
+        self.assertIn(Server('127.0.0.3', 27963), self.servers)
+        self.assertEqual(Server('127.0.0.3', 27963), self.servers[3])
+
+
+if __name__ == '__main__':
+    unittest.main()
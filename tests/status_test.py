@@ -0,0 +1,45 @@
+import unittest
+
+from pyq3serverlist import Status
+
+
+class StatusTest(unittest.TestCase):
+    def test_getitem(self):
+        # GIVEN
+        status = Status({'sv_hostname': '^1Red ^7Server', 'sv_maxclients': '20', 'mapname': 'q3dm17', 'port': 27960})
+
+        # WHEN/THEN
+        self.assertEqual('Red Server', status['sv_hostname'])
+        self.assertEqual('20', status['sv_maxclients'])
+        self.assertEqual(27960, status['port'])
+        self.assertDictEqual({'sv_hostname': 'Red Server', 'sv_maxclients': '20'}, status.stripped_values)
+
+    def test_getitem_without_strip_colors(self):
+        # GIVEN
+        status = Status({'sv_hostname': '^1Red ^7Server'}, strip_colors=False)
+
+        # WHEN/THEN
+        self.assertEqual('^1Red ^7Server', status['sv_hostname'])
+        self.assertEqual('Red Server', status.stripped('sv_hostname'))
+
+    def test_raw(self):
+        # GIVEN
+        status = Status({'sv_hostname': '^1Red ^7Server'})
+
+        # WHEN/THEN
+        self.assertEqual('^1Red ^7Server', status.raw('sv_hostname'))
+        self.assertDictEqual({}, status.stripped_values)
+
+    def test_to_dict(self):
+        # GIVEN
+        status = Status({'sv_hostname': '^1Red', 'players': [Status({'ping': 12, 'name': '^2Player'})]})
+
+        # WHEN
+        actual = status.to_dict()
+
+        # THEN
+        self.assertDictEqual({'sv_hostname': 'Red', 'players': [{'ping': 12, 'name': 'Player'}]}, actual)
+
+
+if __name__ == '__main__':
+    unittest.main()
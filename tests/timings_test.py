@@ -0,0 +1,64 @@
+import asyncio
+import unittest
+
+from helpers import STATUS_RESPONSE, UDPServer
+from pyq3serverlist import PrincipalServer, Server, Timings
+
+
+class TimingsTest(unittest.TestCase):
+    def setUp(self):
+        self.server = UDPServer(lambda data: [
+            b'\xff\xff\xff\xffgetserversResponse\\\x7f\x00\x00\x01\x6d\x38\\EOT\x00\x00\x00'
+            if b'getservers' in data else STATUS_RESPONSE
+        ])
+        self.port = self.server.port
+
+    def tearDown(self):
+        self.server.close()
+
+    def test_get_status(self):
+        # GIVEN
+        server = Server('127.0.0.1', self.port)
+        timings = Timings()
+
+        # WHEN
+        server.get_status(timings=timings)
+
+        # THEN
+        self.assertEqual(1, timings.packets)
+        for key, value in timings:
+            self.assertIsNotNone(value, key)
+        self.assertLessEqual(timings.first_byte, timings.last_packet)
+
+    def test_get_status_async(self):
+        # GIVEN
+        server = Server('127.0.0.1', self.port)
+        timings = Timings()
+
+        # WHEN
+        asyncio.run(server.get_status_async(timings=timings))
+
+        # THEN
+        self.assertEqual(1, timings.packets)
+        for key, value in timings:
+            self.assertIsNotNone(value, key)
+
+    def test_get_servers(self):
+        # GIVEN
+        principal = PrincipalServer('127.0.0.1', self.port)
+        timings = Timings()
+
+        # WHEN
+        servers = principal.get_servers(68, timings=timings)
+
+        # THEN
+        self.assertEqual([Server('127.0.0.1', 27960)], servers)
+        self.assertEqual(1, timings.packets)
+        self.assertIsNotNone(timings.first_byte)
+        self.assertIsNotNone(timings.parse)
+        # Timings must not be recorded for later queries using the same connection
+        self.assertIsNone(principal.connection.timings)
+
+
+if __name__ == '__main__':
+    unittest.main()